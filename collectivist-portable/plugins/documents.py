@@ -448,8 +448,8 @@ Generate a JSON response with:
 1. "description": A single-sentence description (max 150 characters) that captures the document's core purpose and content. Be concise and technical.
 2. "category": ONE category from the list above that best matches this document.
 
-Example format:
-{"description": "Comprehensive business plan outlining market strategy and financial projections for startup launch", "category": "business_docs"}
+Respond with exactly one JSON object of this shape and nothing else:
+{{"description": "Comprehensive business plan outlining market strategy and financial projections for startup launch", "category": "business_docs"}}
 
 JSON Response:"""
 
@@ -189,7 +189,7 @@ Generate a JSON response with:
 1. "description": A single-sentence description (max 150 characters) that captures the item's purpose or content. Be concise and descriptive.
 2. "category": ONE category from the list above that best matches this item.
 
-Example format:
+Respond with exactly one JSON object of this shape and nothing else:
 {{"description": "Configuration file for application settings and preferences", "category": "configuration"}}
 
 JSON Response:"""
@@ -134,8 +134,8 @@ Generate a JSON response with:
 1. "description": A single-sentence description (max 150 characters) that captures the item's core purpose.
 2. "category": ONE category from the list above that best matches this item.
 
-Example format:
-{"description": "Example description for PLUGIN_NAME item", "category": "category1"}
+Respond with exactly one JSON object of this shape and nothing else:
+{{"description": "Example description for PLUGIN_NAME item", "category": "category1"}}
 
 JSON Response:"""
 
@@ -160,7 +160,7 @@ JSON Response:"""
             # For text files:
             # if item_path.suffix in ['.txt', '.md']:
             #     with open(item_path, 'r', encoding='utf-8', errors='ignore') as f:
-            #         return f.read()[:3000]
+            #         return f.read(3000)
 
             # For binary files, return descriptive text:
             # return f"PLUGIN_NAME file: {item_path.stem}"
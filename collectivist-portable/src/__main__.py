@@ -16,6 +16,7 @@ The CLI operates on the current working directory as the collection path.
 
 import sys
 import argparse
+import logging
 from pathlib import Path
 from typing import Optional
 
@@ -25,29 +26,21 @@ if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
 # Import pipeline components
-from pipeline import run_full_pipeline, load_collection_config, get_workflow_config_from_collection
-from analyzer import CollectionAnalyzer
-from describer import CollectionDescriber
+from pipeline import run_full_pipeline, load_collection_config, get_workflow_config_from_collection, load_plugins
+from analyzer import CollectionAnalyzer, find_collection_config
+from describer import CollectionDescriber, batch_size_arg, max_workers_arg
 from readme_generator import generate_collection
 from llm import create_client_from_config, test_llm_connection
 from plugin_interface import PluginRegistry
 from events import create_console_emitter
+from metrics import start_exporter
 
 # Import plugins to trigger registration
 import repository_scanner  # noqa: F401
 import fallback_scanner  # noqa: F401
 
 # Import additional plugins from plugins directory
-plugins_path = current_dir.parent / 'plugins'
-if plugins_path.exists():
-    sys.path.insert(0, str(plugins_path))
-    try:
-        import media  # noqa: F401
-        import documents  # noqa: F401
-        import obsidian  # noqa: F401
-        import fallback as fallback_plugin  # noqa: F401
-    except ImportError:
-        pass  # Plugins not available
+load_plugins()
 
 
 def get_collection_path() -> Path:
@@ -61,6 +54,13 @@ def cmd_analyze(args):
     
     print(f"Analyzing collection: {collection_path}")
     print()
+
+    # Re-running analyze keeps the existing schema (no LLM needed) unless asked to redo it
+    existing_config = None if args.force_type or args.refresh else find_collection_config(collection_path)
+    if existing_config:
+        print(f"[OK] Collection already analyzed: {existing_config}")
+        print("  Use --refresh to detect the collection type again")
+        return True
     
     try:
         # Create LLM client
@@ -80,7 +80,8 @@ def cmd_analyze(args):
         # Analyze and create collection.yaml
         config_path = analyzer.create_collection(
             collection_path, 
-            force_type=args.force_type
+            force_type=args.force_type,
+            refresh=True
         )
         
         print(f"\n[OK] Analysis complete: {config_path}")
@@ -135,7 +136,8 @@ def cmd_describe(args):
             skip_scan=True,
             skip_readme=True,
             skip_process_new=True,
-            max_workers=args.max_workers
+            max_workers=args.max_workers,
+            batch_size=args.batch_size
         )
         return True
         
@@ -200,6 +202,7 @@ def cmd_update(args):
             skip_process_new=args.skip_process_new,
             force_type=args.force_type,
             max_workers=args.max_workers,
+            batch_size=args.batch_size,
             auto_file=workflow_config.get('auto_file', False),
             confidence_threshold=workflow_config.get('confidence_threshold', 0.7),
             workflow_mode=workflow_config.get('mode', 'manual')
@@ -229,7 +232,9 @@ Examples:
   python .collection/src/__main__.py update               # Run full pipeline
   
   python .collection/src/__main__.py analyze --force-type repositories
+  python .collection/src/__main__.py analyze --refresh
   python .collection/src/__main__.py describe --max-workers 10
+  python .collection/src/__main__.py describe --batch-size 4
   python .collection/src/__main__.py update --skip-analyze --skip-scan
         """
     )
@@ -240,6 +245,11 @@ Examples:
         action='store_true',
         help='Enable verbose output and error tracebacks'
     )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='Serve Prometheus metrics on this port while the command runs'
+    )
     
     # Subcommands
     subparsers = parser.add_subparsers(
@@ -258,6 +268,11 @@ Examples:
         type=str,
         help='Force collection type (e.g., repositories, media, documents)'
     )
+    analyze_parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Re-detect the collection type even if collection.yaml already exists'
+    )
     
     # scan command
     scan_parser = subparsers.add_parser(
@@ -272,9 +287,14 @@ Examples:
     )
     describe_parser.add_argument(
         '--max-workers',
-        type=int,
-        default=5,
-        help='Number of concurrent workers for LLM requests (default: 5)'
+        type=max_workers_arg,
+        default='auto',
+        help='Number of concurrent workers for LLM requests, or "auto" to match the LLM endpoint (default: auto)'
+    )
+    describe_parser.add_argument(
+        '--batch-size',
+        type=batch_size_arg,
+        help='Items described per LLM request (default: llm.items_per_request in collection.yaml, else 1)'
     )
     
     # render command
@@ -320,9 +340,14 @@ Examples:
     )
     update_parser.add_argument(
         '--max-workers',
-        type=int,
-        default=5,
-        help='Number of concurrent workers for LLM requests (default: 5)'
+        type=max_workers_arg,
+        default='auto',
+        help='Number of concurrent workers for LLM requests, or "auto" to match the LLM endpoint (default: auto)'
+    )
+    update_parser.add_argument(
+        '--batch-size',
+        type=batch_size_arg,
+        help='Items described per LLM request (default: llm.items_per_request in collection.yaml, else 1)'
     )
     
     # Parse arguments
@@ -346,6 +371,16 @@ Examples:
     if not handler:
         print(f"Unknown command: {args.command}")
         return 1
+
+    # Library modules report details through logging; show them on --verbose
+    if args.verbose:
+        log_handler = logging.StreamHandler(sys.stdout)
+        log_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.getLogger().addHandler(log_handler)
+        logging.getLogger("analyzer").setLevel(logging.INFO)
+
+    if args.metrics_port:
+        start_exporter(args.metrics_port)
     
     # Execute command
     try:
@@ -1,20 +1,484 @@
 #!/usr/bin/env python3
 """
 Describer Stage - LLM Description Generation
-Generates descriptions and assigns categories using ThreadPoolExecutor for concurrency
+Generates descriptions and assigns categories using batched LLM requests
 """
 
+import argparse
+import hashlib
 import json
+import sqlite3
+import string
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import yaml
-
-from llm import LLMClient, Message, test_llm_connection
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Union
+
+# Faster JSON parsing when available; falls back to the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parses str or bytes; the stdlib fallback raises the same JSONDecodeError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+from llm import LLMClient, Message, PROMPT_CACHE_PROVIDERS, test_llm_connection
+from llm_cache import ResponseCache
 from plugin_interface import CollectionScanner, CollectionItem, PluginRegistry
 from events import EventEmitter, EventStage
 
 
+class ContentCache:
+    """
+    SQLite store of scanner content by (path, modified).
+
+    Extracting content (PDF text, DOCX paragraphs, READMEs) is the main
+    non-network cost of describing; a re-run, e.g. after a crash, reads
+    unchanged files from here instead. Only the latest version of each
+    path is kept.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS contents ("
+            "path TEXT NOT NULL, modified TEXT NOT NULL, content TEXT NOT NULL, "
+            "PRIMARY KEY (path, modified))"
+        )
+        self._conn.commit()
+
+    def get(self, path: str, modified: str) -> Optional[str]:
+        """Return the content stored for this version of path, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM contents WHERE path = ? AND modified = ?", (path, modified)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, modified: str, content: str):
+        """Store content for this version of path, replacing older versions."""
+        with self._lock:
+            self._conn.execute("DELETE FROM contents WHERE path = ?", (path,))
+            self._conn.execute(
+                "INSERT INTO contents (path, modified, content) VALUES (?, ?, ?)", (path, modified, content)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class DescriptionCache:
+    """
+    Content-addressed cache of generated descriptions.
+
+    Entries are keyed by the SHA-256 of the model, sampling settings and full
+    prompt; the prompt is a pure function of the prompt template, item
+    content/metadata and few-shot examples. An in-process LRU sits in front of
+    an optional ResponseCache store (<cache_dir>/responses.sqlite) whose
+    entries never expire: a key already pins everything the result depends on.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._memory: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Opened on first use; unwritable cache locations degrade to the in-memory LRU
+        self.backend: Optional[ResponseCache] = None
+        if cache_dir:
+            self.backend = ResponseCache(Path(cache_dir) / 'responses.sqlite', ttl=None)
+
+    @staticmethod
+    def key_for(prompt: str, model: str = '', temperature: float = 0.0, max_tokens: Optional[int] = None) -> str:
+        """Return the cache key for a prompt sent with the given model and settings."""
+        return hashlib.sha256(f"{model}|{temperature}|{max_tokens}|{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the cached result for key, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        if self.backend is None:
+            return None
+
+        try:
+            stored = self.backend.get(key)
+            if stored is None:
+                return None
+            result = _json_loads(stored)
+        except (OSError, sqlite3.Error, ValueError):
+            return None
+
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: Dict[str, str]):
+        """Store a result in memory and, if configured, in the SQLite store."""
+        self._remember(key, result)
+
+        if self.backend is None:
+            return
+
+        try:
+            self.backend.set(
+                key,
+                orjson.dumps(result).decode() if ORJSON_AVAILABLE else json.dumps(result, ensure_ascii=False)
+            )
+        except (OSError, sqlite3.Error):
+            # Cache writes are best-effort; the description itself succeeded
+            pass
+
+    def _remember(self, key: str, result: Dict[str, str]):
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+
+# Cosine similarity at which a neighbour's description is reused
+DEFAULT_SEMANTIC_THRESHOLD = 0.92
+
+
+class SemanticDescriptionCache:
+    """
+    Nearest-neighbour cache for near-duplicate item content (forks, templates, series).
+
+    Content is embedded with a small SentenceTransformer and searched in a FAISS
+    inner-product index over L2-normalized vectors, i.e. by cosine similarity.
+    A neighbour at or above the threshold donates its description/category.
+    The index and its metadata sidecar persist in cache_dir.
+
+    Requires the optional faiss and sentence-transformers packages.
+    """
+
+    MODEL_NAME = "all-MiniLM-L6-v2"
+
+    def __init__(self, cache_dir: Path, threshold: float = DEFAULT_SEMANTIC_THRESHOLD):
+        if not SEMANTIC_CACHE_AVAILABLE:
+            raise ImportError("Semantic cache requires faiss and sentence-transformers")
+
+        cache_dir = Path(cache_dir)
+        self.index_path = cache_dir / 'semantic-cache.faiss'
+        self.meta_path = cache_dir / 'semantic-cache.json'
+        self.threshold = threshold
+        self._model = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self.index = None
+        self.results: List[Dict[str, str]] = []
+        if self.index_path.exists() and self.meta_path.exists():
+            try:
+                index = faiss.read_index(str(self.index_path))
+                with open(self.meta_path, 'r', encoding='utf-8') as f:
+                    results = json.load(f)
+                if index.ntotal == len(results):
+                    self.index, self.results = index, results
+            except (OSError, RuntimeError, ValueError):
+                pass  # Corrupt cache: start fresh
+
+    def embed(self, contents: List[str]):
+        """Embed contents as L2-normalized float32 vectors (model loads lazily)."""
+        if self._model is None:
+            self._model = SentenceTransformer(self.MODEL_NAME)
+        return self._model.encode(contents, normalize_embeddings=True).astype('float32')
+
+    def lookup(self, vector) -> Optional[Dict[str, str]]:
+        """Return the nearest neighbour's result if it is similar enough."""
+        with self._lock:
+            if self.index is None or self.index.ntotal == 0:
+                return None
+            scores, ids = self.index.search(vector.reshape(1, -1), 1)
+
+        if ids[0][0] >= 0 and scores[0][0] >= self.threshold:
+            return self.results[ids[0][0]]
+        return None
+
+    def add(self, vector, result: Dict[str, str]):
+        """Add an embedded item and its generated result."""
+        with self._lock:
+            if self.index is None:
+                self.index = faiss.IndexFlatIP(vector.shape[-1])
+            self.index.add(vector.reshape(1, -1))
+            self.results.append(result)
+            self._dirty = True
+
+    def save(self):
+        """Persist the index and metadata sidecar if anything was added."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                faiss.write_index(self.index, str(self.index_path))
+                with open(self.meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.results, f, ensure_ascii=False)
+                self._dirty = False
+            except OSError:
+                pass  # Best-effort, like DescriptionCache
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on concurrent LLM requests.
+
+    Each round of `limit` good completions (mean latency under target, no
+    error) raises the limit by alpha; an error or slow average multiplies it
+    by beta, at most once per round so one burst of failures counts once.
+    The limit never exceeds max_limit (an explicit --max-workers or the
+    endpoint's known capacity, when given).
+    """
+
+    alpha = 1.0            # Additive increase per round
+    beta = 0.5             # Multiplicative decrease factor
+    target_latency = 5.0   # Seconds; slower averages count as congestion
+    min_limit = 1
+    max_limit = 64
+    sample_size = 16       # Latencies averaged for the target check
+
+    def __init__(self, initial: int, max_limit: Optional[int] = None):
+        if max_limit is not None:
+            self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._latencies = deque(maxlen=self.sample_size)
+        self._since_decrease = self.limit  # The first failure may back off right away
+
+    @property
+    def limit(self) -> int:
+        """Requests currently allowed in flight."""
+        return int(self._limit)
+
+    def record(self, latency: float, ok: bool = True):
+        """Feed back one finished request."""
+        self._latencies.append(latency)
+        self._since_decrease += 1
+        mean_latency = sum(self._latencies) / len(self._latencies)
+
+        if not ok or mean_latency > self.target_latency:
+            # Requests still in flight saw the same conditions: back off once per round
+            if self._since_decrease >= self.limit:
+                self._limit = max(self.min_limit, self._limit * self.beta)
+                self._latencies.clear()
+                self._since_decrease = 0
+        else:
+            # alpha / limit per completion adds alpha per round
+            self._limit = min(self.max_limit, self._limit + self.alpha / self._limit)
+
+
+# Threads reading item content before describing (disk/extraction bound, not LLM bound)
+CONTENT_READ_WORKERS = 16
+
+# Concurrent LLM requests when neither collection.yaml nor the server says otherwise
+DEFAULT_MAX_WORKERS = 5
+
+
+def max_workers_arg(value: str) -> Union[int, str]:
+    """argparse type for --max-workers: a positive integer or 'auto'."""
+    if value == 'auto':
+        return value
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer or 'auto', got {value!r}")
+    return workers
+
+
+def batch_size_arg(value: str) -> int:
+    """argparse type for --batch-size: a positive integer."""
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return size
+
+
+def resolve_max_workers(
+    max_workers: Union[int, str],
+    llm_client: LLMClient,
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[int, Optional[int]]:
+    """
+    Resolve max_workers='auto' against the endpoint's capacity.
+
+    Uses the smaller of llm.concurrency from collection.yaml and the parallel
+    slots the server reports (llama.cpp /props) as both the starting worker
+    count and the ceiling. When neither is known, starts at
+    DEFAULT_MAX_WORKERS with no ceiling, so adaptive concurrency can grow
+    up to AdaptiveConcurrency.max_limit. An explicit integer is both.
+
+    Returns:
+        (initial workers, concurrency ceiling or None for the default)
+    """
+    if max_workers != 'auto':
+        return int(max_workers), int(max_workers)
+
+    configured = ((config or {}).get('llm') or {}).get('concurrency')
+    probed = llm_client.probe_concurrency() if hasattr(llm_client, 'probe_concurrency') else None
+
+    limits = [int(limit) for limit in (configured, probed) if limit]
+    if limits:
+        return min(limits), min(limits)
+    return DEFAULT_MAX_WORKERS, None
+
+
+def items_per_request_from_config(config: Optional[Dict[str, Any]]) -> int:
+    """Items per description request from llm.items_per_request in collection.yaml (default 1)."""
+    value = ((config or {}).get('llm') or {}).get('items_per_request', 1)
+    return value if isinstance(value, int) and value > 0 else 1
+
+
+def semantic_threshold_from_config(config: Optional[Dict[str, Any]]) -> float:
+    """Semantic cache similarity from llm.semantic_cache_threshold in collection.yaml (0-1]."""
+    value = ((config or {}).get('llm') or {}).get('semantic_cache_threshold', DEFAULT_SEMANTIC_THRESHOLD)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value <= 1:
+        return DEFAULT_SEMANTIC_THRESHOLD
+    return float(value)
+
+
+class SafeDict(dict):
+    """Template values for str.format_map(): missing fields format as ''."""
+
+    def __missing__(self, key: str) -> str:
+        return ''
+
+
+def compile_prompt_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Pre-parse a str.format prompt template into (literal, field_name) pairs.
+
+    Rendering then just joins literals and values, without running the format
+    parser for every item. Returns None for templates that use conversions,
+    format specs or attribute/index lookups; those keep using str.format.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion or (field is not None and not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def split_prompt_template(
+    parts: Optional[Tuple[Tuple[str, Optional[str]], ...]]
+) -> Optional[Tuple[str, Tuple[Tuple[str, Optional[str]], ...], str]]:
+    """
+    Split compiled template parts into (header, item_parts, footer).
+
+    The header is the literal text before the first field and the footer the
+    literal text after the last one; item_parts covers everything in between
+    and is rendered once per item of a multi-item prompt. Returns None for
+    templates without fields.
+    """
+    if not parts:
+        return None
+
+    field_positions = [i for i, (_, field) in enumerate(parts) if field is not None]
+    if not field_positions:
+        return None
+
+    first, last = field_positions[0], field_positions[-1]
+    header = parts[first][0]
+    item_parts = (('', parts[first][1]),) + tuple(parts[first + 1:last + 1])
+    footer = ''.join(literal for literal, _ in parts[last + 1:])
+    return header, item_parts, footer
+
+
+def _obsidian_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Obsidian-specific template fields."""
+    return {
+        'metadata_tags': ', '.join(metadata.get('tags', [])),
+        'has_frontmatter': metadata.get('has_frontmatter', False),
+        'link_count': len(metadata.get('links', [])),
+    }
+
+
+def _documents_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Documents-specific template fields."""
+    doc_metadata = metadata.get('document_metadata', {})
+    return {
+        'page_count': doc_metadata.get('page_count', 0),
+        'author': doc_metadata.get('author', ''),
+        'title': doc_metadata.get('title', ''),
+    }
+
+
+def _repositories_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Repository-specific template fields."""
+    return {
+        'git_status': metadata.get('git_status', ''),
+        'remote_url': metadata.get('remote_url', ''),
+        'branch': metadata.get('branch', ''),
+    }
+
+
+def _no_extra_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Scanners without extra template fields."""
+    return {}
+
+
+# Extra prompt template fields by scanner name (get_name())
+SCANNER_TEMPLATE_FIELDS = {
+    'obsidian': _obsidian_fields,
+    'documents': _documents_fields,
+    'repositories': _repositories_fields,
+}
+
+
+# Appended to multi-item prompts, replacing the template's one-object answer format
+MULTI_ITEM_INSTRUCTIONS = (
+    "\n\nThe request above covers {count} items (ITEM 1 to ITEM {count}). Apply the "
+    "instructions to each item and respond with exactly one JSON object of the form "
+    '{{"items": [{{"description": "...", "category": "..."}}, ...]}} '
+    "holding one entry per item, in item order, and nothing else."
+)
+
+# Output budget for one {"description", "category"} answer (~40-60 tokens)
+DESCRIPTION_ANSWER_TOKENS = 96
+# Reasoning models (gpt-oss) spend output tokens thinking before they answer
+REASONING_TOKENS = 512
+DESCRIPTION_MAX_TOKENS = REASONING_TOKENS + DESCRIPTION_ANSWER_TOKENS
+# Greedy decoding: deterministic replies, so cached results are exact
+DESCRIPTION_TEMPERATURE = 0.0
+
+
+@dataclass
+class DescribeContext:
+    """Per-run prompt inputs that are identical for every item"""
+    prompt_template: str
+    prompt_parts: Optional[Tuple[Tuple[str, Optional[str]], ...]]  # Compiled per-item part of the template
+    system_prompt: str  # Template instructions + few-shot examples: the fixed prefix ('' if none)
+    valid_categories: FrozenSet[str]
+    fallback_category: str  # Last scanner category (usually misc)
+    response_format: Dict[str, Any]  # JSON schema constraining the reply
+
+
 class CollectionDescriber:
     """Generates descriptions for collection items using LLM"""
 
@@ -23,43 +487,196 @@ class CollectionDescriber:
         llm_client: LLMClient,
         scanner: CollectionScanner,
         max_workers: int = 5,
-        event_emitter: Optional[EventEmitter] = None
+        event_emitter: Optional[EventEmitter] = None,
+        batch_factor: int = 4,
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None,
+        semantic_cache_dir: Optional[Path] = None,
+        items_per_request: int = 1,
+        semantic_threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+        max_concurrency: Optional[int] = None
     ):
         self.llm = llm_client
         self.scanner = scanner
         self.max_workers = max_workers
         self.emitter = event_emitter
+        # Items per LLM batch = max_workers * batch_factor
+        self.batch_factor = batch_factor
+
+        # The scanner's prompt template is constant for the whole run
+        self._prompt_template = scanner.get_description_prompt_template()
+        self._prompt_parts = compile_prompt_template(self._prompt_template)
+        # Scanner-specific template fields, chosen once for the run
+        self._scanner_name = scanner.get_name() if hasattr(scanner, 'get_name') else ''
+        self._extra_fields = SCANNER_TEMPLATE_FIELDS.get(self._scanner_name, _no_extra_fields)
+        # Items sharing one request (and one reply array); needs a compiled template
+        self._prompt_sections = split_prompt_template(self._prompt_parts)
+        self.items_per_request = max(1, items_per_request) if self._prompt_sections else 1
+        # Ask llama.cpp-based servers to keep the shared prompt prefix cached
+        self._extra_body = (
+            {"cache_prompt": True}
+            if getattr(llm_client, 'provider', None) in PROMPT_CACHE_PROVIDERS else None
+        )
 
-    def generate_description(
-        self,
-        item: CollectionItem,
-        examples: List[Dict[str, str]]
-    ) -> Optional[Dict[str, str]]:
+        # Requests in flight start at max_workers and adapt from there, up to
+        # max_concurrency (explicit --max-workers or the endpoint's capacity)
+        self.concurrency = AdaptiveConcurrency(max_workers, max_limit=max_concurrency)
+
+        # Every in-flight request gets a pooled keep-alive connection, so none
+        # pays a fresh handshake
+        if hasattr(self.llm, 'configure_pool'):
+            self.llm.configure_pool(self.concurrency.max_limit)
+        # Skip LLM calls for prompts that were already answered
+        self.cache = DescriptionCache(cache_dir) if use_cache else None
+        # Content already extracted by an earlier run, for files that haven't changed
+        self.content_cache = None
+        if use_cache and cache_dir:
+            try:
+                self.content_cache = ContentCache(Path(cache_dir) / 'contents.sqlite')
+            except (OSError, sqlite3.Error):
+                pass
+        # Reuse results for near-duplicate content when faiss/sentence-transformers are installed
+        self.semantic_cache = None
+        if use_cache and semantic_cache_dir and SEMANTIC_CACHE_AVAILABLE:
+            self.semantic_cache = SemanticDescriptionCache(semantic_cache_dir, semantic_threshold)
+
+    def _read_content(self, item: CollectionItem) -> str:
         """
-        Generate description and category for a single item.
+        Content for describing item, from the content cache when it is unchanged.
+
+        Only files are cached: a directory's mtime does not change when a
+        file inside it (e.g. its README) is edited.
+        """
+        cacheable = self.content_cache is not None and item.type == 'file' and bool(item.modified)
+        if cacheable:
+            try:
+                cached = self.content_cache.get(item.path, item.modified)
+            except sqlite3.Error:
+                cached = None
+            if cached is not None:
+                return cached
+
+        content = self.scanner.get_content_for_description(item)
+
+        # Empty results may be transient read errors: read again next run
+        if cacheable and content:
+            try:
+                self.content_cache.put(item.path, item.modified, content)
+            except sqlite3.Error:
+                pass  # Best-effort, like the description cache
+        return content
+
+    def _format_examples(self, examples: List[Dict[str, str]]) -> str:
+        """Render few-shot examples as a bullet list for the prompt."""
+        return '\n'.join([
+            f"- {ex['name']}: {ex['description']} [category: {ex.get('category', 'utilities_misc')}]"
+            for ex in examples
+        ])
+
+    def make_context(self, examples: List[Dict[str, str]]) -> DescribeContext:
+        """
+        Compute the prompt inputs shared by every item of a run.
 
         Args:
-            item: Collection item to describe
             examples: Example descriptions for few-shot learning
 
         Returns:
-            Dict with 'description' and 'category' keys, or None if failed
+            DescribeContext to pass to generate_description(s_batch)
         """
-        # Get content for description
-        content = self.scanner.get_content_for_description(item)
+        example_text = self._format_examples(examples)
+        categories = self.scanner.get_categories()
+
+        # Stable prefix first: the template's instructions before the first field,
+        # then the examples. Only the item-specific rest varies between requests.
+        # The header's last paragraph (e.g. "README content:") stays with the item.
+        prefix = []
+        prompt_parts = self._prompt_parts
+        if self._prompt_sections is not None:
+            header, item_parts, footer = self._prompt_sections
+            cut = header.rfind('\n\n')
+            if cut != -1:
+                prefix.append(header[:cut].strip())
+                header = header[cut + 2:]
+            prompt_parts = ((header, None),) + item_parts + ((footer, None),)
+        if example_text:
+            prefix.append(f"Example descriptions from other items:\n{example_text}")
+
+        return DescribeContext(
+            prompt_template=self._prompt_template,
+            prompt_parts=prompt_parts,
+            system_prompt='\n\n'.join(prefix),
+            valid_categories=frozenset(categories),
+            fallback_category=categories[-1],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "item_description",
+                    "schema": {
+                        "type": "object",
+                        "required": ["description", "category"],
+                        "properties": {
+                            "description": {"type": "string", "maxLength": 150},
+                            "category": {"type": "string", "enum": list(categories)}
+                        },
+                        "additionalProperties": False
+                    }
+                }
+            }
+        )
 
-        if not content or len(content.strip()) == 0:
-            return None
+    def _build_prompt(self, item: CollectionItem, content: str, context: DescribeContext) -> str:
+        """
+        Build the description prompt for a single item.
 
-        # Build example text
-        example_text = '\n'.join([
-            f"- {ex['name']}: {ex['description']} [category: {ex.get('category', 'utilities_misc')}]"
-            for ex in examples
-        ])
+        Args:
+            item: Collection item to describe
+            content: Content returned by the scanner for this item
+            context: Run-wide prompt inputs
 
-        # Get prompt template and fill it with content and metadata
-        prompt_template = self.scanner.get_description_prompt_template()
-        
+        Returns:
+            Prompt text ready to send to the LLM
+        """
+        # Fill the prompt template with content and metadata
+        prompt_template = context.prompt_template
+        template_vars = self._template_vars(item, content)
+
+        # Fill the precompiled template; fields we don't have render as ''
+        if context.prompt_parts is not None:
+            return self._render_parts(context.prompt_parts, template_vars)
+
+        # Format the prompt with available variables; any field we don't have renders as ''
+        return prompt_template.format_map(SafeDict(template_vars))
+
+    def _build_multi_prompt(self, entries: List[Tuple[CollectionItem, str]]) -> str:
+        """
+        Build one prompt describing several items.
+
+        The template's instructions appear once (in the cache prefix and
+        after the items); the item-specific span is repeated per item under
+        an ITEM n marker.
+        """
+        header, item_parts, footer = self._prompt_sections
+        cut = header.rfind('\n\n')
+        pieces = [header[cut + 2:] if cut != -1 else header]
+        for number, (item, content) in enumerate(entries, 1):
+            pieces.append(f"\n=== ITEM {number} ===\n")
+            pieces.append(self._render_parts(item_parts, self._template_vars(item, content)))
+        pieces.append(footer)
+        pieces.append(MULTI_ITEM_INSTRUCTIONS.format(count=len(entries)))
+        return ''.join(pieces)
+
+    @staticmethod
+    def _render_parts(parts: Tuple[Tuple[str, Optional[str]], ...], values: Dict[str, Any]) -> str:
+        """Join compiled template parts with their values ('' for missing fields)."""
+        pieces = []
+        for literal, field in parts:
+            pieces.append(literal)
+            if field is not None:
+                pieces.append(str(values.get(field, '')))
+        return ''.join(pieces)
+
+    def _template_vars(self, item: CollectionItem, content: str) -> Dict[str, Any]:
+        """Values for the prompt template fields of one item."""
         # Extract metadata fields for template formatting
         metadata = item.metadata or {}
         
@@ -72,110 +689,269 @@ class CollectionDescriber:
             'size': item.size,
             'name': item.short_name,
         }
-        
+
         # Add scanner-specific metadata fields
-        if hasattr(self.scanner, 'get_name') and self.scanner.get_name() == 'obsidian':
-            # Obsidian-specific fields
-            template_vars.update({
-                'metadata_tags': ', '.join(metadata.get('tags', [])),
-                'has_frontmatter': metadata.get('has_frontmatter', False),
-                'link_count': len(metadata.get('links', [])),
-            })
-        elif hasattr(self.scanner, 'get_name') and self.scanner.get_name() == 'documents':
-            # Documents-specific fields
-            doc_metadata = metadata.get('document_metadata', {})
-            template_vars.update({
-                'page_count': doc_metadata.get('page_count', 0),
-                'author': doc_metadata.get('author', ''),
-                'title': doc_metadata.get('title', ''),
-            })
-        elif hasattr(self.scanner, 'get_name') and self.scanner.get_name() == 'repositories':
-            # Repository-specific fields
-            template_vars.update({
-                'git_status': metadata.get('git_status', ''),
-                'remote_url': metadata.get('remote_url', ''),
-                'branch': metadata.get('branch', ''),
-            })
-        
-        # Format the prompt with available variables
+        template_vars.update(self._extra_fields(metadata))
+
+        return template_vars
+
+    def _build_messages(self, prompt: str, context: DescribeContext) -> List[Message]:
+        """
+        Build the chat messages for one item.
+
+        The run-invariant prefix (context.system_prompt) is not part of
+        them: it is sent as the request's cache_prefix, byte-identical
+        across requests, so prefix caching (vLLM, SGLang, llama.cpp, OpenAI
+        automatically; Anthropic via cache_control) reuses its prefill.
+        Item content must come after it, never before.
+        """
+        return [Message(role="user", content=prompt)]
+
+    def _parse_response(self, response: str, context: DescribeContext) -> Optional[Dict[str, str]]:
+        """
+        Parse the LLM JSON reply into a description/category dict.
+
+        Returns None for a JSON reply that does not parse (e.g. cut off by
+        max_tokens), so the item stays undescribed and is retried next run.
+        """
+        is_json = response.lstrip().startswith('{')
+        # Generation stops at the closing brace + newline, and the stop text is not returned
+        if is_json and not response.rstrip().endswith('}'):
+            response = response.rstrip() + '}'
+
         try:
-            prompt = prompt_template.format(**template_vars)
-        except KeyError as e:
-            # If template expects a field we don't have, provide a default
-            missing_field = str(e).strip("'")
-            template_vars[missing_field] = ''
-            prompt = prompt_template.format(**template_vars)
-
-        # Add examples to context if available
-        if example_text:
-            prompt = f"Example descriptions from other items:\n{example_text}\n\n{prompt}"
+            # orjson tolerates surrounding whitespace; its JSONDecodeError subclasses json's
+            result = self._normalize_result(_json_loads(response), context)
+            if result is not None:
+                return result
+        except json.JSONDecodeError:
+            pass
+
+        if is_json:
+            return None
 
-        # Query LLM
+        # Fallback (unconstrained server): treat as plain description
+        return {
+            'description': response.strip()[:150],
+            'category': context.fallback_category
+        }
+
+    def _parse_multi_response(
+        self,
+        response: str,
+        context: DescribeContext,
+        count: int
+    ) -> Optional[List[Dict[str, str]]]:
+        """Parse a multi-item reply; None unless it holds exactly count valid entries."""
         try:
-            response = self.llm.chat(
-                messages=[Message(role="user", content=prompt)],
-                temperature=0.1,
-                max_tokens=500
-            )
+            data = _json_loads(response)
+        except json.JSONDecodeError:
+            return None
 
-            # Parse JSON response
-            try:
-                result = json.loads(response.strip())
-                description = result.get('description', '').strip()[:150]
-                category = result.get('category', 'utilities_misc')
-
-                # Validate category
-                valid_categories = self.scanner.get_categories()
-                if category not in valid_categories:
-                    category = valid_categories[-1]  # Default to last category (usually misc)
-
-                return {'description': description, 'category': category}
-
-            except json.JSONDecodeError:
-                # Fallback: treat as plain description
-                return {
-                    'description': response.strip()[:150],
-                    'category': self.scanner.get_categories()[-1]
-                }
+        entries = data.get('items') if isinstance(data, dict) else data
+        if not isinstance(entries, list) or len(entries) != count:
+            return None
 
-        except Exception as e:
-            print(f"  [X] LLM request failed: {e}")
+        results = [self._normalize_result(entry, context) for entry in entries]
+        return None if any(result is None for result in results) else results
+
+    def _normalize_result(self, result: Any, context: DescribeContext) -> Optional[Dict[str, str]]:
+        """Validate one decoded {description, category} object; None if it is not one."""
+        if not isinstance(result, dict) or not isinstance(result.get('description', ''), str):
             return None
 
-    def process_item(
+        description = result.get('description', '').strip()[:150]
+        category = result.get('category', 'utilities_misc')
+
+        # Servers without constrained decoding ignore the schema: validate anyway
+        if category not in context.valid_categories:
+            category = context.fallback_category
+
+        return {'description': description, 'category': category}
+
+    def generate_description(
         self,
         item: CollectionItem,
-        examples: List[Dict[str, str]],
-        idx: int,
-        total: int
-    ) -> Dict[str, Any]:
+        context: DescribeContext
+    ) -> Optional[Dict[str, str]]:
+        """
+        Generate description and category for a single item.
+
+        Args:
+            item: Collection item to describe
+            context: Run-wide prompt inputs from make_context()
+
+        Returns:
+            Dict with 'description' and 'category' keys, or None if failed
         """
-        Process a single item in worker thread.
+        return self.generate_descriptions_batch([item], context)[0]
 
-        Returns dict with result status.
+    def generate_descriptions_batch(
+        self,
+        items: List[CollectionItem],
+        context: DescribeContext,
+        contents: Optional[List[str]] = None
+    ) -> List[Optional[Dict[str, str]]]:
         """
-        # Generate description
-        result = self.generate_description(item, examples)
-
-        if result is None:
-            return {
-                'item': item,
-                'description': None,
-                'category': None,
-                'error': 'no_content_or_failed',
-                'idx': idx,
-                'total': total
-            }
+        Generate descriptions and categories for a batch of items.
 
+        All prompts are built upfront and submitted together through
+        LLMClient.batch_chat so the server can batch their prefill.
+
+        Args:
+            items: Collection items to describe
+            context: Run-wide prompt inputs from make_context()
+            contents: Content already read for each item (read from the scanner if omitted)
+
+        Returns:
+            One result per item, in input order: a dict with 'description' and
+            'category' keys, or None if the item had no content or failed
+        """
+        results, pending = self._prepare_requests(items, context, contents)
+
+        # Query LLM
+        responses = self.llm.batch_chat(
+            [self._build_messages(prompt, context) for _, prompt, _, _ in pending],
+            max_workers=len(pending),
+            **self._request_options(context)
+        )
+
+        for (pos, _, cache_key, vector), response in zip(pending, responses):
+            if isinstance(response, Exception):
+                print(f"  [X] LLM request failed: {response}")
+                continue
+            results[pos] = self._finish_request(response, context, cache_key, vector)
+
+        if self.semantic_cache is not None:
+            self.semantic_cache.save()
+
+        return results
+
+    def _request_options(self, context: DescribeContext) -> Dict[str, Any]:
+        """Sampling options for description requests."""
+        # The reply is one short JSON object: cap decoding at ~2x its size (plus
+        # room to reason) and stop at its closing brace. A bare "}" would also
+        # match braces inside the description; "}\n" cannot, as JSON strings
+        # hold no raw newlines.
         return {
-            'item': item,
-            'description': result['description'],
-            'category': result['category'],
-            'error': None,
-            'idx': idx,
-            'total': total
+            'temperature': DESCRIPTION_TEMPERATURE,
+            'max_tokens': DESCRIPTION_MAX_TOKENS,
+            'stop': ["}\n"],
+            'response_format': context.response_format,
+            'extra_body': self._extra_body,
+            'cache_prefix': context.system_prompt or None,
+            # Parsed results are cached by DescriptionCache (a ResponseCache store), not the raw reply
+            'no_cache': True,
         }
 
+    def _multi_request_options(self, context: DescribeContext, count: int) -> Dict[str, Any]:
+        """Sampling options for a request describing count items at once."""
+        item_schema = context.response_format['json_schema']['schema']
+        return {
+            'temperature': DESCRIPTION_TEMPERATURE,
+            'max_tokens': REASONING_TOKENS + DESCRIPTION_ANSWER_TOKENS * count,
+            'response_format': {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "item_descriptions",
+                    "schema": {
+                        "type": "object",
+                        "required": ["items"],
+                        "properties": {
+                            "items": {"type": "array", "minItems": count, "maxItems": count, "items": item_schema}
+                        },
+                        "additionalProperties": False
+                    }
+                }
+            },
+            'extra_body': self._extra_body,
+            'cache_prefix': context.system_prompt or None,
+            # No stop sequence can end a multi-item reply: stop reading once its JSON closes
+            'stream': True,
+            'no_cache': True,
+        }
+
+    def _prepare_requests(
+        self,
+        items: List[CollectionItem],
+        context: DescribeContext,
+        contents: Optional[List[str]] = None
+    ) -> Tuple[List[Optional[Dict[str, str]]], List[Tuple[int, str, Optional[str], Any]]]:
+        """
+        Build prompts and answer what the caches can.
+
+        Returns:
+            (results, pending): results holds cache hits by position (None
+            elsewhere); pending lists (position, prompt, cache_key, vector) for
+            items that still need an LLM request
+        """
+        results: List[Optional[Dict[str, str]]] = [None] * len(items)
+        pending = []  # (position, content, prompt, cache_key) still needing an answer
+
+        for pos, item in enumerate(items):
+            # Get content for description
+            content = contents[pos] if contents is not None else self._read_content(item)
+
+            if not content or len(content.strip()) == 0:
+                continue
+
+            prompt = self._build_prompt(item, content, context)
+
+            # Identical prompt already answered: reuse it
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.key_for(
+                    f"{context.system_prompt}\n\n{prompt}",
+                    model=getattr(self.llm, 'model', ''),
+                    temperature=DESCRIPTION_TEMPERATURE,
+                    max_tokens=DESCRIPTION_MAX_TOKENS
+                )
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    results[pos] = cached
+                    continue
+
+            pending.append((pos, content, prompt, cache_key))
+
+        # Near-duplicate content already answered: reuse its neighbour's result
+        embeddings = [None] * len(pending)
+        if self.semantic_cache is not None and pending:
+            vectors = self.semantic_cache.embed([content for _, content, _, _ in pending])
+            still_pending = []
+            for entry, vector in zip(pending, vectors):
+                hit = self.semantic_cache.lookup(vector)
+                if hit is not None:
+                    results[entry[0]] = hit
+                else:
+                    still_pending.append((entry, vector))
+            pending = [entry for entry, _ in still_pending]
+            embeddings = [vector for _, vector in still_pending]
+
+        return results, [
+            (pos, prompt, cache_key, vector)
+            for (pos, _, prompt, cache_key), vector in zip(pending, embeddings)
+        ]
+
+    def _finish_request(
+        self,
+        response: str,
+        context: DescribeContext,
+        cache_key: Optional[str],
+        vector: Any
+    ) -> Optional[Dict[str, str]]:
+        """Parse an LLM reply and remember it in the caches (None if it is unusable)."""
+        result = self._parse_response(response, context)
+        if result is not None:
+            self._remember_result(result, cache_key, vector)
+        return result
+
+    def _remember_result(self, result: Dict[str, str], cache_key: Optional[str], vector: Any):
+        """Store a fresh result in the exact and semantic caches."""
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        if vector is not None:
+            self.semantic_cache.add(vector, result)
+
     def generate_collection_overview(
         self,
         items: List[CollectionItem],
@@ -191,29 +967,57 @@ class CollectionDescriber:
         Returns:
             Generated overview paragraph or None if failed
         """
-        # Only generate overview if we have items with descriptions
-        described_items = [item for item in items if item.description]
-        if not described_items:
+        prompt = self._build_overview_prompt(items, collection_type)
+        if prompt is None:
             return None
 
-        # Gather collection statistics
+        try:
+            return self._request_overview(prompt)
+        except Exception as e:
+            self._warn_overview_failed(e)
+            return None
+
+    def _build_overview_prompt(self, items: List[CollectionItem], collection_type: str) -> Optional[str]:
+        """Build the overview prompt, or None if no item has a description yet."""
+        # Gather collection statistics and per-category sample candidates in one pass
+        sample_size = 10
         total_items = len(items)
-        described_count = len(described_items)
-        categories = {}
-        
-        for item in described_items:
+        described_count = 0
+        categories = Counter()
+        candidates: Dict[Optional[str], List[CollectionItem]] = {}  # category -> up to sample_size items
+
+        for item in items:
+            if not item.description:
+                continue
+            described_count += 1
             if item.category:
-                categories[item.category] = categories.get(item.category, 0) + 1
+                categories[item.category] += 1
+            bucket = candidates.setdefault(item.category or None, [])
+            if len(bucket) < sample_size:
+                bucket.append(item)
 
-        # Build context for LLM
-        category_summary = ", ".join([f"{count} {cat}" for cat, count in categories.items()])
-        
-        # Sample descriptions for context (up to 10 items)
-        sample_descriptions = []
-        for item in described_items[:10]:
-            sample_descriptions.append(f"- {item.short_name}: {item.description} [{item.category or 'uncategorized'}]")
-        
-        sample_text = "\n".join(sample_descriptions)
+        # Only generate overview if we have items with descriptions
+        if not described_count:
+            return None
+
+        # Build context for LLM (dominant categories first)
+        category_summary = ", ".join(f"{count} {cat}" for cat, count in categories.most_common())
+
+        # Sample round-robin across categories, largest first, so small
+        # categories are represented too (same prompt size as the first 10)
+        buckets = [candidates[cat] for cat, _ in categories.most_common()]
+        if None in candidates:
+            buckets.append(candidates[None])
+        sample = []
+        for rank in range(sample_size):
+            sample.extend(bucket[rank] for bucket in buckets if rank < len(bucket))
+            if len(sample) >= sample_size:
+                break
+
+        sample_text = "\n".join(
+            f"- {item.short_name}: {item.description} [{item.category or 'uncategorized'}]"
+            for item in sample[:sample_size]
+        )
 
         # Create prompt for collection overview
         prompt = f"""Analyze this {collection_type} collection and generate a concise overview paragraph (2-3 sentences, max 200 words).
@@ -233,26 +1037,28 @@ Generate a contextual overview that captures:
 
 Return only the overview paragraph, no additional formatting or explanation."""
 
-        try:
-            response = self.llm.chat(
-                messages=[Message(role="user", content=prompt)],
-                temperature=0.3,
-                max_tokens=300
-            )
+        return prompt
+
+    def _request_overview(self, prompt: str) -> str:
+        """Send the overview prompt and clean the reply (raises on LLM errors)."""
+        response = self.llm.chat(
+            messages=[Message(role="user", content=prompt)],
+            temperature=0.3,
+            max_tokens=300
+        )
+        
+        # Clean and truncate the response
+        overview = response.strip()
+        if len(overview) > 500:  # Safety limit
+            overview = overview[:497] + "..."
             
-            # Clean and truncate the response
-            overview = response.strip()
-            if len(overview) > 500:  # Safety limit
-                overview = overview[:497] + "..."
-                
-            return overview
+        return overview
 
-        except Exception as e:
-            if self.emitter:
-                self.emitter.warn(f"Failed to generate collection overview: {e}")
-            else:
-                print(f"  [!] Failed to generate collection overview: {e}")
-            return None
+    def _warn_overview_failed(self, error: Exception):
+        if self.emitter:
+            self.emitter.warn(f"Failed to generate collection overview: {error}")
+        else:
+            print(f"  [!] Failed to generate collection overview: {error}")
 
     def describe_collection(
         self,
@@ -264,7 +1070,7 @@ Return only the overview paragraph, no additional formatting or explanation."""
 
         Args:
             items: List of collection items
-            save_callback: Optional callback to save after each success (for incremental saves)
+            save_callback: Optional callback called with each newly described item (for incremental saves)
 
         Returns:
             Tuple of (updated items list, collection overview string)
@@ -282,14 +1088,14 @@ Return only the overview paragraph, no additional formatting or explanation."""
                 self.emitter.info("All items already have descriptions")
             else:
                 print("[OK] All items already have descriptions")
-            return items
+            return items, None
 
         if self.emitter:
             self.emitter.set_stage(EventStage.DESCRIBE, total_items=total)
             self.emitter.info(f"Found {total} items needing descriptions")
         else:
             print(f"Found {total} items needing descriptions")
-            print(f"Processing with {self.max_workers} concurrent workers...\n")
+            print(f"Starting with {self.concurrency.limit} requests in flight (adapts to server latency)...\n")
 
         # Build examples from items that already have descriptions
         examples = [
@@ -302,49 +1108,178 @@ Return only the overview paragraph, no additional formatting or explanation."""
             if item.description is not None and item.description != ''
         ][:5]
 
+        # Everything that is the same for every item is computed once
+        context = self.make_context(examples)
+
         successful = 0
         failed = []
+        idx = 0
 
-        # Process with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            futures = {
-                executor.submit(self.process_item, item, examples, idx, total): item
-                for idx, item in enumerate(needs_description, 1)
-            }
+        # Read each item's content once, on an I/O pool sized apart from the LLM
+        # requests; items without any never reach the LLM
+        with ThreadPoolExecutor(max_workers=CONTENT_READ_WORKERS, thread_name_prefix="content-read") as pool:
+            contents = list(pool.map(self._read_content, needs_description))
 
-            # Process results as they complete
-            for future in as_completed(futures):
-                result = future.result()
+        to_describe = []  # (item, content)
+        for item, content in zip(needs_description, contents):
+            if content and content.strip():
+                to_describe.append((item, content))
+                continue
 
-                if result['error'] is not None:
+            idx += 1
+            if self.emitter:
+                self.emitter.warn(f"{item.short_name}: no_content")
+            else:
+                print(f"  [{idx}/{total}] {item.short_name}: [!] no_content")
+            failed.append(item)
+
+        # Position of each item in the original list, for O(1) write-back
+        path_to_idx = {item.path: i for i, item in enumerate(items)}
+
+        # We need collection_type - try to infer from scanner or use generic
+        collection_type = self._scanner_name or getattr(self.scanner, 'collection_type', 'collection')
+
+        # Sliding window of in-flight requests: a finished request frees its slot
+        # for the next item right away, so one slow reply never holds back a batch.
+        # The window size follows self.concurrency (AIMD on latency and errors).
+        concurrency = self.concurrency
+        per_request = self.items_per_request
+        remaining = iter(to_describe)
+        # future -> ([(item, content, prompt, cache_key, vector)], multi-item request?, start time)
+        in_flight: Dict[Future, Tuple[List[Tuple[CollectionItem, str, str, Optional[str], Any]], bool, float]] = {}
+        submitted_all = False
+
+        def submit(entries):
+            # Several items share one request; a lone item keeps the single-item prompt
+            if len(entries) > 1:
+                prompt = self._build_multi_prompt([(item, content) for item, content, _, _, _ in entries])
+                options = self._multi_request_options(context, len(entries))
+            else:
+                prompt = entries[0][2]
+                options = self._request_options(context)
+            future = self.llm.submit_chat(self._build_messages(prompt, context), **options)
+            in_flight[future] = (entries, len(entries) > 1, time.monotonic())
+
+        # Items whose prompt is identical to one already in flight wait for its
+        # answer instead of sending their own: prompt key -> waiting items
+        sharers: Dict[str, List[CollectionItem]] = {}
+
+        # Overview request running alongside the last requests, if started early
+        overview_future: Optional[Future] = None
+        overview_executor = None
+
+        while True:
+            completed = []  # (item, result) to report
+
+            # Top up the window; cache hits complete without a request
+            if not submitted_all and len(in_flight) < concurrency.limit:
+                wanted = (concurrency.limit - len(in_flight)) * per_request
+                group = list(islice(remaining, wanted))
+                submitted_all = len(group) < wanted
+                if group:
+                    results, pending = self._prepare_requests(
+                        [item for item, _ in group], context, contents=[content for _, content in group]
+                    )
+                    requested = set()
+                    entries = []
+                    for pos, prompt, cache_key, vector in pending:
+                        requested.add(pos)
+                        key = cache_key or prompt
+                        if key in sharers:
+                            sharers[key].append(group[pos][0])
+                            continue
+                        sharers[key] = []
+                        entries.append((group[pos][0], group[pos][1], prompt, cache_key, vector))
+                    for start in range(0, len(entries), per_request):
+                        submit(entries[start:start + per_request])
+                    completed = [
+                        (item, result) for pos, ((item, _), result) in enumerate(zip(group, results))
+                        if pos not in requested
+                    ]
+
+            # Everything is submitted and a representative sample is described: request
+            # the overview now so its LLM call overlaps the last requests
+            if submitted_all and overview_future is None and in_flight and successful >= min(10, total):
+                prompt = self._build_overview_prompt(items, collection_type)
+                if prompt is not None:
                     if self.emitter:
-                        self.emitter.warn(f"{result['item'].short_name}: {result['error']}")
+                        self.emitter.info("Generating collection overview...")
                     else:
-                        print(f"  [{result['idx']}/{result['total']}] {result['item'].short_name}: [!] {result['error']}")
-                    failed.append(result['item'])
-                else:
+                        print("\nGenerating collection overview alongside the last requests...")
+                    overview_executor = ThreadPoolExecutor(max_workers=1)
+                    overview_future = overview_executor.submit(self._request_overview, prompt)
+
+            if not completed:
+                if not in_flight:
+                    if submitted_all:
+                        break
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                finished = []  # (entry, result) per item that had its own request
+                for future in done:
+                    entries, multi, started = in_flight.pop(future)
+                    latency = time.monotonic() - started
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        concurrency.record(latency, ok=False)
+                        print(f"  [X] LLM request failed: {e}")
+                        finished.extend((entry, None) for entry in entries)
+                        continue
+                    concurrency.record(latency)
+
+                    if not multi:
+                        _, _, _, cache_key, vector = entries[0]
+                        finished.append((entries[0], self._finish_request(response, context, cache_key, vector)))
+                        continue
+
+                    results = self._parse_multi_response(response, context, len(entries))
+                    if results is None:
+                        # Reply didn't line up with the items: ask for each one separately
+                        for entry in entries:
+                            submit([entry])
+                        continue
+                    for entry, result in zip(entries, results):
+                        self._remember_result(result, entry[3], entry[4])
+                        finished.append((entry, result))
+
+                # Fan each answer out to the items that shared its prompt
+                for (item, _, prompt, cache_key, _), result in finished:
+                    completed.append((item, result))
+                    completed.extend((sharer, result) for sharer in sharers.pop(cache_key or prompt, ()))
+
+            for item, result in completed:
+                idx += 1
+
+                if result is None:
+                    error = 'failed'
                     if self.emitter:
-                        self.emitter.set_progress(
-                            result['idx'], 
-                            result['item'].short_name
-                        )
-                        self.emitter.info(f"{result['item'].short_name}: {result['description']} [{result['category']}]")
+                        self.emitter.warn(f"{item.short_name}: {error}")
                     else:
-                        print(f"  [{result['idx']}/{result['total']}] {result['item'].short_name}: [OK] {result['description']} [{result['category']}]")
+                        print(f"  [{idx}/{total}] {item.short_name}: [!] {error}")
+                    failed.append(item)
+                    continue
+
+                if self.emitter:
+                    self.emitter.set_progress(idx, item.short_name)
+                    self.emitter.info(f"{item.short_name}: {result['description']} [{result['category']}]")
+                else:
+                    print(f"  [{idx}/{total}] {item.short_name}: [OK] {result['description']} [{result['category']}]")
 
-                    # Update item in original list
-                    for i, item in enumerate(items):
-                        if item.path == result['item'].path:
-                            items[i].description = result['description']
-                            items[i].category = result['category']
-                            break
+                # Update item in original list
+                i = path_to_idx[item.path]
+                items[i].description = result['description']
+                items[i].category = result['category']
 
-                    # Call save callback if provided (incremental saves)
-                    if save_callback:
-                        save_callback(items)
+                # Call save callback if provided (incremental saves)
+                if save_callback:
+                    save_callback(items[i])
 
-                    successful += 1
+                successful += 1
+
+        if self.semantic_cache is not None:
+            self.semantic_cache.save()
 
         if self.emitter:
             self.emitter.complete_stage(f"Completed: {successful}/{total} descriptions generated")
@@ -355,26 +1290,27 @@ Return only the overview paragraph, no additional formatting or explanation."""
             if failed:
                 print(f"[!] Failed: {len(failed)} items")
 
-        # Generate collection overview after all descriptions are complete
+        # Collect the early overview, or generate it now that all descriptions are complete
         collection_overview = None
-        if successful > 0:  # Only generate if we have some descriptions
+        if overview_future is not None:
+            try:
+                collection_overview = overview_future.result()
+            except Exception as e:
+                self._warn_overview_failed(e)
+            overview_executor.shutdown()
+        elif successful > 0:  # Only generate if we have some descriptions
             if self.emitter:
                 self.emitter.info("Generating collection overview...")
             else:
                 print("\nGenerating collection overview...")
             
-            # We need collection_type - try to infer from scanner or use generic
-            collection_type = getattr(self.scanner, 'collection_type', 'collection')
-            if hasattr(self.scanner, 'get_name'):
-                collection_type = self.scanner.get_name()
-            
             collection_overview = self.generate_collection_overview(items, collection_type)
-            
-            if collection_overview:
-                if self.emitter:
-                    self.emitter.info(f"Collection overview: {collection_overview[:100]}...")
-                else:
-                    print(f"[OK] Collection overview generated: {collection_overview[:100]}...")
+
+        if collection_overview:
+            if self.emitter:
+                self.emitter.info(f"Collection overview: {collection_overview[:100]}...")
+            else:
+                print(f"[OK] Collection overview generated: {collection_overview[:100]}...")
 
         return items, collection_overview
 
@@ -383,7 +1319,10 @@ def describe_from_index(
     index_path: Path,
     llm_client: LLMClient,
     scanner: CollectionScanner,
-    max_workers: int = 5
+    max_workers: int = 5,
+    items_per_request: int = 1,
+    semantic_threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+    max_concurrency: Optional[int] = None
 ) -> tuple[List[CollectionItem], Optional[str]]:
     """
     Load items from index YAML, generate descriptions, save back with collection overview.
@@ -393,68 +1332,53 @@ def describe_from_index(
         llm_client: LLM client instance
         scanner: Scanner instance for this collection type
         max_workers: Number of concurrent workers
+        items_per_request: Items described by each LLM request
+        semantic_threshold: Similarity for reusing a near-duplicate's description
+        max_concurrency: Ceiling for adaptive concurrency (None: AdaptiveConcurrency.max_limit)
 
     Returns:
         Tuple of (updated items list, collection overview)
     """
-    # Load index
-    with open(index_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-
-    # Handle both old format (list) and new format (dict with collection_overview)
-    if isinstance(data, list):
-        items_data = data
-        existing_overview = None
-    else:
-        items_data = data.get('items', data)  # Support both 'items' key or direct list
-        existing_overview = data.get('collection_overview')
-
-    # Convert to CollectionItem objects
-    items = []
-    for item_data in items_data:
-        item = CollectionItem(
-            short_name=item_data['short_name'],
-            type=item_data['type'],
-            size=item_data['size'],
-            created=item_data['created'],
-            modified=item_data['modified'],
-            accessed=item_data['accessed'],
-            path=item_data['path'],
-            description=item_data.get('description'),
-            category=item_data.get('category'),
-            metadata=item_data.get('metadata', {})
+    from pipeline import load_index, save_index, IndexDeltaWriter, index_lock
+
+    # Hold the index for the whole load-describe-save cycle
+    with index_lock(index_path.parent):
+        # Load index (either format; flattened metadata and pending deltas included)
+        items, existing_overview = load_index(index_path)
+
+        # Create describer (description cache lives next to the index)
+        describer = CollectionDescriber(
+            llm_client, scanner, max_workers,
+            cache_dir=index_path.parent / '.llm_cache',
+            semantic_cache_dir=index_path.parent,
+            items_per_request=items_per_request,
+            semantic_threshold=semantic_threshold,
+            max_concurrency=max_concurrency
         )
-        items.append(item)
-
-    # Create describer
-    describer = CollectionDescriber(llm_client, scanner, max_workers)
 
-    # Define save callback for incremental saves with overview
-    def save_items_with_overview(updated_items: List[CollectionItem], overview: Optional[str] = None):
-        # Use the pipeline save_index function for consistency
-        from pipeline import save_index
-        save_index(updated_items, index_path, overview or existing_overview)
+        # Incremental saves append to the deltas log, a batch of lines at a time
+        incremental_save = IndexDeltaWriter(index_path)
 
-    # Generate descriptions with incremental saves (but don't save overview until the end)
-    def incremental_save(updated_items: List[CollectionItem]):
-        save_items_with_overview(updated_items, existing_overview)
-
-    # Generate descriptions and overview
-    updated_items, collection_overview = describer.describe_collection(items, save_callback=incremental_save)
+        # Generate descriptions and overview
+        try:
+            updated_items, collection_overview = describer.describe_collection(items, save_callback=incremental_save)
+        finally:
+            incremental_save.flush()
 
-    # Final save with the new overview
-    save_items_with_overview(updated_items, collection_overview)
+        # Single final write: original items + deltas + overview
+        save_index(updated_items, index_path, collection_overview or existing_overview)
 
     return updated_items, collection_overview
 
 
-def describe_collection_cli(index_path: str, max_workers: int = 5):
+def describe_collection_cli(index_path: str, max_workers: Union[int, str] = 'auto'):
     """
     CLI helper: generate descriptions for items in index
 
     Args:
         index_path: Path to collection-index.yaml
-        max_workers: Number of concurrent workers
+        max_workers: Number of concurrent workers, or 'auto' to size from
+            llm.concurrency in collection.yaml and the server's reported slots
     """
     from llm import create_client_from_config
 
@@ -467,8 +1391,9 @@ def describe_collection_cli(index_path: str, max_workers: int = 5):
     if not config_path.exists():
         raise FileNotFoundError(f"No collection.yaml found at {config_path}")
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    from pipeline import load_yaml_cached
+
+    config = load_yaml_cached(config_path)
 
     collection_type = config['collection_type']
 
@@ -479,10 +1404,10 @@ def describe_collection_cli(index_path: str, max_workers: int = 5):
 
     scanner = scanner_class()
 
-    # Create LLM client
+    # Shared LLM client (see create_client_from_config): not ours to close
     llm_client = create_client_from_config()
 
-    # Test LLM connection (fast-fail)
+    # Test LLM connection (fast-fail); this also opens the first pooled connection
     print("Testing LLM connection...")
     if not test_llm_connection(llm_client):
         print("[X] FATAL: Cannot reach LLM endpoint")
@@ -491,8 +1416,15 @@ def describe_collection_cli(index_path: str, max_workers: int = 5):
 
     print("[OK] LLM connection OK\n")
 
+    max_workers, max_concurrency = resolve_max_workers(max_workers, llm_client, config)
+
     # Generate descriptions
-    updated_items, collection_overview = describe_from_index(index_path, llm_client, scanner, max_workers)
+    updated_items, collection_overview = describe_from_index(
+        index_path, llm_client, scanner, max_workers,
+        items_per_request=items_per_request_from_config(config),
+        semantic_threshold=semantic_threshold_from_config(config),
+        max_concurrency=max_concurrency
+    )
 
     if collection_overview:
         print(f"\n[OK] Collection overview: {collection_overview}")
@@ -504,12 +1436,12 @@ if __name__ == '__main__':
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python describer.py <index_path> [max_workers]")
+        print("Usage: python describer.py <index_path> [max_workers|auto]")
         print("\nExample: python describer.py C:\\Users\\synta\\repos\\.collection\\index.yaml")
         sys.exit(1)
 
     index_path = sys.argv[1]
-    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    max_workers = max_workers_arg(sys.argv[2]) if len(sys.argv) > 2 else 'auto'
 
     try:
         success = describe_collection_cli(index_path, max_workers)
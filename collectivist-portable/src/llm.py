@@ -4,14 +4,61 @@ LLM Provider Abstraction - ported from .shared/go/llm pattern
 Supports local (LMStudio, Ollama) and cloud (OpenRouter, Pollinations, Anthropic, OpenAI) providers
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
 import os
+import random
 import re
+import threading
+import time
 import requests
+from collections import deque
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterator, List, Union, Mapping, ClassVar, Tuple
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from llm_cache import ResponseCache, DEFAULT_TTL as RESPONSE_CACHE_TTL
+from metrics import record_llm_request
+
+# Async HTTP client for batched requests (optional, falls back to pooled threads)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Faster JSON parsing of response bodies when available; falls back to the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parses str or bytes (response bodies are parsed straight from bytes)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# libyaml's C parser when available (same results as yaml.safe_load)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# HTTP/2 multiplexing for httpx (optional)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 class ProviderType(Enum):
@@ -34,6 +81,22 @@ DEFAULT_BASE_URLS = {
     ProviderType.OLLAMA: "http://localhost:11434/v1",
 }
 
+# Local servers that accept llama.cpp's "cache_prompt" field (hosted APIs reject unknown fields)
+PROMPT_CACHE_PROVIDERS = frozenset({
+    ProviderType.LMSTUDIO,
+    ProviderType.OLLAMA,
+    ProviderType.CUSTOM,
+})
+
+# Responses worth retrying: rate limited or a transient server-side failure
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound for one backoff sleep, including server-requested ones
+MAX_RETRY_DELAY = 60.0
+
+# First ```yaml fenced block of a Markdown config
+YAML_BLOCK_PATTERN = re.compile(r'```yaml\s*\n(.*?)\n```', re.DOTALL | re.IGNORECASE)
+
 # Smart defaults for models when not specified
 DEFAULT_MODELS = {
     ProviderType.LMSTUDIO: "openai/gpt-oss-20b",
@@ -52,22 +115,172 @@ class Message:
     content: str
 
 
+class RateLimiter:
+    """
+    Sliding-window admission control for requests per minute and tokens per minute.
+
+    Shared by every thread and coroutine using one client, so concurrent
+    requests are spread to stay under the provider's limits instead of
+    bursting into 429s. Either limit may be None (unlimited). A 429 halves
+    the admitted rate for a minute, so even a client without configured
+    limits settles just below the provider's ceiling. Requests that were in
+    flight together all see the same 429, so only one penalty applies per
+    window, and the rate never drops below PENALTY_FLOOR of the configured
+    (or, without one, recently admitted) rate. A Retry-After pauses
+    admissions until it has passed.
+    """
+
+    WINDOW = 60.0
+    PENALTY_FLOOR = 0.25  # Lowest penalized rate, as a fraction of the base rate
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._lock = threading.Lock()
+        self._window: deque = deque()  # (admitted_at, estimated_tokens)
+        self._penalty_rpm: Optional[int] = None
+        self._penalty_until = 0.0
+        self._penalty_floor = 1
+        self._last_penalty: Optional[float] = None
+        self._paused_until = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        """Admit a request now and return 0, or return how long to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            while self._window and now - self._window[0][0] >= self.WINDOW:
+                self._window.popleft()
+
+            rpm = self._penalty_rpm if now < self._penalty_until else self.rpm
+            over_rpm = rpm is not None and len(self._window) >= rpm
+            over_tpm = (
+                self.tpm is not None and self._window
+                and sum(t for _, t in self._window) + tokens > self.tpm
+            )
+            if over_rpm or over_tpm:
+                return self._window[0][0] + self.WINDOW - now
+
+            self._window.append((now, tokens))
+            return 0.0
+
+    def acquire(self, tokens: int = 0):
+        """Block until a request estimated at `tokens` tokens may be sent."""
+        while (delay := self._reserve(tokens)) > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: int = 0):
+        """Async version of acquire()."""
+        while (delay := self._reserve(tokens)) > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """
+        Record a 429: admit half the recent rate for the next minute.
+
+        Further 429s within the same window (the rest of one burst) don't
+        halve it again. retry_after (seconds) pauses all admissions.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + min(retry_after, MAX_RETRY_DELAY))
+            if self._last_penalty is not None and now - self._last_penalty < self.WINDOW:
+                return
+            self._last_penalty = now
+
+            if now < self._penalty_until:
+                current = self._penalty_rpm
+            else:
+                # Fresh penalty: the floor follows the rate we are backing off from
+                current = self.rpm or len(self._window)
+                self._penalty_floor = max(1, int(current * self.PENALTY_FLOOR))
+            self._penalty_rpm = max(self._penalty_floor, current // 2)
+            self._penalty_until = now + self.WINDOW
+
+
+def _tracked_request(method):
+    """Count a chat call as in flight on its client for its whole duration (see LLMClient.retire)."""
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            self._begin_request()
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                self._end_request()
+    elif inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self._begin_request()
+            try:
+                yield from method(self, *args, **kwargs)
+            finally:
+                self._end_request()
+    else:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self._begin_request()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._end_request()
+    return wrapper
+
+
 class LLMClient:
     """Unified LLM client with provider abstraction"""
 
+    # Parsed config files: path -> (mtime_ns, config)
+    _config_cache: ClassVar[Dict[str, Tuple[int, Dict[str, str]]]] = {}
+
     def __init__(
         self,
         provider: ProviderType,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         model: Optional[str] = None,
-        timeout: int = 120
+        timeout: int = 120,
+        pool_size: int = 10,
+        max_retries: int = 5
     ):
         self.provider = provider
         self.api_key = api_key
         self.base_url = base_url or DEFAULT_BASE_URLS.get(provider)
         self.model = model or DEFAULT_MODELS.get(provider, "gpt-4o-mini")
         self.timeout = timeout
+        # Attempts per request when the server answers 429/5xx
+        self.max_retries = max(1, max_retries)
+        # Cleared once the server rejects a json_schema response_format;
+        # later requests then ask for plain JSON mode instead
+        self._json_schema_supported = True
+        # Exact-match reply cache (see llm_cache.py); from_config attaches one
+        self.response_cache: Optional[ResponseCache] = None
+        # Paces requests to the provider's limits (llm_rpm/llm_tpm in the config)
+        self.rate_limiter = RateLimiter()
+        # time.monotonic() of the last reply from the provider; lets
+        # test_llm_connection skip probing an endpoint that just answered
+        self.last_success: Optional[float] = None
+
+        # One keep-alive session shared by all threads using this client
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        self.pool_size = 0
+        self.configure_pool(pool_size)
+
+        # Batched requests run as coroutines on a private event loop thread,
+        # started on first use so callers never share (or need) an event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._async_client = None
+        self._async_pool_size = 0
+
+        # Requests in flight, so a retired shared client closes only once idle
+        self._in_flight = 0
+        self._retired = False
+        self._usage_lock = threading.Lock()
 
         # Validate configuration
         if not self.base_url:
@@ -78,17 +291,98 @@ class LLMClient:
             if not self.api_key:
                 raise ValueError(f"API key required for provider: {provider}")
 
+    def configure_pool(self, max_workers: int):
+        """
+        Size the HTTP connection pool for max_workers concurrent requests.
+
+        Pooled connections stay alive between requests, so each worker pays the
+        TCP/TLS handshake once instead of once per request. Only failed
+        connection attempts are retried; POSTs that reached the server are not.
+        The pool only ever grows, so a smaller request is a no-op.
+        """
+        if max_workers <= self.pool_size:
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 2,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.pool_size = max_workers
+
+    def get_server_info(self) -> Dict:
+        """
+        Fetch llama.cpp-style server properties from <root>/props.
+
+        The reply includes "total_slots", the number of requests the server
+        decodes in parallel. Returns {} for servers without this endpoint.
+        """
+        root = self.base_url.rstrip('/')
+        if root.endswith('/v1'):
+            root = root[:-3]
+
+        try:
+            response = self.session.get(f"{root}/props", headers=self._auth_headers(), timeout=5)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Authentication headers for plain GET endpoints (/models, /props)."""
+        if not self.api_key:
+            return {}
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        if self.provider == ProviderType.ANTHROPIC:
+            # Anthropic's native endpoints authenticate with x-api-key
+            headers.update({"x-api-key": self.api_key, "anthropic-version": "2023-06-01"})
+        return headers
+
+    def ping(self) -> Optional[bool]:
+        """
+        Check that the endpoint is reachable with GET <base_url>/models.
+
+        Unlike a chat request this needs no prefill or generation, so it
+        answers at once even while the model is cold. Returns None when the
+        server has no /models route (404/405), letting callers fall back to
+        a chat probe.
+        """
+        try:
+            response = self.session.get(f"{self.base_url}/models", headers=self._auth_headers(), timeout=5)
+        except requests.exceptions.RequestException:
+            return False
+
+        if response.status_code in (404, 405):
+            return None
+        return response.ok
+
+    def probe_concurrency(self) -> Optional[int]:
+        """Return how many requests the server batches concurrently, or None if unknown."""
+        slots = self.get_server_info().get('total_slots')
+        return slots if isinstance(slots, int) and slots > 0 else None
+
     def get_default_model(self) -> str:
         """Get the default model for this client."""
         return self.model
 
+    @_tracked_request
     def chat(
         self,
         model: Optional[str] = None,
         messages: List[Message] = None,
         temperature: float = 0.7,
         top_p: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        response_format: Optional[Dict] = None,
+        extra_body: Optional[Dict] = None,
+        cache_prefix: Optional[str] = None,
+        stream: bool = False,
+        no_cache: bool = False
     ) -> str:
         """
         Send chat completion request to LLM provider.
@@ -99,10 +393,267 @@ class LLMClient:
             temperature: Sampling temperature
             top_p: Top-p sampling parameter
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation (not included in the response)
+            response_format: Structured-output constraint, e.g. {"type": "json_object"}
+                or {"type": "json_schema", "json_schema": {...}} (ignored by servers
+                without constrained decoding)
+            extra_body: Provider-specific fields merged into the request payload
+                (e.g. {"cache_prompt": True} for llama.cpp)
+            cache_prefix: Instructions identical across requests, sent ahead of
+                messages as the system prompt. Anthropic gets it as a
+                cache_control block on its Messages API; OpenAI-compatible
+                servers cache a byte-identical prefix automatically.
+            stream: Stream the reply and close the connection as soon as it
+                holds a complete JSON document, which stops generation early
+                on servers that abort on disconnect
+            no_cache: Skip the response cache for this request
             
         Returns:
             The response text.
         """
+        url, payload, headers = self._build_request(
+            model, messages, temperature, top_p, max_tokens, stop, response_format, extra_body,
+            cache_prefix
+        )
+        cache_key = None if no_cache else self._response_cache_key(url, payload)
+        cache_state = "off" if cache_key is None else "miss"
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                record_llm_request(self.provider.value, payload["model"], "ok", "hit")
+                return cached
+
+        if stream:
+            payload["stream"] = True
+        started = time.perf_counter()
+        try:
+            response_text = self._post(url, payload, headers, stream)
+        except Exception:
+            record_llm_request(self.provider.value, payload["model"], "error", cache_state,
+                               time.perf_counter() - started)
+            raise
+        record_llm_request(self.provider.value, payload["model"], "ok", cache_state,
+                           time.perf_counter() - started)
+        self.last_success = time.monotonic()
+
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response_text)
+        return response_text
+
+    def _post(self, url: str, payload: Dict, headers: Dict[str, str], stream: bool) -> str:
+        """Send a built request with retries and return the response text."""
+        try:
+            response = self._send(url, payload, headers, stream)
+            if not stream:
+                return self._extract_content(_json_loads(response.content))
+
+            # Closing mid-stream drops the connection, aborting generation server-side
+            with response:
+                parts = []
+                for piece in self._iter_stream(response):
+                    parts.append(piece)
+                    if '}' in piece and self._is_complete_json(parts):
+                        break
+                return ''.join(parts)
+
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"LLM request failed: {e}")
+
+    def _send(self, url: str, payload: Dict, headers: Dict[str, str], stream: bool) -> requests.Response:
+        """POST a built request, retrying rate limits and transient errors; returns the successful response."""
+        tokens = self._estimate_tokens(payload)
+        for attempt in range(self.max_retries):
+            self.rate_limiter.acquire(tokens)
+            response = self.session.post(
+                url,
+                json=payload,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream
+            )
+            if response.status_code == 429:
+                self.rate_limiter.penalize(self._retry_after(response.headers))
+            # Rate limited or transient server error: back off and try again
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries - 1:
+                response.close()
+                time.sleep(self._retry_delay(attempt, response.headers))
+                continue
+            if response.status_code == 400 and self._downgrade_json_schema(response.text, payload):
+                response.close()
+                continue
+            response.raise_for_status()
+            return response
+
+        raise RuntimeError("LLM request failed: no attempts left")
+
+    def _iter_stream(self, response: requests.Response) -> Iterator[str]:
+        """Text deltas of a streamed (SSE) response, until the end-of-stream event."""
+        # text/event-stream is UTF-8 by spec; without a charset requests would assume ISO-8859-1
+        response.encoding = "utf-8"
+        for line in response.iter_lines(decode_unicode=True):
+            piece = self._stream_piece(line)
+            if piece is None:
+                return
+            if piece:
+                yield piece
+
+    @_tracked_request
+    def chat_stream(
+        self,
+        model: Optional[str] = None,
+        messages: List[Message] = None,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        response_format: Optional[Dict] = None,
+        extra_body: Optional[Dict] = None,
+        cache_prefix: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding text deltas as they arrive.
+
+        Takes the same arguments as chat(). Stopping iteration early (break,
+        or closing the generator) closes the connection, which aborts
+        generation on servers that stop on disconnect. Streamed replies
+        bypass the response cache.
+        """
+        url, payload, headers = self._build_request(
+            model, messages, temperature, top_p, max_tokens, stop, response_format, extra_body,
+            cache_prefix
+        )
+        payload["stream"] = True
+
+        try:
+            with self._send(url, payload, headers, stream=True) as response:
+                yield from self._iter_stream(response)
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"LLM request failed: {e}")
+
+    @staticmethod
+    def _estimate_tokens(payload: Dict) -> int:
+        """Rough token count of a request for tokens-per-minute pacing (~4 bytes per token)."""
+        prompt_bytes = sum(len(str(msg.get("content", ""))) for msg in payload.get("messages", []))
+        prompt_bytes += sum(len(block.get("text", "")) for block in payload.get("system", []))
+        return prompt_bytes // 4 + (payload.get("max_tokens") or 0)
+
+    def _response_cache_key(self, url: str, payload: Dict) -> Optional[str]:
+        """Cache key for a built request, or None when it must not be cached."""
+        if self.response_cache is None or not ResponseCache.cacheable(payload):
+            return None
+        return ResponseCache.make_key(self.provider.value, url, payload)
+
+    def _downgrade_json_schema(self, error_body: str, payload: Dict) -> bool:
+        """
+        Fall back from a json_schema to a json_object response_format.
+
+        Called for 400 responses. Servers without structured-output support
+        (older vLLM, some OpenRouter/Pollinations models) reject json_schema
+        but accept JSON mode; the prompt still describes the expected fields.
+        Returns True if payload was changed and should be sent again.
+        """
+        response_format = payload.get("response_format") or {}
+        if response_format.get("type") != "json_schema":
+            return False
+
+        error_body = error_body.lower()
+        if "schema" not in error_body and "response_format" not in error_body:
+            return False
+
+        self._json_schema_supported = False
+        payload["response_format"] = {"type": "json_object"}
+        return True
+
+    @staticmethod
+    def _stream_piece(line: str) -> Optional[str]:
+        """
+        Text carried by one server-sent event line.
+
+        Handles OpenAI-style chunks and Anthropic content_block_delta events.
+        Returns '' for lines without text and None at the end of the stream.
+        """
+        if not line or not line.startswith("data:"):
+            return ''
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return None
+
+        try:
+            event = _json_loads(data)
+        except ValueError:
+            return ''
+        if event.get("choices"):
+            return (event["choices"][0].get("delta") or {}).get("content") or ''
+        if event.get("type") == "content_block_delta":
+            return event.get("delta", {}).get("text", '')
+        if event.get("type") == "message_stop":
+            return None
+        return ''
+
+    @staticmethod
+    def _is_complete_json(parts: List[str]) -> bool:
+        """Whether the streamed text so far parses as one JSON document."""
+        try:
+            _json_loads(''.join(parts))
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Seconds the server asked us to wait, or None if it didn't say.
+
+        Reads Retry-After (seconds or HTTP date) and Anthropic's
+        anthropic-ratelimit-requests-reset (RFC 3339).
+        """
+        now = datetime.now(timezone.utc)
+        retry_after = headers.get("Retry-After")
+        reset = headers.get("anthropic-ratelimit-requests-reset")
+
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - now).total_seconds()
+                except (TypeError, ValueError):
+                    pass
+        if delay is None and reset:
+            try:
+                delay = (datetime.fromisoformat(reset.replace("Z", "+00:00")) - now).total_seconds()
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    @classmethod
+    def _retry_delay(cls, attempt: int, headers: Mapping[str, str]) -> float:
+        """
+        Seconds to wait before retrying a 429/5xx response.
+
+        Honours the server's requested delay (see _retry_after), otherwise backs
+        off exponentially with jitter so concurrent workers don't retry in step.
+        """
+        delay = cls._retry_after(headers)
+        if delay is None:
+            delay = 2 ** attempt + random.uniform(0, 1)
+
+        return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+    def _build_request(
+        self,
+        model: Optional[str],
+        messages: Optional[List[Message]],
+        temperature: float,
+        top_p: Optional[float],
+        max_tokens: Optional[int],
+        stop: Optional[List[str]] = None,
+        response_format: Optional[Dict] = None,
+        extra_body: Optional[Dict] = None,
+        cache_prefix: Optional[str] = None
+    ) -> tuple[str, Dict, Dict[str, str]]:
+        """Build (url, payload, headers) for a chat completion request."""
         # Use default model if not specified
         if model is None:
             model = self.model
@@ -110,13 +661,27 @@ class LLMClient:
         # Ensure messages is not None
         if messages is None:
             messages = []
+
+        if self.provider == ProviderType.ANTHROPIC and (
+            cache_prefix or any(msg.role == "system" for msg in messages)
+        ):
+            return self._build_anthropic_request(
+                model, messages, temperature, top_p, max_tokens, stop, cache_prefix
+            )
+
         # Build request payload (OpenAI-compatible format)
         payload = {
             "model": model,
-            "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+            "messages": self._prepare_messages(messages, cache_prefix),
             "temperature": temperature
         }
 
+        if cache_prefix and self.provider == ProviderType.OPENAI:
+            # Route requests sharing a prefix to the same cache shard
+            payload["prompt_cache_key"] = hashlib.blake2b(
+                f"{model}\n{cache_prefix}".encode("utf-8"), digest_size=8
+            ).hexdigest()
+
         if top_p is not None:
             payload["top_p"] = top_p
         
@@ -124,34 +689,435 @@ class LLMClient:
         if max_tokens is not None:
             payload["max_tokens"] = max_tokens
 
+        if stop:
+            payload["stop"] = stop
+
+        if response_format is not None:
+            if response_format.get("type") == "json_schema" and not self._json_schema_supported:
+                response_format = {"type": "json_object"}
+            payload["response_format"] = response_format
+
+        if extra_body:
+            payload.update(extra_body)
+
         # Build headers
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        # Make request
-        url = f"{self.base_url}/chat/completions"
+        return f"{self.base_url}/chat/completions", payload, headers
 
-        try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
+    @staticmethod
+    def _prepare_messages(messages: List[Message], cache_prefix: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Order messages for provider-side prefix caching.
+
+        Servers reuse the KV cache of a byte-identical prefix, so all stable
+        instructions go first: cache_prefix and any system messages merge into
+        one leading system message. The conversation follows in its original
+        order.
+        """
+        system_parts = [cache_prefix] if cache_prefix else []
+        system_parts.extend(msg.content for msg in messages if msg.role == "system")
+
+        payload_messages = [{"role": "system", "content": "\n\n".join(system_parts)}] if system_parts else []
+        payload_messages.extend(
+            {"role": msg.role, "content": msg.content} for msg in messages if msg.role != "system"
+        )
+        return payload_messages
+
+    def _build_anthropic_request(
+        self,
+        model: str,
+        messages: List[Message],
+        temperature: float,
+        top_p: Optional[float],
+        max_tokens: Optional[int],
+        stop: Optional[List[str]],
+        cache_prefix: Optional[str]
+    ) -> tuple[str, Dict, Dict[str, str]]:
+        """
+        Build (url, payload, headers) for Anthropic's Messages API.
+
+        The OpenAI-compatible endpoint has no cache_control, so requests with
+        instructions (a cache_prefix or system messages) use the native API:
+        they become one system block marked ephemeral and are billed at the
+        cache-read rate on later calls. Structured-output options have no
+        equivalent there and are dropped.
+        """
+        system = [{"type": "text", "text": cache_prefix}] if cache_prefix else []
+        system.extend(
+            {"type": "text", "text": msg.content} for msg in messages if msg.role == "system"
+        )
+        # The breakpoint caches everything up to it: the shared prefix when
+        # given, else the whole system prompt
+        system[0 if cache_prefix else -1]["cache_control"] = {"type": "ephemeral"}
+
+        payload = {
+            "model": model,
+            "system": system,
+            "messages": [
+                {"role": msg.role, "content": msg.content} for msg in messages if msg.role != "system"
+            ],
+            "temperature": temperature,
+            # Required by the Messages API
+            "max_tokens": max_tokens if max_tokens is not None else 1024
+        }
+
+        if top_p is not None:
+            payload["top_p"] = top_p
+
+        if stop:
+            payload["stop_sequences"] = stop
+
+        headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        }
+
+        return f"{self.base_url}/messages", payload, headers
+
+    @staticmethod
+    def _extract_content(data: Dict) -> str:
+        """Extract the response text from a chat completion (or Anthropic Messages) body."""
+        if "choices" in data and len(data["choices"]) > 0:
+            return data["choices"][0]["message"]["content"]
+        elif data.get("type") == "message" and isinstance(data.get("content"), list):
+            return ''.join(block.get("text", '') for block in data["content"] if block.get("type") == "text")
+        else:
+            raise ValueError(f"Unexpected response format: {data}")
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the client's I/O event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Without httpx, requests run on this executor; the semaphore bounds them
+                loop.set_default_executor(ThreadPoolExecutor(
+                    max_workers=max(self.pool_size * 2, 1),
+                    thread_name_prefix="llm-sync"
+                ))
+                self._loop_thread = threading.Thread(target=loop.run_forever, name="llm-io", daemon=True)
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def close(self):
+        """
+        Release pooled connections and stop the I/O loop thread.
+
+        The client stays usable: the next request reopens what it needs.
+        Safe to call more than once.
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+
+        if loop is not None:
+            async def shutdown():
+                if self._async_client is not None:
+                    await self._async_client.aclose()
+                    self._async_client = None
+                await loop.shutdown_default_executor()
+
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+        self.session.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+
+    def _begin_request(self):
+        with self._usage_lock:
+            self._in_flight += 1
+
+    def _end_request(self):
+        with self._usage_lock:
+            self._in_flight -= 1
+            idle_retired = self._retired and self._in_flight == 0
+        if idle_retired:
+            # May be running on the I/O loop, which close() stops and joins: close from a helper thread
+            threading.Thread(target=self._close_if_idle, name="llm-retire", daemon=True).start()
+
+    def _close_if_idle(self):
+        # Holding the usage lock keeps new requests from starting mid-close
+        with self._usage_lock:
+            if self._in_flight == 0:
+                self.close()
+
+    def retire(self):
+        """
+        Close the client once no request is in flight (immediately if idle).
+
+        For a shared client that has been replaced: callers still holding it
+        finish their requests normally, and any later use reopens what it
+        needs and releases it again when done.
+        """
+        with self._usage_lock:
+            self._retired = True
+        self._close_if_idle()
+
+    def __enter__(self) -> 'LLMClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def _get_async_client(self):
+        """Return the shared httpx.AsyncClient, rebuilt if the pool has grown."""
+        if self._async_client is not None and self._async_pool_size < self.pool_size:
+            await self._async_client.aclose()
+            self._async_client = None
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.pool_size * 2,
+                    max_keepalive_connections=self.pool_size * 2
+                ),
+                http2=HTTP2_AVAILABLE,
                 timeout=self.timeout
             )
-            response.raise_for_status()
+            self._async_pool_size = self.pool_size
 
-            data = response.json()
+        return self._async_client
 
-            # Extract response text
-            if "choices" in data and len(data["choices"]) > 0:
-                return data["choices"][0]["message"]["content"]
-            else:
-                raise ValueError(f"Unexpected response format: {data}")
+    @_tracked_request
+    async def achat(
+        self,
+        model: Optional[str] = None,
+        messages: List[Message] = None,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        response_format: Optional[Dict] = None,
+        extra_body: Optional[Dict] = None,
+        cache_prefix: Optional[str] = None,
+        stream: bool = False,
+        no_cache: bool = False
+    ) -> str:
+        """
+        Async version of chat(), usable from any event loop.
 
-        except requests.exceptions.RequestException as e:
+        Requests are sent from the client's own I/O loop so its keep-alive
+        connections are reused across calls. Without httpx, chat() runs in a
+        worker thread instead.
+        """
+        loop = self._get_loop()
+        if asyncio.get_running_loop() is not loop:
+            future = asyncio.run_coroutine_threadsafe(
+                self.achat(
+                    model, messages, temperature, top_p, max_tokens, stop, response_format, extra_body,
+                    cache_prefix, stream, no_cache
+                ),
+                loop
+            )
+            return await asyncio.wrap_future(future)
+
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(
+                self.chat, model, messages, temperature, top_p, max_tokens,
+                stop=stop, response_format=response_format, extra_body=extra_body,
+                cache_prefix=cache_prefix, stream=stream, no_cache=no_cache
+            )
+
+        url, payload, headers = self._build_request(
+            model, messages, temperature, top_p, max_tokens, stop, response_format, extra_body,
+            cache_prefix
+        )
+        cache_key = None if no_cache else self._response_cache_key(url, payload)
+        cache_state = "off" if cache_key is None else "miss"
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                record_llm_request(self.provider.value, payload["model"], "ok", "hit")
+                return cached
+
+        if stream:
+            payload["stream"] = True
+        started = time.perf_counter()
+        try:
+            response_text = await self._apost(url, payload, headers, stream)
+        except Exception:
+            record_llm_request(self.provider.value, payload["model"], "error", cache_state,
+                               time.perf_counter() - started)
+            raise
+        record_llm_request(self.provider.value, payload["model"], "ok", cache_state,
+                           time.perf_counter() - started)
+        self.last_success = time.monotonic()
+
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response_text)
+        return response_text
+
+    async def _apost(self, url: str, payload: Dict, headers: Dict[str, str], stream: bool) -> str:
+        """Async version of _post(), sent with httpx."""
+        client = await self._get_async_client()
+        tokens = self._estimate_tokens(payload)
+
+        try:
+            for attempt in range(self.max_retries):
+                await self.rate_limiter.aacquire(tokens)
+                if stream:
+                    async with client.stream("POST", url, json=payload, headers=headers) as response:
+                        if response.status_code == 429:
+                            self.rate_limiter.penalize(self._retry_after(response.headers))
+                        if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries - 1:
+                            delay = self._retry_delay(attempt, response.headers)
+                        elif response.status_code == 400 and self._downgrade_json_schema(
+                            (await response.aread()).decode(errors="replace"), payload
+                        ):
+                            delay = 0
+                        else:
+                            response.raise_for_status()
+                            parts = []
+                            async for line in response.aiter_lines():
+                                piece = self._stream_piece(line)
+                                if piece is None:
+                                    break
+                                parts.append(piece)
+                                if '}' in piece and self._is_complete_json(parts):
+                                    break
+                            return ''.join(parts)
+                    await asyncio.sleep(delay)
+                    continue
+
+                response = await client.post(url, json=payload, headers=headers)
+                if response.status_code == 429:
+                    self.rate_limiter.penalize(self._retry_after(response.headers))
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries - 1:
+                    await asyncio.sleep(self._retry_delay(attempt, response.headers))
+                    continue
+                if response.status_code == 400 and self._downgrade_json_schema(response.text, payload):
+                    continue
+                response.raise_for_status()
+
+                return self._extract_content(_json_loads(response.content))
+
+            raise RuntimeError("LLM request failed: no attempts left")
+
+        except httpx.HTTPError as e:
             raise RuntimeError(f"LLM request failed: {e}")
 
+    def submit_chat(self, messages: List[Message], **kwargs) -> Future:
+        """
+        Start a chat request on the client's I/O loop without waiting for it.
+
+        Takes the same keyword arguments as chat(). Returns a
+        concurrent.futures.Future resolving to the response text.
+        """
+        # Counted from now, not from when the coroutine starts on the loop
+        self._begin_request()
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self.achat(messages=messages, **kwargs), self._get_loop()
+            )
+        except BaseException:
+            self._end_request()
+            raise
+        future.add_done_callback(lambda _: self._end_request())
+        return future
+
+    async def abatch_chat(
+        self,
+        messages_batch: List[List[Message]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        response_format: Optional[Dict] = None,
+        extra_body: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        cache_prefix: Optional[str] = None,
+        no_cache: bool = False
+    ) -> List[Union[str, Exception]]:
+        """Async version of batch_chat(); see there for arguments and results."""
+        if not messages_batch:
+            return []
+
+        semaphore = asyncio.Semaphore(max_workers or len(messages_batch))
+
+        async def run(messages: List[Message]) -> Union[str, Exception]:
+            async with semaphore:
+                try:
+                    return await self.achat(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        top_p=top_p,
+                        max_tokens=max_tokens,
+                        stop=stop,
+                        response_format=response_format,
+                        extra_body=extra_body,
+                        cache_prefix=cache_prefix,
+                        no_cache=no_cache
+                    )
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(run(messages) for messages in messages_batch)))
+
+    def batch_chat(
+        self,
+        messages_batch: List[List[Message]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        response_format: Optional[Dict] = None,
+        extra_body: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        cache_prefix: Optional[str] = None,
+        no_cache: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Send a batch of chat completion requests in one submission.
+
+        OpenAI-compatible servers expose no standard batched chat endpoint, so the
+        whole batch is put in flight at once and the server's continuous batching
+        (vLLM, llama.cpp, LMStudio) schedules the requests together. Requests are
+        coroutines on the client's I/O loop (httpx when installed), so in-flight
+        requests cost no threads of their own.
+
+        Args:
+            messages_batch: One message list per conversation
+            model: Model to use (defaults to client's configured model)
+            temperature: Sampling temperature
+            top_p: Top-p sampling parameter
+            max_tokens: Maximum tokens to generate per conversation
+            stop: Sequences that end generation (not included in the response)
+            response_format: Structured-output constraint, see chat()
+            extra_body: Provider-specific payload fields, see chat()
+            max_workers: Maximum requests in flight (defaults to the batch size)
+            cache_prefix: Fixed prefix shared by every conversation, see chat()
+            no_cache: Skip the response cache, see chat()
+
+        Returns:
+            Response text per conversation, in input order. A failed request is
+            returned as its exception so one error does not discard the batch.
+        """
+        if not messages_batch:
+            return []
+
+        self._begin_request()
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self.abatch_chat(
+                    messages_batch, model, temperature, top_p, max_tokens, stop,
+                    response_format, extra_body, max_workers, cache_prefix, no_cache
+                ),
+                self._get_loop()
+            )
+            return future.result()
+        finally:
+            self._end_request()
+
     @classmethod
     def from_config(cls, config_path: Optional[str] = None) -> 'LLMClient':
         """
@@ -179,25 +1145,53 @@ class LLMClient:
         # Set longer timeout for LMStudio to handle JIT model loading
         timeout = 120 if provider == ProviderType.LMSTUDIO else 30
         
-        return cls(provider=provider, api_key=api_key, base_url=base_url, model=model, timeout=timeout)
+        client = cls(provider=provider, api_key=api_key, base_url=base_url, model=model, timeout=timeout)
+        client.rate_limiter = RateLimiter(config.get("llm_rpm"), config.get("llm_tpm"))
+
+        # Cache deterministic replies next to the config; a TTL of 0 disables it
+        cache_ttl = float(config.get("llm_response_cache_ttl", RESPONSE_CACHE_TTL))
+        if config and cache_ttl > 0:
+            client.response_cache = ResponseCache(cls._config_file().parent / "llm-cache.sqlite", ttl=cache_ttl)
+
+        return client
     
+    @classmethod
+    def _config_file(cls) -> Path:
+        """Location of llm-config.yaml: .collection/ under the working directory."""
+        return Path.cwd() / ".collection" / "llm-config.yaml"
+
     @classmethod
     def _discover_config(cls, custom_path: Optional[str] = None) -> Dict[str, str]:
         """
         Load configuration from .collection/llm-config.yaml ONLY.
         No environment variables, no global configs, no discovery cancer.
         """
-        config_path = Path.cwd() / ".collection" / "llm-config.yaml"
-        
-        if config_path.exists():
-            try:
-                return cls._load_config_file(config_path)
-            except Exception as e:
-                print(f"Error loading config from {config_path}: {e}")
-                return {}
-        
-        # If no config file exists, return empty dict (will use defaults)
-        return {}
+        config_path = cls._config_file()
+
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            # If no config file exists, return empty dict (will use defaults)
+            return {}
+
+        # Reuse the parsed file while it is unchanged (one stat per client)
+        cached = cls._config_cache.get(str(config_path))
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+
+        try:
+            config = cls._load_config_file(config_path)
+        except Exception as e:
+            print(f"Error loading config from {config_path}: {e}")
+            return {}
+
+        cls._config_cache[str(config_path)] = (mtime_ns, config)
+        return dict(config)
+
+    @classmethod
+    def clear_config_cache(cls):
+        """Forget parsed config files (for tests that rewrite them in place)."""
+        cls._config_cache.clear()
     
     @classmethod
     def _load_config_file(cls, config_path: Path) -> Dict[str, str]:
@@ -210,19 +1204,18 @@ class LLMClient:
             return cls._extract_yaml_from_markdown(content)
         else:
             # Parse as YAML
-            return yaml.safe_load(content) or {}
+            return yaml.load(content, Loader=SafeLoader) or {}
     
     @classmethod
     def _extract_yaml_from_markdown(cls, markdown_content: str) -> Dict[str, str]:
         """Extract YAML configuration from Markdown content."""
         # Find first yaml code block
-        yaml_pattern = r'```yaml\s*\n(.*?)\n```'
-        match = re.search(yaml_pattern, markdown_content, re.DOTALL | re.IGNORECASE)
+        match = YAML_BLOCK_PATTERN.search(markdown_content)
         
         if match:
             yaml_content = match.group(1)
             try:
-                return yaml.safe_load(yaml_content) or {}
+                return yaml.load(yaml_content, Loader=SafeLoader) or {}
             except yaml.YAMLError as e:
                 raise ValueError(f"Invalid YAML in Markdown: {e}")
         
@@ -234,26 +1227,93 @@ class LLMClient:
         return {}
 
 
+# Last client built by create_client_from_config: ((config file, mtime_ns), client)
+_shared_client: Optional[Tuple[Tuple[str, int], LLMClient]] = None
+_shared_client_lock = threading.Lock()
+
+
 def create_client_from_config(config_path: str = None) -> LLMClient:
     """
     Create LLM client from configuration using multi-location discovery.
+
+    The client is shared: while the config file is unchanged, every caller
+    (each pipeline stage, each web request) gets the same instance with its
+    warm connection pool. Callers must not close it; other threads may have
+    requests in flight on it. Editing the config builds a new client and
+    retires the old one, which closes once its in-flight requests finish.
     
     Args:
-        config_path: Optional custom config path (overrides discovery)
+        config_path: Unused; the config always comes from .collection/llm-config.yaml
     
     Returns:
         Configured LLMClient instance
     """
-    return LLMClient.from_config(config_path)
+    global _shared_client
+
+    config_file = LLMClient._config_file()
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    key = (str(config_file), mtime_ns)
+
+    with _shared_client_lock:
+        if _shared_client is not None and _shared_client[0] == key:
+            return _shared_client[1]
+
+        client = LLMClient.from_config(config_path)
+        previous, _shared_client = _shared_client, (key, client)
+
+    if previous is not None:
+        previous[1].retire()
+    return client
+
+
+# Successful connection tests: (base_url, api key fingerprint, deep model) -> checked_at
+_connection_checks: Dict[Tuple[str, str, Optional[str]], float] = {}
+
+# How long a successful connection test is trusted
+CONNECTION_CHECK_TTL = 60.0
 
 
 # Fast-fail: test LLM connectivity on import for critical systems
-def test_llm_connection(client: LLMClient, model: Optional[str] = None) -> bool:
+def test_llm_connection(client: LLMClient, model: Optional[str] = None, deep: bool = False) -> bool:
     """
     Test LLM connectivity with minimal request.
     Returns True if reachable, False otherwise.
     Fast-fail pattern for critical systems.
+
+    Asks GET /models first; only servers without that route, or deep=True
+    callers that need proof the model generates, get a chat round-trip
+    (max_tokens=1) with the given or default model. A success is reused
+    for CONNECTION_CHECK_TTL seconds per endpoint and key, so pipeline
+    stages sharing a client probe once; failures are never cached. A
+    shallow check also passes without a request when the client got a
+    reply within that window (e.g. from stage 0's placement requests).
     """
+    last_success = client.last_success
+    if not deep and last_success is not None and time.monotonic() - last_success < CONNECTION_CHECK_TTL:
+        return True
+
+    test_model = (model or client.get_default_model()) if deep else None
+    fingerprint = hashlib.blake2b((client.api_key or '').encode('utf-8'), digest_size=8).hexdigest()
+    check_key = (client.base_url, fingerprint, test_model)
+
+    checked_at = _connection_checks.get(check_key)
+    if checked_at is not None and time.monotonic() - checked_at < CONNECTION_CHECK_TTL:
+        return True
+
+    reachable = None if deep else client.ping()
+    if reachable is None:
+        reachable = _chat_probe(client, test_model or model)
+
+    if reachable:
+        _connection_checks[check_key] = time.monotonic()
+    return reachable
+
+
+def _chat_probe(client: LLMClient, model: Optional[str]) -> bool:
+    """One-token chat completion; True if the model answered."""
     try:
         # Use client's default model if none specified
         test_model = model or client.get_default_model()
@@ -261,7 +1321,9 @@ def test_llm_connection(client: LLMClient, model: Optional[str] = None) -> bool:
         response = client.chat(
             model=test_model,
             messages=[Message(role="user", content="ping")],
-            temperature=0.0
+            temperature=0.0,
+            max_tokens=1,
+            no_cache=True
         )
         return len(response) > 0
     except Exception:
@@ -11,7 +11,14 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import yaml
 
+# libyaml's C parser when available (same results as yaml.safe_load)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from llm import LLMClient, Message
+from describer import DEFAULT_MAX_WORKERS
 from plugin_interface import PluginRegistry, CollectionItem
 from analyzer import CollectionAnalyzer
 from events import EventEmitter, EventStage
@@ -87,26 +94,12 @@ class ContentProcessor:
         scanner_class = PluginRegistry.get_plugin(collection_type)
         
         if not scanner_class:
-            return {
-                'suggested_path': item_path,
-                'confidence': 0.0,
-                'reasoning': f"No scanner available for type: {collection_type}",
-                'category': 'utilities_misc'
-            }
+            return self._no_scanner_placement(item_path, collection_type)
 
         scanner = scanner_class()
 
         # Extract basic metadata
-        try:
-            stat = item_path.stat()
-            metadata = {
-                'size': stat.st_size,
-                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'is_directory': item_path.is_dir(),
-                'extension': item_path.suffix.lower() if item_path.is_file() else None
-            }
-        except OSError:
-            metadata = {'size': 0, 'created': datetime.now().isoformat()}
+        metadata = self._get_metadata(item_path)
 
         # Learn from existing structure - structure IS the memory
         collection_root = Path(collection_config['path'])
@@ -126,6 +119,94 @@ class ContentProcessor:
 
         return placement
 
+    def analyze_placements(
+        self,
+        item_paths: List[Path],
+        collection_config: Dict[str, Any],
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze placement for several new items at once.
+
+        Same result as analyze_content_placement() per item, but the existing
+        structure is learned once and the placement prompts go out together
+        through LLMClient.batch_chat, up to max_workers in flight.
+
+        Returns:
+            One placement analysis per item, in input order
+        """
+        if not item_paths:
+            return []
+
+        collection_type = collection_config['collection_type']
+        scanner_class = PluginRegistry.get_plugin(collection_type)
+
+        if not scanner_class:
+            return [self._no_scanner_placement(item_path, collection_type) for item_path in item_paths]
+
+        scanner = scanner_class()
+        collection_root = Path(collection_config['path'])
+        structural_patterns = self._learn_from_structure(collection_root, collection_config)
+
+        metadata = [self._get_metadata(item_path) for item_path in item_paths]
+        messages_batch = [
+            [Message(role="user", content=self._build_placement_prompt(
+                item_path, self._get_content_sample(item_path, scanner),
+                collection_config, item_metadata, structural_patterns
+            ))]
+            for item_path, item_metadata in zip(item_paths, metadata)
+        ]
+
+        if self.emitter:
+            self.emitter.info(f"Analyzing placement for {len(item_paths)} items")
+
+        responses = self.llm.batch_chat(
+            messages_batch,
+            model="gpt-oss-20b",
+            temperature=0.1,
+            max_tokens=300,
+            max_workers=max_workers
+        )
+
+        placements = []
+        for item_path, item_metadata, response in zip(item_paths, metadata, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                placements.append(self._parse_placement(
+                    response, item_path, collection_config, structural_patterns
+                ))
+            except Exception as e:
+                if self.emitter:
+                    self.emitter.warn(f"LLM placement analysis failed: {e}")
+                placements.append(self._structural_heuristic_placement(
+                    item_path, collection_config, item_metadata, structural_patterns
+                ))
+
+        return placements
+
+    def _no_scanner_placement(self, item_path: Path, collection_type: str) -> Dict[str, Any]:
+        """Placement result when the collection type has no scanner"""
+        return {
+            'suggested_path': item_path,
+            'confidence': 0.0,
+            'reasoning': f"No scanner available for type: {collection_type}",
+            'category': 'utilities_misc'
+        }
+
+    def _get_metadata(self, item_path: Path) -> Dict[str, Any]:
+        """Extract basic metadata for placement analysis"""
+        try:
+            stat = item_path.stat()
+            return {
+                'size': stat.st_size,
+                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                'is_directory': item_path.is_dir(),
+                'extension': item_path.suffix.lower() if item_path.is_file() else None
+            }
+        except OSError:
+            return {'size': 0, 'created': datetime.now().isoformat()}
+
     def _get_content_sample(self, item_path: Path, scanner) -> str:
         """Extract content sample for LLM analysis"""
         if item_path.is_file():
@@ -133,7 +214,7 @@ class ContentProcessor:
             try:
                 if item_path.suffix.lower() in ['.txt', '.md', '.py', '.js', '.ts', '.json']:
                     with open(item_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        return f.read()[:2000]  # First 2000 chars
+                        return f.read(2000)  # First 2000 chars
             except Exception:
                 pass
             return f"File: {item_path.name} ({item_path.suffix})"
@@ -153,7 +234,7 @@ class ContentProcessor:
                     if readme_path.exists():
                         try:
                             with open(readme_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content_summary += f"\n{pattern}:\n{f.read()[:1000]}"
+                                content_summary += f"\n{pattern}:\n{f.read(1000)}"
                                 break
                         except Exception:
                             continue
@@ -189,7 +270,7 @@ class ContentProcessor:
             index_path = collection_root / '.collection' / 'index.yaml'
             if index_path.exists():
                 with open(index_path, 'r', encoding='utf-8') as f:
-                    index_data = yaml.safe_load(f) or []
+                    index_data = yaml.load(f, Loader=SafeLoader) or []
                 
                 # Extract category → folder mapping from reality
                 for item in index_data:
@@ -260,10 +341,39 @@ class ContentProcessor:
         structural_patterns: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Use LLM to analyze content and suggest placement with structural context"""
-        
+        prompt = self._build_placement_prompt(
+            item_path, content_sample, collection_config, metadata, structural_patterns
+        )
+
+        try:
+            response = self.llm.chat(
+                model="gpt-oss-20b",
+                messages=[Message(role="user", content=prompt)],
+                temperature=0.1,
+                max_tokens=300
+            )
+            return self._parse_placement(response, item_path, collection_config, structural_patterns)
+
+        except Exception as e:
+            if self.emitter:
+                self.emitter.warn(f"LLM placement analysis failed: {e}")
+            
+            # Fallback to structural heuristics
+            return self._structural_heuristic_placement(
+                item_path, collection_config, metadata, structural_patterns
+            )
+
+    def _build_placement_prompt(
+        self,
+        item_path: Path,
+        content_sample: str,
+        collection_config: Dict[str, Any],
+        metadata: Dict[str, Any],
+        structural_patterns: Dict[str, Any]
+    ) -> str:
+        """Build the placement prompt with structural context"""
         categories = collection_config.get('categories', ['utilities_misc'])
-        collection_root = Path(collection_config['path'])
-        
+
         # Build structural context for LLM
         structural_context = ""
         if structural_patterns['category_folders']:
@@ -309,55 +419,51 @@ Respond with JSON:
   "reasoning": "Brief explanation referencing existing patterns"
 }}"""
 
-        try:
-            response = self.llm.chat(
-                model="gpt-oss-20b",
-                messages=[Message(role="user", content=prompt)],
-                temperature=0.1,
-                max_tokens=300
-            )
+        return prompt
 
-            # Parse JSON response
-            import json
-            result = json.loads(response.strip())
-            
-            # Validate category
-            suggested_category = result.get('category', 'utilities_misc')
-            if suggested_category not in categories:
-                suggested_category = categories[-1]  # Default to last category
-            
-            # Build suggested path using structural patterns
-            suggested_folder = result.get('suggested_folder', suggested_category)
-            
-            # If we have structural patterns, prefer existing folder structure
-            if (suggested_category in structural_patterns['category_folders'] and 
-                structural_patterns['category_folders'][suggested_category]):
-                # Use most common folder for this category
-                most_common_folder = max(
-                    structural_patterns['category_folders'][suggested_category].items(),
-                    key=lambda x: x[1]
-                )[0]
-                suggested_folder = most_common_folder
-            
-            suggested_path = collection_root / suggested_folder / item_path.name
-            
-            return {
-                'suggested_path': suggested_path,
-                'category': suggested_category,
-                'confidence': float(result.get('confidence', 0.5)),
-                'reasoning': result.get('reasoning', 'LLM analysis with structural context'),
-                'suggested_folder': suggested_folder,
-                'structural_patterns_used': bool(structural_patterns['category_folders'])
-            }
+    def _parse_placement(
+        self,
+        response: str,
+        item_path: Path,
+        collection_config: Dict[str, Any],
+        structural_patterns: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Turn the LLM's JSON reply into a placement; raises if it is not valid JSON"""
+        categories = collection_config.get('categories', ['utilities_misc'])
+        collection_root = Path(collection_config['path'])
 
-        except Exception as e:
-            if self.emitter:
-                self.emitter.warn(f"LLM placement analysis failed: {e}")
-            
-            # Fallback to structural heuristics
-            return self._structural_heuristic_placement(
-                item_path, collection_config, metadata, structural_patterns
-            )
+        # Parse JSON response
+        import json
+        result = json.loads(response.strip())
+        
+        # Validate category
+        suggested_category = result.get('category', 'utilities_misc')
+        if suggested_category not in categories:
+            suggested_category = categories[-1]  # Default to last category
+        
+        # Build suggested path using structural patterns
+        suggested_folder = result.get('suggested_folder', suggested_category)
+        
+        # If we have structural patterns, prefer existing folder structure
+        if (suggested_category in structural_patterns['category_folders'] and 
+            structural_patterns['category_folders'][suggested_category]):
+            # Use most common folder for this category
+            most_common_folder = max(
+                structural_patterns['category_folders'][suggested_category].items(),
+                key=lambda x: x[1]
+            )[0]
+            suggested_folder = most_common_folder
+        
+        suggested_path = collection_root / suggested_folder / item_path.name
+        
+        return {
+            'suggested_path': suggested_path,
+            'category': suggested_category,
+            'confidence': float(result.get('confidence', 0.5)),
+            'reasoning': result.get('reasoning', 'LLM analysis with structural context'),
+            'suggested_folder': suggested_folder,
+            'structural_patterns_used': bool(structural_patterns['category_folders'])
+        }
 
     def _structural_heuristic_placement(
         self, 
@@ -454,7 +560,7 @@ Respond with JSON:
             return []
 
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
 
         # Detect new content
         new_items = self.detect_new_content(collection_path)
@@ -464,14 +570,14 @@ Respond with JSON:
                 self.emitter.info("No new content detected")
             return []
 
+        # Analyze placement for all items concurrently
+        placements = self.analyze_placements(new_items, config)
+
         results = []
         
-        for i, item_path in enumerate(new_items, 1):
+        for i, (item_path, placement) in enumerate(zip(new_items, placements), 1):
             if self.emitter:
                 self.emitter.set_progress(i, item_path.name)
-
-            # Analyze placement
-            placement = self.analyze_content_placement(item_path, config)
             
             # Decide whether to auto-file
             should_auto_file = (
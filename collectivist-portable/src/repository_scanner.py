@@ -222,7 +222,7 @@ Generate a JSON response with:
 1. "description": A single-sentence description (max 150 characters) that captures the repository's core purpose. Be concise and technical. Do not include 'This is' or 'A repository for'. Start directly with the purpose.
 2. "category": ONE category from the list above that best matches this repository.
 
-Example format:
+Respond with exactly one JSON object of this shape and nothing else:
 {{"description": "Advanced task management system with Obsidian integration and MCP server", "category": "dev_tools"}}
 
 JSON Response:"""
@@ -249,7 +249,7 @@ JSON Response:"""
             if readme_path.exists():
                 try:
                     with open(readme_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        return f.read()[:3000]
+                        return f.read(3000)
                 except Exception:
                     continue
 
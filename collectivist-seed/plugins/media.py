@@ -631,8 +631,8 @@ Generate a JSON response with:
 1. "description": A single-sentence description (max 150 characters) that captures what this media file likely contains based on filename and metadata. Be descriptive and specific.
 2. "category": ONE category from the list above that best matches this media file.
 
-Example format:
-{"description": "Professional landscape photograph captured with DSLR camera showing mountain scenery at sunset", "category": "photography"}
+Respond with exactly one JSON object of this shape and nothing else:
+{{"description": "Professional landscape photograph captured with DSLR camera showing mountain scenery at sunset", "category": "photography"}}
 
 JSON Response:"""
 
@@ -241,7 +241,7 @@ Generate a JSON response with:
 1. "description": A single-sentence description (max 150 characters) that captures the note's core purpose. Be concise and capture the essence of the knowledge contained.
 2. "category": ONE category from the list above that best matches this note.
 
-Example format:
+Respond with exactly one JSON object of this shape and nothing else:
 {{"description": "Comprehensive guide to knowledge management systems and note-taking methodologies", "category": "knowledge_base"}}
 
 JSON Response:"""
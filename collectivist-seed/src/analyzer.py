@@ -4,23 +4,139 @@ Analyzer Stage - Collection Type Detection
 Uses LLM to inspect directory and determine collection type, then generates collection.yaml
 """
 
+import hashlib
 import json
+import logging
+import os
+import random
+import re
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import yaml
 
+# libyaml's C parser when available (same results as yaml.safe_load)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from llm import LLMClient, Message
 from plugin_interface import PluginRegistry
-from schema_definitions import get_collection_schema, generate_collection_config, list_collection_types
+from schema_definitions import (
+    EXTENSION_TYPES, SHARED_EXTENSIONS, get_collection_schema, generate_collection_config, list_collection_types
+)
 from events import EventEmitter, EventStage
 
 
+# Library-style callers get no output unless they configure logging (the CLI does on --verbose)
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+# Extension scoring is trusted over the LLM when the best type outscores the
+# runner-up plus every ambiguous (shared-extension) file by this factor and is
+# backed by more than this many items
+SCORE_MARGIN = 2.0
+MIN_SCORED_ITEMS = 5
+
+# Weight of each sampled directory towards "repositories" when git repos are present
+GIT_REPO_PRIOR = 1.0
+
+# Extensions the no-LLM fallback treats as media or document collections
+_MEDIA_EXTS = frozenset({'.mp4', '.mkv', '.avi', '.mp3', '.flac', '.wav', '.jpg', '.png', '.gif'})
+_DOC_EXTS = frozenset({'.pdf', '.doc', '.docx', '.txt', '.md'})
+
+# Runs of collection-type name characters in a lowercased LLM reply
+_TYPE_RE = re.compile(r'[a-z_]+')
+
+# Reply budget per detected type (a single type name)
+DETECTION_MAX_TOKENS = 50
+
+# README names recognized at the collection root (case-insensitive), best first
+README_PRIORITY = {'readme.md': 0, 'readme': 1, 'readme.txt': 2}
+
+# LLM-detected types by inspection fingerprint, kept in each collection's .collection/
+DETECTION_CACHE_NAME = "type-detect.json"
+
+
+def find_collection_config(path: Path) -> Optional[Path]:
+    """Existing collection.yaml of a collection (.collection/ first, then the legacy root copy), or None"""
+    for config_path in (path / '.collection' / 'collection.yaml', path / 'collection.yaml'):
+        if config_path.is_file():
+            return config_path
+    return None
+
+
 class CollectionAnalyzer:
     """Analyzes directories to determine collection type and generate configuration"""
 
-    def __init__(self, llm_client: LLMClient, event_emitter: Optional[EventEmitter] = None):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        event_emitter: Optional[EventEmitter] = None,
+        detection_cache_path: Optional[Path] = None
+    ):
         self.llm = llm_client
         self.emitter = event_emitter
+        # None: each analyzed collection keeps its own cache in its .collection/
+        self.detection_cache_path = detection_cache_path
+        self._detections: Dict[Path, Dict[str, str]] = {}
+
+        # Schemas are fixed at import: render the prompt's type list once
+        self._type_info = '\n'.join(
+            f"- {collection_type}: {get_collection_schema(collection_type).description}"
+            for collection_type in list_collection_types()
+        )
+        self._valid_types = frozenset(list_collection_types())
+
+    def _detection_cache_file(self, inspection: Dict[str, Any]) -> Path:
+        """Detection cache file for an inspected directory"""
+        if self.detection_cache_path:
+            return self.detection_cache_path
+        return Path(inspection['path']) / ".collection" / DETECTION_CACHE_NAME
+
+    def _load_detections(self, cache_file: Path) -> Dict[str, str]:
+        """Read a detection cache (once per file); a missing or corrupt file is an empty cache"""
+        if cache_file not in self._detections:
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    detections = json.load(f)
+            except (OSError, ValueError):
+                detections = {}
+            self._detections[cache_file] = detections if isinstance(detections, dict) else {}
+        return self._detections[cache_file]
+
+    def _save_detections(self, cache_file: Path):
+        """Write a detection cache via temp file + rename (best effort)"""
+        tmp_path = cache_file.with_name(f".{cache_file.name}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._detections[cache_file], f, indent=2, sort_keys=True)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _remember_detection(self, inspection: Dict[str, Any], cache_key: str, collection_type: str) -> Path:
+        """Record an LLM-detected type in the directory's detection cache; returns the cache file"""
+        cache_file = self._detection_cache_file(inspection)
+        self._load_detections(cache_file)[cache_key] = collection_type
+        return cache_file
+
+    @staticmethod
+    def _cache_key(inspection: Dict[str, Any]) -> str:
+        """Fingerprint of everything the detection prompt is built from"""
+        readme = inspection.get('readme_content') or ''
+        fingerprint = {
+            'file_types': inspection['file_types'],
+            'directory_names': sorted(inspection['directory_names']),
+            'file_samples': sorted(inspection['file_samples']),
+            'has_git_repos': inspection['has_git_repos'],
+            'readme': hashlib.blake2b(readme.encode('utf-8'), digest_size=16).hexdigest()
+        }
+        canonical = json.dumps(fingerprint, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=32).hexdigest()
 
     def inspect_directory(self, path: Path, max_depth: int = 2, max_samples: int = 20) -> Dict[str, Any]:
         """
@@ -42,58 +158,76 @@ class CollectionAnalyzer:
             'readme_content': None
         }
 
-        # Walk directory up to max_depth
-        items = []
-        for item in path.iterdir():
-            if item.name.startswith('.'):
-                continue
-            items.append(item)
-            if len(items) >= max_samples:
-                break
-
-        # Analyze items
-        for item in items:
+        file_types = Counter()
+        readme_path, readme_rank = None, len(README_PRIORITY)
+
+        # Reservoir-sample the whole listing (Algorithm R) so the sample is not
+        # skewed towards the first entries the filesystem returns. Seeded by the
+        # path, so an unchanged directory yields the same sample (and cache key).
+        rng = random.Random(str(path))
+        sample = []
+        seen = 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+
+                # Look for README at collection root
+                rank = README_PRIORITY.get(entry.name.lower(), readme_rank)
+                if rank < readme_rank and entry.is_file():
+                    readme_path, readme_rank = entry.path, rank
+
+                if seen < max_samples:
+                    sample.append(entry)
+                else:
+                    slot = rng.randrange(seen + 1)
+                    if slot < max_samples:
+                        sample[slot] = entry
+                seen += 1
+
+        # Analyze the sample; DirEntry caches the type from the listing
+        for entry in sample:
             inspection['total_items'] += 1
 
-            if item.is_dir():
+            if entry.is_dir():
                 inspection['total_dirs'] += 1
-                inspection['directory_names'].append(item.name)
+                inspection['directory_names'].append(entry.name)
 
                 # Check if git repo
-                if (item / '.git').exists():
+                if not inspection['has_git_repos'] and os.path.exists(os.path.join(entry.path, '.git')):
                     inspection['has_git_repos'] = True
 
-            elif item.is_file():
+            elif entry.is_file():
                 inspection['total_files'] += 1
-                inspection['file_samples'].append(item.name)
-
-                # Track file extensions
-                ext = item.suffix.lower()
-                if ext:
-                    inspection['file_types'][ext] = inspection['file_types'].get(ext, 0) + 1
-
-        # Look for README at collection root
-        readme_patterns = ['README.md', 'readme.md', 'README', 'Readme.md']
-        for pattern in readme_patterns:
-            readme_path = path / pattern
-            if readme_path.exists():
-                try:
-                    with open(readme_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        inspection['readme_content'] = f.read()[:2000]
-                        break
-                except Exception:
-                    continue
+                inspection['file_samples'].append(entry.name)
+
+                # Track file extensions (a trailing dot is no extension, as with Path.suffix)
+                ext = os.path.splitext(entry.name)[1].lower()
+                if len(ext) > 1:
+                    file_types[ext] += 1
+
+        inspection['file_types'] = dict(file_types)
+
+        if readme_path is not None:
+            try:
+                with open(readme_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    inspection['readme_content'] = f.read(2000)
+            except Exception:
+                pass
 
         return inspection
 
     def generate_collection_config(
         self,
         path: Path,
-        force_type: Optional[str] = None
+        force_type: Optional[str] = None,
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Generate collection.yaml schema configuration.
 
+        If the collection already has a collection.yaml, it is returned as is
+        (no inspection, no LLM) unless force_type or refresh is given.
         If force_type is specified, skip LLM detection and use that type.
         Otherwise, use LLM to analyze directory and determine type.
 
@@ -103,6 +237,15 @@ class CollectionAnalyzer:
             self.emitter.set_stage(EventStage.ANALYZE)
             self.emitter.info("Starting collection analysis")
 
+        existing_path = None if force_type or refresh else find_collection_config(path)
+        if existing_path:
+            with open(existing_path, 'r', encoding='utf-8') as f:
+                config = yaml.load(f, Loader=SafeLoader)
+            if isinstance(config, dict) and config.get('collection_type'):
+                if self.emitter:
+                    self.emitter.complete_stage(f"Using existing collection schema: {existing_path}")
+                return config
+
         # Inspect directory
         if self.emitter:
             self.emitter.info("Inspecting directory structure")
@@ -114,9 +257,9 @@ class CollectionAnalyzer:
                 self.emitter.info(f"Using forced collection type: {force_type}")
             collection_type = force_type
         else:
-            # Use LLM to determine type
+            # Score file types, falling back to the LLM when ambiguous
             if self.emitter:
-                self.emitter.info("Querying LLM for collection type detection")
+                self.emitter.info("Detecting collection type (file types first, LLM if ambiguous)")
             collection_type = self._detect_collection_type(inspection)
             if self.emitter:
                 self.emitter.success(f"Collection type detected: {collection_type}")
@@ -144,28 +287,39 @@ class CollectionAnalyzer:
 
         return config
 
-    def _detect_collection_type(self, inspection: Dict[str, Any]) -> str:
+    def _score_collection_type(self, inspection: Dict[str, Any]) -> Optional[str]:
         """
-        Use LLM to detect collection type from inspection data.
-        Returns collection type name (e.g., 'repositories', 'media', 'documents')
+        Score collection types against the sampled file extensions.
+        Returns the winning type when the signal is unambiguous, otherwise None.
         """
-        # Get available collection types from schema definitions
-        available_types = list_collection_types()
-        type_descriptions = []
-        
-        for collection_type in available_types:
-            schema = get_collection_schema(collection_type)
-            type_descriptions.append(f"- {collection_type}: {schema.description}")
-        
-        type_info = '\n'.join(type_descriptions)
-
-        # Build prompt
-        prompt = f"""You are analyzing a directory to determine what type of collection it contains.
-
-Available collection types:
-{type_info}
-
-Directory inspection:
+        scores = defaultdict(float)
+        ambiguous = 0  # Files whose extension several types list
+
+        for ext, count in inspection['file_types'].items():
+            collection_type = EXTENSION_TYPES.get(ext)
+            if collection_type:
+                scores[collection_type] += count
+            elif ext in SHARED_EXTENSIONS:
+                ambiguous += count
+
+        if inspection['has_git_repos']:
+            scores['repositories'] += inspection['total_dirs'] * GIT_REPO_PRIOR
+
+        if not scores:
+            return None
+
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        top = ranked[0]
+        runner_up = scores[ranked[1]] if len(ranked) > 1 else 0.0
+
+        if scores[top] > SCORE_MARGIN * (runner_up + ambiguous) and scores[top] > MIN_SCORED_ITEMS:
+            return top
+        return None
+
+    @staticmethod
+    def _inspection_summary(inspection: Dict[str, Any]) -> str:
+        """Prompt block describing one inspected directory"""
+        return f"""Directory inspection:
 - Total items: {inspection['total_items']}
 - Directories: {inspection['total_dirs']}
 - Files: {inspection['total_files']}
@@ -175,7 +329,42 @@ Directory inspection:
 - Sample file names: {', '.join(inspection['file_samples'][:10])}
 
 README content (if present):
-{inspection.get('readme_content', 'No README found')[:500]}
+{(inspection['readme_content'] or 'No README found')[:500]}"""
+
+    def _local_detection(self, inspection: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Detect collection type without the LLM: extension scores, then the detection cache.
+        Returns (collection type or None, detection cache key or None if scores decided)
+        """
+        collection_type = self._score_collection_type(inspection)
+        if collection_type:
+            return collection_type, None
+
+        # Same directory contents as a previous run: reuse the LLM's answer
+        cache_key = self._cache_key(inspection)
+        cached_type = self._load_detections(self._detection_cache_file(inspection)).get(cache_key)
+        if cached_type in self._valid_types:
+            return cached_type, cache_key
+        return None, cache_key
+
+    def _detect_collection_type(self, inspection: Dict[str, Any]) -> str:
+        """
+        Detect collection type from inspection data.
+        Unambiguous extension scores decide locally, then the detection cache;
+        otherwise the LLM is asked.
+        Returns collection type name (e.g., 'repositories', 'media', 'documents')
+        """
+        collection_type, cache_key = self._local_detection(inspection)
+        if collection_type:
+            return collection_type
+
+        # Build prompt
+        prompt = f"""You are analyzing a directory to determine what type of collection it contains.
+
+Available collection types:
+{self._type_info}
+
+{self._inspection_summary(inspection)}
 
 Based on this inspection, determine the collection type. Respond with ONLY the collection type name (e.g., "repositories", "media", "documents").
 
@@ -186,13 +375,15 @@ Collection type:"""
             response = self.llm.chat(
                 messages=[Message(role="user", content=prompt)],
                 temperature=0.1,
-                max_tokens=50
+                max_tokens=DETECTION_MAX_TOKENS
             )
 
-            collection_type = response.strip().lower().replace('"', '')
+            # First known type name in the reply (ignores fences, quotes, "type:" prefixes)
+            collection_type = self._parse_type(response)
 
             # Validate against available types
-            if collection_type in available_types:
+            if collection_type in self._valid_types:
+                self._save_detections(self._remember_detection(inspection, cache_key, collection_type))
                 return collection_type
             else:
                 # Fallback: use heuristics
@@ -202,6 +393,106 @@ Collection type:"""
             print(f"LLM detection failed: {e}, falling back to heuristics")
             return self._heuristic_detection(inspection)
 
+    def analyze_many(self, paths: List[Path]) -> List[str]:
+        """
+        Detect the collection type of several directories with at most one LLM request.
+
+        Each directory is inspected locally first; those the extension scores or
+        detection cache settle never reach the LLM. The rest are numbered in a
+        single prompt that asks for a JSON array of types, one per directory.
+        Unusable labels (or an unusable reply) fall back to heuristics per path.
+
+        Returns collection type names in the order of paths
+        """
+        inspections = [self.inspect_directory(path) for path in paths]
+        collection_types: List[Optional[str]] = [None] * len(paths)
+        pending = []  # (index, cache key) of directories that need the LLM
+
+        for index, inspection in enumerate(inspections):
+            collection_type, cache_key = self._local_detection(inspection)
+            if collection_type:
+                collection_types[index] = collection_type
+            else:
+                pending.append((index, cache_key))
+
+        if len(pending) == 1:
+            # One directory left: the single-directory prompt (and its response cache entry)
+            index, _ = pending[0]
+            collection_types[index] = self._detect_collection_type(inspections[index])
+        elif pending:
+            labels = self._request_types([inspections[index] for index, _ in pending])
+            updated = set()  # cache files with new entries
+            for (index, cache_key), label in zip(pending, labels):
+                if label in self._valid_types:
+                    collection_types[index] = label
+                    updated.add(self._remember_detection(inspections[index], cache_key, label))
+                else:
+                    collection_types[index] = self._heuristic_detection(inspections[index])
+            for cache_file in updated:
+                self._save_detections(cache_file)
+
+        return collection_types
+
+    def _request_types(self, inspections: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Ask for the types of several inspected directories in one request; None per unusable label"""
+        count = len(inspections)
+        sections = [
+            f"=== DIRECTORY {number} ===\n{self._inspection_summary(inspection)}"
+            for number, inspection in enumerate(inspections, 1)
+        ]
+        prompt = f"""You are analyzing {count} directories to determine what type of collection each contains.
+
+Available collection types:
+{self._type_info}
+
+{chr(10).join(sections)}
+
+Based on these inspections, determine the collection type of each directory. Respond with ONLY a JSON object {{"types": [...]}} holding exactly {count} collection type names, in directory order."""
+
+        try:
+            response = self.llm.chat(
+                messages=[Message(role="user", content=prompt)],
+                temperature=0.1,
+                max_tokens=DETECTION_MAX_TOKENS * count,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "collection_types",
+                        "schema": {
+                            "type": "object",
+                            "required": ["types"],
+                            "properties": {
+                                "types": {
+                                    "type": "array",
+                                    "minItems": count,
+                                    "maxItems": count,
+                                    "items": {"type": "string", "enum": list(list_collection_types())}
+                                }
+                            },
+                            "additionalProperties": False
+                        }
+                    }
+                }
+            )
+            data = json.loads(response)
+        except Exception as e:
+            print(f"LLM detection failed: {e}, falling back to heuristics")
+            return [None] * count
+
+        labels = data.get('types') if isinstance(data, dict) else data
+        if not isinstance(labels, list) or len(labels) != count:
+            print("LLM detection returned an unusable reply, falling back to heuristics")
+            return [None] * count
+
+        return [self._parse_type(label) if isinstance(label, str) else None for label in labels]
+
+    def _parse_type(self, text: str) -> Optional[str]:
+        """First valid collection type name appearing in text, or None"""
+        for word in _TYPE_RE.findall(text.lower()):
+            if word in self._valid_types:
+                return word
+        return None
+
     def _heuristic_detection(self, inspection: Dict[str, Any]) -> str:
         """
         Fallback heuristic-based detection when LLM fails.
@@ -211,13 +502,11 @@ Collection type:"""
             return "repositories"
 
         # Check file types for media
-        media_extensions = {'.mp4', '.mkv', '.avi', '.mp3', '.flac', '.wav', '.jpg', '.png', '.gif'}
-        if any(ext in media_extensions for ext in inspection['file_types'].keys()):
+        if not _MEDIA_EXTS.isdisjoint(inspection['file_types']):
             return "media"
 
         # Check for documents
-        doc_extensions = {'.pdf', '.doc', '.docx', '.txt', '.md'}
-        if any(ext in doc_extensions for ext in inspection['file_types'].keys()):
+        if not _DOC_EXTS.isdisjoint(inspection['file_types']):
             return "documents"
 
         # Default to utilities_misc
@@ -227,15 +516,27 @@ Collection type:"""
         self,
         path: Path,
         force_type: Optional[str] = None,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        refresh: bool = False
     ) -> Path:
         """
         Analyze directory and create collection.yaml schema file.
 
+        An existing collection.yaml is kept (and its path returned) unless
+        force_type, refresh or an explicit output_path is given.
+
         Returns path to created collection.yaml
         """
+        existing_path = None if force_type or refresh or output_path else find_collection_config(path)
+        if existing_path:
+            if self.emitter:
+                self.emitter.success(f"Using existing collection schema: {existing_path}")
+            else:
+                log.info("[OK] Using existing collection schema: %s", existing_path)
+            return existing_path
+
         # Generate config
-        config = self.generate_collection_config(path, force_type=force_type)
+        config = self.generate_collection_config(path, force_type=force_type, refresh=True)
 
         # Determine output path - save in .collection directory
         if output_path is None:
@@ -243,29 +544,31 @@ Collection type:"""
             collection_dir.mkdir(exist_ok=True)
             output_path = collection_dir / 'collection.yaml'
 
-        # Save config
+        # Save config with the pure-Python safe emitter: libyaml's escapes astral
+        # characters, which would write status glyphs as "\U0001F3B5" in this hand-edited file
         with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            yaml.dump(config, f, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
         if self.emitter:
             self.emitter.success(f"Created collection schema: {output_path}")
         else:
-            print(f"[OK] Created collection schema: {output_path}")
-            print(f"  Type: {config['collection_type']}")
-            print(f"  Status: {config['status']}")
-            print(f"  Name: {config['name']}")
-            print(f"  Categories: {len(config['categories'])}")
+            log.info("[OK] Created collection schema: %s", output_path)
+            log.info("  Type: %s", config['collection_type'])
+            log.info("  Status: %s", config['status'])
+            log.info("  Name: %s", config['name'])
+            log.info("  Categories: %d", len(config['categories']))
 
         return output_path
 
 
-def analyze_collection(collection_path: str, force_type: Optional[str] = None) -> Path:
+def analyze_collection(collection_path: str, force_type: Optional[str] = None, refresh: bool = False) -> Path:
     """
     CLI helper: analyze a directory and create collection.yaml
 
     Args:
         collection_path: Path to directory to analyze
         force_type: Optional collection type to force (skip LLM detection)
+        refresh: Re-detect even if collection.yaml already exists
 
     Returns:
         Path to created collection.yaml
@@ -280,7 +583,7 @@ def analyze_collection(collection_path: str, force_type: Optional[str] = None) -
 
     # Analyze and create collection
     path = Path(collection_path).resolve()
-    return analyzer.create_collection(path, force_type=force_type)
+    return analyzer.create_collection(path, force_type=force_type, refresh=refresh)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache for The Collectivist
+Exact-match SQLite store of LLM replies: the client's chat replies, keyed by
+the full request, and the describer's parsed descriptions
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Entries older than this are ignored and purged on open
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Expiry time of entries cached without a TTL
+NEVER_EXPIRES = float("inf")
+
+# Sampled replies above this temperature are meant to vary; never cache them
+MAX_CACHEABLE_TEMPERATURE = 0.1
+
+
+class ResponseCache:
+    """
+    On-disk cache of LLM replies.
+
+    Keys are the BLAKE2b hash of the canonicalized request (provider,
+    endpoint and JSON payload: model, messages, sampling settings,
+    response format), so any change to the prompt or options is a miss.
+    Re-running analysis on an unchanged collection answers from here
+    instead of the network.
+
+    Entries expire after ttl seconds, or never when ttl is None. The
+    connection is shared by all threads using the cache, so every
+    statement runs under a lock.
+    """
+
+    def __init__(self, db_path: Path, ttl: Optional[float] = DEFAULT_TTL):
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(provider: str, url: str, payload: Dict[str, Any]) -> str:
+        """Hash a request into a cache key."""
+        canonical = json.dumps(
+            {"p": provider, "u": url, "b": payload},
+            sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=32).hexdigest()
+
+    @staticmethod
+    def cacheable(payload: Dict[str, Any]) -> bool:
+        """Whether a reply to this payload is deterministic enough to reuse."""
+        return payload.get("temperature", 1.0) <= MAX_CACHEABLE_TEMPERATURE
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily (and again after close()) so idle clients hold no handle
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            if columns and "expires" not in columns:
+                # Describer cache from before it shared this store: keep its entries, unexpiring
+                conn.execute("ALTER TABLE responses RENAME TO responses_legacy")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            if columns and "expires" not in columns:
+                conn.execute(
+                    "INSERT INTO responses (key, response, expires) "
+                    "SELECT key, response, ? FROM responses_legacy", (NEVER_EXPIRES,)
+                )
+                conn.execute("DROP TABLE responses_legacy")
+            conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the unexpired reply stored under key, or None."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM responses WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response: str):
+        """Store a reply under key for ttl seconds (for good if ttl is None)."""
+        expires = NEVER_EXPIRES if self.ttl is None else time.time() + self.ttl
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires) VALUES (?, ?, ?)",
+                (key, response, expires)
+            )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Metrics - The Collectivist
+Prometheus counters and timers for LLM requests, index I/O and pipeline stages
+"""
+
+import functools
+from contextlib import contextmanager
+
+# Optional dependency: without prometheus_client every recorder is a no-op
+try:
+    from prometheus_client import Counter, Histogram, start_http_server
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+if PROMETHEUS_AVAILABLE:
+    LLM_REQUESTS = Counter(
+        "llm_requests_total",
+        "LLM chat requests, by outcome and response cache result",
+        labelnames=["provider", "model", "status", "cache"]
+    )
+    LLM_SECONDS = Histogram(
+        "llm_request_seconds",
+        "Wall time of LLM chat requests sent to the provider",
+        buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+    )
+    STAGE_SECONDS = Histogram(
+        "stage_seconds",
+        "Wall time of pipeline stages and index I/O",
+        labelnames=["stage"]
+    )
+
+_exporter_port = None
+
+
+def start_exporter(port: int) -> bool:
+    """
+    Serve /metrics on the given port from a daemon thread.
+
+    Returns False (with a warning) when prometheus_client is not installed.
+    Starting twice on the same port is a no-op.
+    """
+    global _exporter_port
+    if not PROMETHEUS_AVAILABLE:
+        print("[!] prometheus_client not installed, metrics exporter disabled (pip install prometheus-client)")
+        return False
+    if _exporter_port != port:
+        start_http_server(port)
+        _exporter_port = port
+    return True
+
+
+def record_llm_request(provider: str, model: str, status: str, cache: str, seconds: float = None):
+    """Count one chat request; seconds is only observed for requests that reached the provider."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    LLM_REQUESTS.labels(provider, model, status, cache).inc()
+    if seconds is not None:
+        LLM_SECONDS.observe(seconds)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """Observe the wall time of the enclosed block under stage_seconds{stage=...}."""
+    if not PROMETHEUS_AVAILABLE:
+        yield
+        return
+    with STAGE_SECONDS.labels(stage).time():
+        yield
+
+
+def timed(stage: str):
+    """Decorator form of stage_timer()."""
+    def decorator(func):
+        if not PROMETHEUS_AVAILABLE:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with STAGE_SECONDS.labels(stage).time():
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -5,26 +5,63 @@ Orchestrates: Analyzer → Scanner → Describer → README Generator
 """
 
 import sys
+import os
+import copy
+import functools
+import hashlib
+import json
+import math
+import mmap
+import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, Dict, Any
+from typing import Optional, Dict, Any, Dict, Any, Iterator, Union
 import yaml
 
 from llm import create_client_from_config, test_llm_connection
 from plugin_interface import PluginRegistry, CollectionItem
 from analyzer import CollectionAnalyzer
-from describer import CollectionDescriber
+from describer import (
+    CollectionDescriber, batch_size_arg, items_per_request_from_config, max_workers_arg,
+    resolve_max_workers, semantic_threshold_from_config
+)
 from events import EventEmitter, create_console_emitter
+from metrics import stage_timer, start_exporter, timed
 from organic import ContentProcessor
 
+# Faster JSON for the deltas log when available; falls back to the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Advisory file locking for the index: fcntl on POSIX, msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
 # Import plugins to trigger registration
 import repository_scanner  # noqa: F401
 import fallback_scanner  # noqa: F401
 
-# Import additional plugins from plugins directory
-import sys
-plugins_path = Path(__file__).parent.parent / 'plugins'
-if plugins_path.exists():
-    sys.path.insert(0, str(plugins_path))
+
+@functools.lru_cache(maxsize=1)
+def load_plugins() -> bool:
+    """
+    Import the plugins directory's scanners so they register, once per
+    process (later calls do not touch sys.path or the import system).
+    Returns whether the plugins directory was found.
+    """
+    plugins_path = Path(__file__).parent.parent / 'plugins'
+    if not plugins_path.exists():
+        return False
+    if str(plugins_path) not in sys.path:
+        sys.path.insert(0, str(plugins_path))
     try:
         import media  # noqa: F401
         import documents  # noqa: F401
@@ -32,6 +69,11 @@ if plugins_path.exists():
         import fallback as fallback_plugin  # noqa: F401
     except ImportError:
         pass  # Plugins not available
+    return True
+
+
+# Import additional plugins from plugins directory
+load_plugins()
 
 
 def load_collection_config(collection_path: Path) -> Dict[str, Any]:
@@ -50,8 +92,7 @@ def load_collection_config(collection_path: Path) -> Dict[str, Any]:
             f"Run analyzer first to create configuration."
         )
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_cached(config_path)
     
     # Ensure schedule configuration exists with defaults
     if 'schedule' not in config:
@@ -96,95 +137,447 @@ def get_workflow_config_from_collection(collection_path: Path) -> Dict[str, Any]
     return workflow_config
 
 
+# libyaml-backed loader when available (5-10x faster on large indexes)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Files above this size are parsed through a memory map instead of one bytes copy
+YAML_MMAP_THRESHOLD = 50 * 1024 * 1024
+
+
+def load_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML file from its raw bytes.
+
+    The parser detects the encoding and decodes UTF-8 itself (in C with
+    libyaml) instead of going through a Python text-mode stream.
+    """
+    path = Path(path)
+    if path.stat().st_size > YAML_MMAP_THRESHOLD:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=SafeLoader)
+    return yaml.load(path.read_bytes(), Loader=SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # Keyed by file version: an edited file gets a new entry
+    return load_yaml_file(Path(path_str))
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """
+    Parse a YAML file once per version (mtime, size) in this process.
+
+    Pipeline stages and the web backend re-read the same collection.yaml
+    and index; an unchanged file is deep-copied from the cache (an order
+    of magnitude faster than parsing) so callers may mutate the result.
+    """
+    stat = Path(path).stat()
+    return copy.deepcopy(_load_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def invalidate_yaml_cache():
+    """Drop cached parses (after writing a file, in case its mtime did not move)."""
+    _load_yaml_cached.cache_clear()
+
+
+# Safe YAML dumper, libyaml-backed when available. Metadata values the safe
+# representer does not know (e.g. EXIF rationals) are written as strings.
+_BaseDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+class IndexDumper(_BaseDumper):
+    """YAML dumper for collection-index.yaml"""
+
+
+IndexDumper.add_multi_representer(object, lambda dumper, value: dumper.represent_str(str(value)))
+
+
+# CollectionItem fields written as top-level index keys, in file order
+INDEX_FIELDS = (
+    'short_name', 'type', 'size', 'created', 'modified',
+    'accessed', 'path', 'description', 'category'
+)
+_get_index_fields = operator.attrgetter(*INDEX_FIELDS)
+
+# Index keys that map to CollectionItem fields; any other key is metadata
+_STANDARD_FIELDS = frozenset(INDEX_FIELDS)
+
+# Keys every index entry must have, in CollectionItem field order
+_get_required_fields = operator.itemgetter(
+    'short_name', 'type', 'size', 'created', 'modified', 'accessed', 'path'
+)
+
+
+def get_deltas_path(index_path: Path) -> Path:
+    """Path of the append-only description log next to the index (collection-index.deltas.jsonl)"""
+    return index_path.with_name(f"{index_path.stem}.deltas.jsonl")
+
+
+def _dump_index_json(document: Dict[str, Any]) -> bytes:
+    """Serialize the index document for its JSON sidecar (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(document)
+    return json.dumps(document, ensure_ascii=False).encode('utf-8')
+
+
+# Scalars JSON and YAML both load back as the same value and type
+_JSON_SCALARS = (str, int, bool, type(None))
+
+
+def _is_json_native(value: Any) -> bool:
+    """
+    Whether value survives a JSON round trip unchanged. Dates, non-string
+    keys, tuples, non-finite floats and other objects the YAML index keeps
+    (or writes as strings) would come back from the sidecar as something else.
+    """
+    kind = type(value)
+    if kind is dict:
+        return all(type(key) is str and _is_json_native(item) for key, item in value.items())
+    if kind is list:
+        return all(_is_json_native(item) for item in value)
+    if kind is float:
+        return math.isfinite(value)
+    return kind in _JSON_SCALARS
+
+
+# Parses the sidecar's raw bytes
+_load_index_json = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def get_index_sidecar_path(index_path: Path) -> Path:
+    """Path of the JSON copy of the index written next to it (collection-index.yaml.json)"""
+    return index_path.with_name(f"{index_path.name}.json")
+
+
+def append_index_delta(index_path: Path, item: CollectionItem):
+    """
+    Record one item's description/category in the deltas log.
+
+    Incremental saves append one line instead of rewriting the whole index;
+    load_index replays the log and save_index folds it back into the YAML.
+    """
+    with open(get_deltas_path(index_path), 'a', encoding='utf-8') as f:
+        f.write(_delta_line(item))
+
+
+def _delta_line(item: CollectionItem) -> str:
+    """One deltas-log line for an item"""
+    record = {'path': item.path, 'description': item.description, 'category': item.category}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record).decode() + '\n'
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+class IndexDeltaWriter:
+    """
+    save_callback for describe_collection that batches deltas-log appends.
+
+    Lines are buffered and written at most every `interval` seconds or
+    `batch_size` items, plus on flush(). Descriptions still buffered when a
+    run dies are not lost work: their LLM replies are in the response cache.
+    Every `fsync_every` writes the log is also synced to disk, bounding what
+    a power loss can take without an fsync per batch.
+    """
+
+    def __init__(self, index_path: Path, interval: float = 5.0, batch_size: int = 50, fsync_every: int = 10):
+        self.deltas_path = get_deltas_path(index_path)
+        self.interval = interval
+        self.batch_size = batch_size
+        self.fsync_every = fsync_every
+        self._lines: list[str] = []
+        self._last_flush = time.monotonic()
+        self._writes = 0
+
+    def __call__(self, item: CollectionItem):
+        self._lines.append(_delta_line(item))
+        if len(self._lines) >= self.batch_size or time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """Append buffered lines to the deltas log."""
+        if self._lines:
+            with open(self.deltas_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(self._lines))
+                self._writes += 1
+                if self._writes % self.fsync_every == 0:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._lines.clear()
+        self._last_flush = time.monotonic()
+
+
+@contextmanager
+def index_lock(index_dir: Path):
+    """
+    Hold an exclusive lock on the collection index while writing it.
+
+    Uses an advisory lock on .collection/.index.lock; a second run (a
+    scheduled update overlapping a manual one) waits until the first has
+    saved its index. The lock is released by the OS if the process dies.
+    """
+    index_dir.mkdir(parents=True, exist_ok=True)
+    with open(index_dir / '.index.lock', 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            # msvcrt locks a byte range; LK_LOCK retries for ~10s, so loop until it succeeds
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_index_deltas(index_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Records in the deltas log by item path (later lines win)"""
+    deltas_path = get_deltas_path(index_path)
+    if not deltas_path.exists():
+        return {}
+
+    deltas = {}
+    # Lines are parsed straight from bytes (both parsers take UTF-8 bytes)
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with open(deltas_path, 'rb') as f:
+        for line in f:
+            try:
+                record = loads(line)
+            except ValueError:
+                continue  # Torn final line from an interrupted run
+            deltas[record['path']] = record
+    return deltas
+
+
+def apply_index_deltas(items: list[CollectionItem], index_path: Path) -> int:
+    """Replay the deltas log onto items (later lines win). Returns number of items updated."""
+    deltas = _read_index_deltas(index_path)
+    if not deltas:
+        return 0
+
+    updated = 0
+    for item in items:
+        record = deltas.get(item.path)
+        if record:
+            item.description = record['description']
+            item.category = record['category']
+            updated += 1
+
+    return updated
+
+
+@timed("save_index")
 def save_index(items: list[CollectionItem], index_path: Path, collection_overview: Optional[str] = None):
     """Save items to collection-index.yaml with optional collection overview"""
     # Convert items to dictionaries
     items_data = []
     for item in items:
-        item_dict = {
-            'short_name': item.short_name,
-            'type': item.type,
-            'size': item.size,
-            'created': item.created,
-            'modified': item.modified,
-            'accessed': item.accessed,
-            'path': item.path,
-            'description': item.description,
-            'category': item.category,
-        }
+        item_dict = dict(zip(INDEX_FIELDS, _get_index_fields(item)))
         # Add metadata fields (flattened)
         if item.metadata:
             item_dict.update(item.metadata)
 
         items_data.append(item_dict)
 
-    # Create the complete document structure
-    if collection_overview:
-        # Save as a document with collection_overview and items
-        document = {
-            'collection_overview': collection_overview,
-            'items': items_data
-        }
-    else:
-        # Save as direct array for backward compatibility
-        document = items_data
+    # One document shape, with or without an overview (load_index still reads old bare lists)
+    document = {
+        'collection_overview': collection_overview,
+        'items': items_data
+    }
 
-    with open(index_path, 'w', encoding='utf-8') as f:
-        yaml.dump(document, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Serialize in one pass before opening the file, so a dump error cannot truncate the index
+    text = yaml.dump(document, Dumper=IndexDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
+    # Write a temp file and rename it over the index: a crash leaves the old or new index, never half of one
+    tmp_path = index_path.with_name(f".{index_path.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    invalidate_yaml_cache()
+
+    # JSON copy for load_index to read instead of the YAML (which stays the source of truth).
+    # Written after the YAML, so it is only ever newer than the index it mirrors.
+    # Only written when it loads back identically; otherwise load_index reads the YAML.
+    sidecar_path = get_index_sidecar_path(index_path)
+    sidecar_tmp_path = sidecar_path.with_name(f".{sidecar_path.name}.tmp")
+    try:
+        if not _is_json_native(document):
+            sidecar_path.unlink(missing_ok=True)
+        else:
+            with open(sidecar_tmp_path, 'wb') as f:
+                f.write(_dump_index_json(document))
+            os.replace(sidecar_tmp_path, sidecar_path)
+    except (OSError, TypeError, ValueError):
+        # A stale sidecar is older than the new YAML and is ignored by load_index
+        sidecar_tmp_path.unlink(missing_ok=True)
 
-def load_index(index_path: Path) -> tuple[list[CollectionItem], Optional[str]]:
-    """Load items from collection-index.yaml, returning items and collection overview"""
-    if not index_path.exists():
-        return [], None
+    # The index now holds every delta
+    get_deltas_path(index_path).unlink(missing_ok=True)
+
+
+def item_fingerprint(item: CollectionItem) -> str:
+    """
+    Location-independent identity of an item: size, mtime, name, type and
+    scanner metadata. Moving an item keeps all of these, so its fingerprint
+    finds its old index entry under a new path.
+    """
+    metadata = json.dumps(item.metadata, sort_keys=True, default=str)
+    key = f"{item.size}|{item.modified}|{item.short_name}|{item.type}|{metadata}"
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def carry_over_descriptions(items: list[CollectionItem], existing_items: list[CollectionItem]) -> int:
+    """
+    Copy description/category onto undescribed items from existing index
+    entries with the same fingerprint, so moved items skip the describer.
+    Returns the number of items filled in.
+    """
+    by_fingerprint = {item_fingerprint(item): item for item in existing_items if item.description}
+    if not by_fingerprint:
+        return 0
+
+    carried = 0
+    for item in items:
+        if not item.description:
+            match = by_fingerprint.get(item_fingerprint(item))
+            if match is not None:
+                item.description = match.description
+                item.category = match.category
+                carried += 1
+    return carried
+
+
+# Fingerprint of the last render's inputs, next to the index
+RENDER_HASH_NAME = '.render-hash'
+
+
+def render_fingerprint(
+    items: list[CollectionItem],
+    collection_name: str,
+    collection_type: str,
+    collection_overview: Optional[str]
+) -> str:
+    """
+    Hash of everything Collection.md and Collection.html are rendered from:
+    collection name, type and overview, every item's index fields and
+    metadata, and the renderer's own source version.
+    """
+    import readme_generator
+
+    h = hashlib.blake2b(digest_size=16)
+    renderer = Path(readme_generator.__file__).stat()
+    h.update(json.dumps(
+        [collection_name, collection_type, collection_overview, renderer.st_mtime_ns, renderer.st_size]
+    ).encode('utf-8'))
+    for item in items:
+        h.update(json.dumps(
+            [_get_index_fields(item), item.metadata], sort_keys=True, default=str
+        ).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _load_index_document(index_path: Path) -> Any:
+    """
+    Parse the index, from its JSON sidecar when that is at least as new as
+    the YAML (JSON parses far faster). A hand-edited YAML is newer than the
+    sidecar, so edits are always picked up.
+    """
+    sidecar_path = get_index_sidecar_path(index_path)
+    try:
+        sidecar = sidecar_path.stat()
+        if sidecar.st_size > 0 and sidecar.st_mtime_ns >= index_path.stat().st_mtime_ns:
+            return _load_index_json(sidecar_path.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing, unreadable or corrupt: fall back to the YAML
+    return load_yaml_cached(index_path)
 
-    with open(index_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f) or []
 
+def _split_index_document(data: Any) -> tuple[Optional[str], list]:
+    """Collection overview and raw item entries of a parsed index document"""
     # Handle both formats: new format (dict with collection_overview) and old format (direct list)
-    collection_overview = None
-    items_data = []
-    
     if isinstance(data, dict):
         # New format: document with collection_overview and items
-        collection_overview = data.get('collection_overview')
-        items_data = data.get('items', [])
-    elif isinstance(data, list):
+        return data.get('collection_overview'), data.get('items', [])
+    if isinstance(data, list):
         # Old format: direct array of items
-        items_data = data
-    else:
-        # Fallback: treat as empty
-        items_data = []
+        return None, data
+    # Fallback: treat as empty
+    return None, []
 
-    # Convert to CollectionItem objects
-    items = []
-    for item_data in items_data:
-        # Extract standard fields
-        standard_fields = {
-            'short_name', 'type', 'size', 'created', 'modified',
-            'accessed', 'path', 'description', 'category'
-        }
 
-        # Everything else goes to metadata
-        metadata = {k: v for k, v in item_data.items() if k not in standard_fields}
+def _index_items(items_data: list, deltas: Dict[str, Dict[str, Any]]) -> Iterator[CollectionItem]:
+    """Build CollectionItems from raw index entries one at a time, with deltas applied"""
+    for item_data in items_data:
+        # Everything but the standard fields goes to metadata, in file order
+        metadata = {k: v for k, v in item_data.items() if k not in _STANDARD_FIELDS}
+        get = item_data.get
 
+        # Positional: required fields, description, category, metadata
         item = CollectionItem(
-            short_name=item_data['short_name'],
-            type=item_data['type'],
-            size=item_data['size'],
-            created=item_data['created'],
-            modified=item_data['modified'],
-            accessed=item_data['accessed'],
-            path=item_data['path'],
-            description=item_data.get('description'),
-            category=item_data.get('category'),
-            metadata=metadata
+            *_get_required_fields(item_data), get('description'), get('category'), metadata
         )
-        items.append(item)
+
+        # Recover descriptions saved incrementally but not yet folded into the YAML
+        record = deltas.get(item.path)
+        if record:
+            item.description = record['description']
+            item.category = record['category']
+
+        yield item
+
+
+def iter_index(index_path: Path) -> Iterator[CollectionItem]:
+    """
+    Yield the items of collection-index.yaml one at a time, deltas applied.
+
+    For consumers that only aggregate over items (counts, stats) and never
+    need them all alive at once; load_index also returns the overview.
+    """
+    if not index_path.exists():
+        return
+    _, items_data = _split_index_document(_load_index_document(index_path) or [])
+    yield from _index_items(items_data, _read_index_deltas(index_path))
+
+
+@timed("load_index")
+def load_index(index_path: Path) -> tuple[list[CollectionItem], Optional[str]]:
+    """Load items from collection-index.yaml, returning items and collection overview"""
+    if not index_path.exists():
+        return [], None
+
+    collection_overview, items_data = _split_index_document(_load_index_document(index_path) or [])
+    items = list(_index_items(items_data, _read_index_deltas(index_path)))
 
     return items, collection_overview
 
 
+# Workflow mode -> (skip_process_new, auto_file) it forces; None keeps the caller's value
+_WORKFLOW_MODES = {
+    'manual': (None, None),      # Respect all skip flags, no automatic processing
+    'scheduled': (True, False),  # Regular indexing, no new content processing
+    'organic': (False, None),    # Full workflow; auto_file/confidence_threshold per collection
+}
+
+# Console stage header rule
+_RULE = "=" * 60
+
+
 def run_full_pipeline(
     collection_path: Path,
     skip_analyze: bool = False,
@@ -193,7 +586,8 @@ def run_full_pipeline(
     skip_readme: bool = False,
     skip_process_new: bool = False,
     force_type: Optional[str] = None,
-    max_workers: int = 5,
+    max_workers: Union[int, str] = 'auto',
+    batch_size: Optional[int] = None,
     auto_file: bool = False,
     confidence_threshold: float = 0.7,
     event_emitter: Optional[EventEmitter] = None,
@@ -210,12 +604,17 @@ def run_full_pipeline(
         skip_readme: Skip README generation stage
         skip_process_new: Skip new content processing stage
         force_type: Force collection type (skip LLM detection)
-        max_workers: Number of concurrent workers for describer
+        max_workers: Number of concurrent workers for describer, or 'auto' to
+            size from llm.concurrency in collection.yaml and the server's slots
+        batch_size: Items described per LLM request; None uses
+            llm.items_per_request from collection.yaml
         auto_file: Automatically move new items with high confidence
         confidence_threshold: Minimum confidence for auto-filing
         event_emitter: Optional event emitter for progress updates
         workflow_mode: Workflow mode - "manual", "scheduled", or "organic"
     """
+    load_plugins()
+
     collection_path = collection_path.resolve()
     index_dir = collection_path / '.collection'
     index_path = index_dir / 'collection-index.yaml'
@@ -223,207 +622,259 @@ def run_full_pipeline(
 
     # Use console emitter if none provided (backward compatibility)
     emitter = event_emitter or create_console_emitter()
+    is_console = event_emitter is None
 
     # Create .collection directory if needed
     index_dir.mkdir(exist_ok=True)
 
-    if not event_emitter:  # Only print header for console mode
+    if is_console:  # Only print header for console mode
         print(f"Collectivist Pipeline")
         print(f"Collection: {collection_path}")
         print(f"Mode: {workflow_mode}")
         print()
 
     # Determine workflow behavior based on mode
-    if workflow_mode == "manual":
-        # Manual mode: respect all skip flags, no automatic processing
-        pass
-    elif workflow_mode == "scheduled":
-        # Scheduled mode: regular indexing, no new content processing
-        skip_process_new = True
-        auto_file = False
-    elif workflow_mode == "organic":
-        # Organic mode: full workflow with intelligent curation
-        skip_process_new = False
-        # auto_file and confidence_threshold can be configured per collection
-
-    # Stage 0: Process New Content (organic workflow)
-    if not skip_process_new:
-        if not event_emitter:  # Console mode
-            print("=" * 60)
-            print("STAGE 0: ORGANIC - New Content Processing")
-            print("=" * 60)
-
-        # Create content processor
-        llm_client = create_client_from_config()
-        processor = ContentProcessor(llm_client, emitter)
-
-        # Process new content
-        results = processor.process_new_content(
-            collection_path,
-            auto_file=auto_file,
-            confidence_threshold=confidence_threshold
-        )
-
-        if not event_emitter and results:  # Console mode
-            auto_filed = sum(1 for r in results if r['auto_filed'])
-            suggestions = sum(1 for r in results if not r['auto_filed'] and not r['error'])
-            print(f"[OK] Processed {len(results)} new items: {auto_filed} auto-filed, {suggestions} suggestions")
-            print()
-
-    # Stage 1: Analyze (create collection.yaml)
-    if not skip_analyze:
-        if not event_emitter:  # Only print stage headers for console mode
-            print("=" * 60)
-            print("STAGE 1: ANALYZER - Collection Type Detection")
-            print("=" * 60)
-
-        llm_client = create_client_from_config()
-        analyzer = CollectionAnalyzer(llm_client, emitter)
-
-        if not config_path.exists():
-            if emitter and not event_emitter:  # Console mode
-                print("No collection.yaml found, creating...")
-            analyzer.create_collection(collection_path, force_type=force_type)
+    skip_process_new_override, auto_file_override = _WORKFLOW_MODES.get(workflow_mode, (None, None))
+    if skip_process_new_override is not None:
+        skip_process_new = skip_process_new_override
+    if auto_file_override is not None:
+        auto_file = auto_file_override
+
+    # One LLM client for every stage that needs one, created on first use
+    llm_client = None
+
+    def get_llm_client():
+        nonlocal llm_client
+        if llm_client is None:
+            llm_client = create_client_from_config()
+        return llm_client
+
+    # One run at a time moves items and writes the index (e.g. a scheduled
+    # run overlapping a manual one)
+    with index_lock(index_dir):
+        # Parse the existing index in the background while stages 0 and 1 wait on the LLM
+        index_loader = ThreadPoolExecutor(max_workers=1)
+        existing_index = index_loader.submit(load_index, index_path)
+        index_loader.shutdown(wait=False)
+
+        # Stage 0: Process New Content (organic workflow)
+        if not skip_process_new:
+            with stage_timer("process_new"):
+                if is_console:
+                    print(_RULE)
+                    print("STAGE 0: ORGANIC - New Content Processing")
+                    print(_RULE)
+
+                # Create content processor
+                processor = ContentProcessor(get_llm_client(), emitter)
+
+                # Process new content
+                results = processor.process_new_content(
+                    collection_path,
+                    auto_file=auto_file,
+                    confidence_threshold=confidence_threshold
+                )
+
+                if is_console and results:
+                    auto_filed = sum(1 for r in results if r['auto_filed'])
+                    suggestions = sum(1 for r in results if not r['auto_filed'] and not r['error'])
+                    print(f"[OK] Processed {len(results)} new items: {auto_filed} auto-filed, {suggestions} suggestions")
+                    print()
+
+        # Stage 1: Analyze (create collection.yaml)
+        if not skip_analyze:
+            with stage_timer("analyze"):
+                if is_console:  # Only print stage headers for console mode
+                    print(_RULE)
+                    print("STAGE 1: ANALYZER - Collection Type Detection")
+                    print(_RULE)
+
+                analyzer = CollectionAnalyzer(get_llm_client(), emitter)
+
+                if not config_path.exists():
+                    if is_console:
+                        print("No collection.yaml found, creating...")
+                    analyzer.create_collection(collection_path, force_type=force_type)
+                else:
+                    if is_console:
+                        print("[OK] collection.yaml already exists")
+
+                if is_console:
+                    print()
+
+        # Load config
+        config = load_collection_config(collection_path)
+        collection_type = config['collection_type']
+
+        # Get scanner
+        scanner_class = PluginRegistry.get_plugin(collection_type)
+        if not scanner_class:
+            raise ValueError(f"No scanner plugin found for type: {collection_type}")
+
+        scanner = scanner_class()
+
+        # Stage 2: Scan (discover items, extract metadata)
+        if not skip_scan:
+            with stage_timer("scan"):
+                if is_console:
+                    print(_RULE)
+                    print("STAGE 2: SCANNER - Item Discovery & Metadata Extraction")
+                    print(_RULE)
+                    print(f"Scanner: {scanner.get_name()}")
+                    print("Scanning collection...")
+
+                # Existing index, to preserve descriptions/categories. Only items with
+                # something to keep get an entry; scanners look paths up with a {} default.
+                existing_items, existing_overview = existing_index.result()
+                collection_overview = existing_overview
+                preserve_data = {
+                    item.path: {
+                        'description': item.description,
+                        'category': item.category
+                    }
+                    for item in existing_items
+                    if item.description or item.category
+                }
+
+                # Add preserve_data to scanner config
+                scanner_config = config.get('scanner_config', {})
+                scanner_config['preserve_data'] = preserve_data
+                scanner_config['exclude_hidden'] = config.get('exclude_hidden', True)
+
+                # Scan collection
+                items = scanner.scan(collection_path, scanner_config)
+
+                # Items that only moved (e.g. auto-filed in stage 0) keep their descriptions
+                carried = carry_over_descriptions(items, existing_items)
+
+                # Save index (preserve existing overview for now)
+                save_index(items, index_path, existing_overview)
+
+                if is_console:
+                    print(f"[OK] Scanned {len(items)} items")
+                    if carried:
+                        print(f"  Kept descriptions of {carried} moved items")
+                    print(f"  Saved to {index_path}")
+                    print()
         else:
-            if emitter and not event_emitter:  # Console mode
-                print("[OK] collection.yaml already exists")
-
-        if not event_emitter:  # Console mode
-            print()
-
-    # Load config
-    config = load_collection_config(collection_path)
-    collection_type = config['collection_type']
-
-    # Get scanner
-    scanner_class = PluginRegistry.get_plugin(collection_type)
-    if not scanner_class:
-        raise ValueError(f"No scanner plugin found for type: {collection_type}")
-
-    scanner = scanner_class()
-
-    # Stage 2: Scan (discover items, extract metadata)
-    if not skip_scan:
-        if not event_emitter:  # Console mode
-            print("=" * 60)
-            print("STAGE 2: SCANNER - Item Discovery & Metadata Extraction")
-            print("=" * 60)
-            print(f"Scanner: {scanner.get_name()}")
-            print("Scanning collection...")
-
-        # Load existing index to preserve descriptions/categories
-        existing_items, existing_overview = load_index(index_path)
-        preserve_data = {
-            item.path: {
-                'description': item.description,
-                'category': item.category
-            }
-            for item in existing_items
-        }
-
-        # Add preserve_data to scanner config
-        scanner_config = config.get('scanner_config', {})
-        scanner_config['preserve_data'] = preserve_data
-        scanner_config['exclude_hidden'] = config.get('exclude_hidden', True)
-
-        # Scan collection
-        items = scanner.scan(collection_path, scanner_config)
-
-        # Save index (preserve existing overview for now)
-        save_index(items, index_path, existing_overview)
-
-        if not event_emitter:  # Console mode
-            print(f"[OK] Scanned {len(items)} items")
-            print(f"  Saved to {index_path}")
-            print()
-    else:
-        # Load existing index
-        items, collection_overview = load_index(index_path)
-
-    # Stage 3: Describe (LLM description generation)
-    if not skip_describe:
-        if not event_emitter:  # Console mode
-            print("=" * 60)
-            print("STAGE 3: DESCRIBER - LLM Description Generation")
-            print("=" * 60)
-
-        # Create LLM client and test connection
-        llm_client = create_client_from_config()
-
-        if not event_emitter:  # Console mode
-            print("Testing LLM connection...")
-        if not test_llm_connection(llm_client):
-            error_msg = "Cannot reach LLM endpoint - Configure LLM_PROVIDER in .env file"
-            if emitter:
-                emitter.error(error_msg)
-            else:
-                print(f"[X] FATAL: {error_msg}")
-            sys.exit(1)
-
-        if not event_emitter:  # Console mode
-            print("[OK] LLM connection OK\n")
-
-        # Create describer
-        describer = CollectionDescriber(llm_client, scanner, max_workers, emitter)
-
-        # Define save callback for incremental saves (preserve existing overview during incremental saves)
-        def save_callback(updated_items):
-            save_index(updated_items, index_path, collection_overview)
+            # Existing index
+            items, collection_overview = existing_index.result()
+
+        # Stage 3: Describe (LLM description generation)
+        if not skip_describe:
+            with stage_timer("describe"):
+                if is_console:
+                    print(_RULE)
+                    print("STAGE 3: DESCRIBER - LLM Description Generation")
+                    print(_RULE)
+
+                # Test the LLM connection (the client may be warm from stages 0 and 1)
+                llm_client = get_llm_client()
+
+                if is_console:
+                    print("Testing LLM connection...")
+                if not test_llm_connection(llm_client):
+                    error_msg = "Cannot reach LLM endpoint - Configure LLM_PROVIDER in .env file"
+                    if emitter:
+                        emitter.error(error_msg)
+                    else:
+                        print(f"[X] FATAL: {error_msg}")
+                    sys.exit(1)
+
+                if is_console:
+                    print("[OK] LLM connection OK\n")
+
+                max_workers, max_concurrency = resolve_max_workers(max_workers, llm_client, config)
+
+                # Create describer (description cache lives next to the index)
+                describer = CollectionDescriber(
+                    llm_client, scanner, max_workers, emitter,
+                    cache_dir=index_dir / '.llm_cache',
+                    semantic_cache_dir=index_dir,
+                    items_per_request=batch_size or items_per_request_from_config(config),
+                    semantic_threshold=semantic_threshold_from_config(config),
+                    max_concurrency=max_concurrency
+                )
+
+                # Incremental saves append to the deltas log (batched) instead of rewriting the index
+                save_callback = IndexDeltaWriter(index_path)
+
+                # Generate descriptions and collection overview
+                try:
+                    items, new_overview = describer.describe_collection(items, save_callback=save_callback)
+                finally:
+                    save_callback.flush()
+    
+                # Update collection overview if we got a new one
+                if new_overview:
+                    collection_overview = new_overview
 
-        # Generate descriptions and collection overview
-        items, new_overview = describer.describe_collection(items, save_callback=save_callback)
-        
-        # Update collection overview if we got a new one
-        if new_overview:
-            collection_overview = new_overview
-            # Final save with the new overview
-            save_index(items, index_path, collection_overview)
+                # Final save folds the deltas and overview into the index
+                save_index(items, index_path, collection_overview)
 
-        if not event_emitter:  # Console mode
-            print()
+                if is_console:
+                    print()
 
     # Stage 4: README Generation
     if not skip_readme:
-        if not event_emitter:  # Console mode
-            print("=" * 60)
-            print("STAGE 4: README GENERATOR - Documentation Generation")
-            print("=" * 60)
-
-        from readme_generator import generate_collection, generate_html_collection
-
-        # Generate markdown documentation
-        readme_path = collection_path / 'Collection.md'
-        generate_collection(
-            items=items,
-            collection_name=config['name'],
-            collection_type=collection_type,
-            output_path=readme_path,
-            collection_overview=collection_overview,
-            event_emitter=emitter
-        )
-
-        # Generate HTML index
-        html_path = collection_path / 'Collection.html'
-        generate_html_collection(
-            items=items,
-            collection_name=config['name'],
-            collection_type=collection_type,
-            output_path=html_path,
-            collection_overview=collection_overview,
-            event_emitter=emitter
-        )
-
-        if not event_emitter:  # Console mode
-            print()
+        with stage_timer("render"):
+            if is_console:
+                print(_RULE)
+                print("STAGE 4: README GENERATOR - Documentation Generation")
+                print(_RULE)
+
+            from readme_generator import generate_collection, generate_html_collection
+
+            readme_path = collection_path / 'Collection.md'
+            html_path = collection_path / 'Collection.html'
+
+            # Nothing to re-render when the inputs match the last render and its outputs still exist
+            render_hash_path = index_dir / RENDER_HASH_NAME
+            render_hash = render_fingerprint(items, config['name'], collection_type, collection_overview)
+            try:
+                last_render_hash = render_hash_path.read_text(encoding='utf-8').strip()
+            except OSError:
+                last_render_hash = None
+
+            if last_render_hash == render_hash and readme_path.exists() and html_path.exists():
+                if not is_console:
+                    emitter.info("Collection unchanged since last render, skipping Collection.md/.html")
+                else:
+                    print("[OK] Collection unchanged since last render, skipping")
+            else:
+                # Markdown documentation and HTML index only read items: render both at once
+                render_args = dict(
+                    items=items,
+                    collection_name=config['name'],
+                    collection_type=collection_type,
+                    collection_overview=collection_overview,
+                    event_emitter=emitter
+                )
+                with ThreadPoolExecutor(max_workers=2, thread_name_prefix="render") as pool:
+                    renders = [
+                        pool.submit(generate_collection, output_path=readme_path, **render_args),
+                        pool.submit(generate_html_collection, output_path=html_path, **render_args)
+                    ]
+                for render in renders:
+                    render.result()
+
+                render_hash_path.write_text(render_hash + '\n', encoding='utf-8')
+
+            if is_console:
+                print()
 
     # Final summary
-    if not event_emitter:  # Console mode
-        print("=" * 60)
+    if is_console:
+        print(_RULE)
         print("PIPELINE COMPLETE")
-        print("=" * 60)
+        print(_RULE)
+        described = categorized = 0
+        for item in items:
+            described += bool(item.description)
+            categorized += bool(item.category)
         print(f"Total items: {len(items)}")
-        print(f"Described: {sum(1 for item in items if item.description)}")
-        print(f"Categorized: {sum(1 for item in items if item.category)}")
+        print(f"Described: {described}")
+        print(f"Categorized: {categorized}")
         print()
 
 
@@ -466,9 +917,14 @@ def main():
     )
     parser.add_argument(
         '--max-workers',
-        type=int,
-        default=5,
-        help='Number of concurrent workers for describer (default: 5)'
+        type=max_workers_arg,
+        default='auto',
+        help='Number of concurrent workers for describer, or "auto" to match the LLM endpoint (default: auto)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=batch_size_arg,
+        help='Items described per LLM request (default: llm.items_per_request in collection.yaml, else 1)'
     )
     parser.add_argument(
         '--skip-process-new',
@@ -493,9 +949,17 @@ def main():
         default='manual',
         help='Workflow mode: manual (default), scheduled, or organic'
     )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='Serve Prometheus metrics on this port while the pipeline runs'
+    )
 
     args = parser.parse_args()
 
+    if args.metrics_port:
+        start_exporter(args.metrics_port)
+
     try:
         run_full_pipeline(
             collection_path=Path(args.collection_path),
@@ -506,6 +970,7 @@ def main():
             skip_process_new=args.skip_process_new,
             force_type=args.force_type,
             max_workers=args.max_workers,
+            batch_size=args.batch_size,
             auto_file=args.auto_file,
             confidence_threshold=args.confidence_threshold,
             workflow_mode=args.workflow_mode
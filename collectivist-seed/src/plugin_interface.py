@@ -10,11 +10,12 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionItem:
     """
     Standardized item representation across all collection types.
     Plugins populate this structure with domain-specific metadata.
+    Slotted: no per-instance __dict__, so large collections stay compact.
     """
     # Core fields (required)
     short_name: str  # Unique identifier within collection
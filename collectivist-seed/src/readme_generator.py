@@ -6,11 +6,14 @@ Collection Generator - Universal markdown documentation from collection index
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from plugin_interface import CollectionItem
 from events import EventEmitter, EventStage
 
+# Output file buffer: large documents go out in a few big writes
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def format_size(bytes: int) -> str:
     """Format bytes to human-readable size"""
@@ -29,19 +32,27 @@ def format_date(date_str: str) -> str:
     return date_str[:10] if date_str else "unknown"
 
 
-def get_status_emoji(item: CollectionItem) -> str:
-    """Get status emoji from metadata (repository-specific)"""
-    git_status = item.metadata.get('git_status')
+# Git status -> marker shown in the Status column
+STATUS_MAP = {
+    'up_to_date': '[OK]',
+    'updates_available': '[^]',
+    'error': '[!]',
+    'no_remote': '[o]',
+    'not_a_repo': '[O]'
+}
+
 
-    status_map = {
-        'up_to_date': '[OK]',
-        'updates_available': '[^]',
-        'error': '[!]',
-        'no_remote': '[o]',
-        'not_a_repo': '[O]'
-    }
+# Collection.md templates, %-formatted per item. Table rows: (status,) name,
+# description, category, created. Category entries: name, (status,) size, description.
+_REPO_ROW = "| %s | **%s** | %s | %s | %s |\n"
+_ROW = "| **%s** | %s | %s | %s |\n"
+_STATUS_ENTRY = "### %s %s `%s`\n%s\n\n"
+_ENTRY = "### %s `%s`\n%s\n\n"
 
-    return status_map.get(git_status, '')
+
+def get_status_emoji(item: CollectionItem) -> str:
+    """Get status emoji from metadata (repository-specific)"""
+    return STATUS_MAP.get(item.metadata.get('git_status'), '')
 
 
 def generate_html_collection(
@@ -73,31 +84,32 @@ def generate_html_collection(
     if emitter:
         emitter.info("Calculating collection statistics")
     total_items = len(items)
-    total_size = sum(item.size for item in items)
-    described = sum(1 for item in items if item.description)
-    categorized = sum(1 for item in items if item.category)
+
+    # One pass over the items for stats and category groups
+    total_size = 0
+    described = 0
+    categorized = 0
+    git_statuses = Counter()
+    categories = defaultdict(list)
+    for item in items:
+        total_size += item.size
+        if item.description:
+            described += 1
+        if item.category:
+            categorized += 1
+            categories[item.category].append(item)
+        git_statuses[item.metadata.get('git_status')] += 1
 
     # Repository-specific stats (if applicable)
     git_stats = None
     if collection_type == 'repositories':
-        git_repos = sum(1 for item in items if item.metadata.get('git_status') != 'not_a_repo')
-        up_to_date = sum(1 for item in items if item.metadata.get('git_status') == 'up_to_date')
-        updates_avail = sum(1 for item in items if item.metadata.get('git_status') == 'updates_available')
-        errors = sum(1 for item in items if item.metadata.get('git_status') == 'error')
-
         git_stats = {
-            'git_repos': git_repos,
-            'up_to_date': up_to_date,
-            'updates_available': updates_avail,
-            'errors': errors
+            'git_repos': total_items - git_statuses['not_a_repo'],
+            'up_to_date': git_statuses['up_to_date'],
+            'updates_available': git_statuses['updates_available'],
+            'errors': git_statuses['error']
         }
 
-    # Build categories for filtering
-    categories = defaultdict(list)
-    for item in items:
-        if item.category:
-            categories[item.category].append(item)
-
     # Generate HTML content
     html_content = _generate_html_template(
         items=items,
@@ -153,23 +165,44 @@ def generate_collection(
     if emitter:
         emitter.info("Calculating collection statistics")
     total_items = len(items)
-    total_size = sum(item.size for item in items)
-    described = sum(1 for item in items if item.description)
-    categorized = sum(1 for item in items if item.category)
+    is_repos = collection_type == 'repositories'
+
+    # One pass over the items for stats, table rows and category groups
+    total_size = 0
+    described = 0
+    categorized = 0
+    git_statuses = Counter()
+    table_rows = []
+    categories = {}
+    for item in items:
+        total_size += item.size
+        if item.description:
+            described += 1
+        desc = item.description or "_No description_"
+        cat = f"`{item.category}`" if item.category else "—"
+        date = format_date(item.created)
+
+        status = ''
+        if is_repos:
+            git_status = item.metadata.get('git_status')
+            git_statuses[git_status] += 1
+            status = STATUS_MAP.get(git_status, '')
+            table_rows.append(_REPO_ROW % (status, item.short_name, desc, cat, date))
+        else:
+            table_rows.append(_ROW % (item.short_name, desc, cat, date))
+
+        if item.category:
+            categorized += 1
+            categories.setdefault(item.category, []).append((item, status))
 
     # Repository-specific stats (if applicable)
     git_stats = None
-    if collection_type == 'repositories':
-        git_repos = sum(1 for item in items if item.metadata.get('git_status') != 'not_a_repo')
-        up_to_date = sum(1 for item in items if item.metadata.get('git_status') == 'up_to_date')
-        updates_avail = sum(1 for item in items if item.metadata.get('git_status') == 'updates_available')
-        errors = sum(1 for item in items if item.metadata.get('git_status') == 'error')
-
+    if is_repos:
         git_stats = {
-            'git_repos': git_repos,
-            'up_to_date': up_to_date,
-            'updates_available': updates_avail,
-            'errors': errors
+            'git_repos': total_items - git_statuses['not_a_repo'],
+            'up_to_date': git_statuses['up_to_date'],
+            'updates_available': git_statuses['updates_available'],
+            'errors': git_statuses['error']
         }
 
     # Build header
@@ -208,7 +241,7 @@ def generate_collection(
     header_parts.append("## Index\n\n")
 
     # Add legend if repositories
-    if collection_type == 'repositories':
+    if is_repos:
         header_parts.append(
             "**Legend:** [OK] up-to-date | [^] updates available | "
             "[!] error | [o] no remote | [O] not a git repo\n\n"
@@ -216,61 +249,13 @@ def generate_collection(
 
     header = ''.join(header_parts)
 
-    # Build table
-    if emitter:
-        emitter.info("Building item table")
-    table_rows = []
-    for item in items:
-        status = get_status_emoji(item) if collection_type == 'repositories' else ''
-        desc = item.description or "_No description_"
-        cat = f"`{item.category}`" if item.category else "—"
-        date = format_date(item.created)
-
-        if status:
-            row = f"| {status} | **{item.short_name}** | {desc} | {cat} | {date} |"
-        else:
-            row = f"| **{item.short_name}** | {desc} | {cat} | {date} |"
-
-        table_rows.append(row)
-
-    if collection_type == 'repositories':
+    # Table columns
+    if is_repos:
         table_header = "| Status | Name | Description | Category | Created |\n"
-        table_separator = "|--------|------|-------------|----------|---------|"
+        table_separator = "|--------|------|-------------|----------|---------|\n"
     else:
         table_header = "| Name | Description | Category | Created |\n"
-        table_separator = "|------|-------------|----------|---------|"
-
-    table = table_header + table_separator + "\n" + '\n'.join(table_rows) + "\n\n---\n\n"
-
-    # Build category sections
-    if emitter:
-        emitter.info("Building categorized sections")
-    categories = defaultdict(list)
-    for item in items:
-        if item.category:
-            categories[item.category].append(item)
-
-    category_sections = []
-    for category, cat_items in sorted(categories.items()):
-        # Format category name (convert snake_case to Title Case)
-        cat_display = category.replace('_', ' ').title()
-
-        section = f"## {cat_display}\n\n"
-
-        for item in cat_items:
-            status = get_status_emoji(item) if collection_type == 'repositories' else ''
-            size_str = format_size(item.size)
-            desc = item.description or "_No description available_"
-
-            if status:
-                section += f"### {item.short_name} {status} `{size_str}`\n"
-            else:
-                section += f"### {item.short_name} `{size_str}`\n"
-
-            section += f"{desc}\n\n"
-
-        section += "---\n\n"
-        category_sections.append(section)
+        table_separator = "|------|-------------|----------|---------|\n"
 
     # Build footer
     today = datetime.now().strftime("%Y-%m-%d")
@@ -291,14 +276,42 @@ python src/__main__.py render
 **Last generated:** {today}
 """
 
-    # Combine all sections
-    collection_content = header + table + ''.join(category_sections) + footer
-
-    # Save
+    # Sections are written as they are built, never joined into one document string
     if emitter:
         emitter.info(f"Writing Collection.md to {output_path}")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(collection_content)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(header)
+
+        # Table
+        if emitter:
+            emitter.info("Building item table")
+        f.write(table_header)
+        f.write(table_separator)
+        f.writelines(table_rows)
+        f.write("\n---\n\n")
+
+        # Category sections
+        if emitter:
+            emitter.info("Building categorized sections")
+        for category in sorted(categories):
+            # Format category name (convert snake_case to Title Case)
+            cat_display = category.replace('_', ' ').title()
+
+            parts = [f"## {cat_display}\n\n"]
+
+            for item, status in categories[category]:
+                size_str = format_size(item.size)
+                desc = item.description or "_No description available_"
+
+                if status:
+                    parts.append(_STATUS_ENTRY % (item.short_name, status, size_str, desc))
+                else:
+                    parts.append(_ENTRY % (item.short_name, size_str, desc))
+
+            parts.append("---\n\n")
+            f.writelines(parts)
+
+        f.write(footer)
 
     if emitter:
         emitter.complete_stage(f"Collection.md generated at {output_path}")
@@ -1379,8 +1392,8 @@ def _generate_status_filter_html(status_options: List[str]) -> str:
 def main():
     """CLI entry point for standalone Collection.md generation"""
     import sys
-    import yaml
     from pathlib import Path
+    from pipeline import load_index, load_yaml_file
 
     if len(sys.argv) < 2:
         print("Usage: python readme_generator.py <collection_path>")
@@ -1395,8 +1408,7 @@ def main():
         print(f"[X] No collection.yaml found at {config_path}")
         sys.exit(1)
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_file(config_path)
 
     # Load index
     if not index_path.exists():
@@ -1404,7 +1416,6 @@ def main():
         sys.exit(1)
 
     # Load index using the pipeline function to handle collection overview
-    from pipeline import load_index
     items, collection_overview = load_index(index_path)
 
     # Generate Collection.md
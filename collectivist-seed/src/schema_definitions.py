@@ -4,16 +4,18 @@ Collection Schema Definitions
 Defines the schema structure for each collection type with proper status glyphs and categories
 """
 
-from typing import Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Sequence, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class CollectionTypeSchema:
-    """Schema definition for a collection type"""
+    """Schema definition for a collection type (shared singleton, never mutated)"""
     collection_type: str
     status_glyph: str
-    default_categories: List[str]
+    default_categories: Tuple[str, ...]
     scanner_config_defaults: Dict[str, Any]
     description: str
 
@@ -23,7 +25,7 @@ COLLECTION_SCHEMAS = {
     "repositories": CollectionTypeSchema(
         collection_type="repositories",
         status_glyph="✓",
-        default_categories=[
+        default_categories=(
             "phext_hyperdimensional",     # Multi-dimensional text systems
             "ai_llm_agents",             # AI agents and LLM infrastructure
             "terminal_ui",               # Terminal UI frameworks and components
@@ -32,7 +34,7 @@ COLLECTION_SCHEMAS = {
             "esoteric_experimental",     # Experimental and occult systems
             "system_infrastructure",     # System-level networking tools
             "utilities_misc"             # General utilities and miscellaneous
-        ],
+        ),
         scanner_config_defaults={
             "always_pull": {},           # Repos to auto-pull: {repo_name: true}
             "fetch_timeout": 30          # Git fetch timeout in seconds
@@ -43,7 +45,7 @@ COLLECTION_SCHEMAS = {
     "media": CollectionTypeSchema(
         collection_type="media",
         status_glyph="🎵",
-        default_categories=[
+        default_categories=(
             "music_albums",              # Full album collections
             "music_singles",             # Individual tracks
             "video_movies",              # Movie files
@@ -52,7 +54,7 @@ COLLECTION_SCHEMAS = {
             "images_artwork",            # Digital art and graphics
             "audio_podcasts",            # Podcast episodes
             "video_tutorials"            # Educational video content
-        ],
+        ),
         scanner_config_defaults={
             "extract_metadata": True,    # Extract ID3, EXIF, etc.
             "generate_thumbnails": False, # Create preview thumbnails
@@ -68,7 +70,7 @@ COLLECTION_SCHEMAS = {
     "documents": CollectionTypeSchema(
         collection_type="documents",
         status_glyph="📄",
-        default_categories=[
+        default_categories=(
             "research_papers",           # Academic and research documents
             "technical_docs",            # Technical documentation
             "reference_manuals",         # Reference and manual documents
@@ -77,7 +79,7 @@ COLLECTION_SCHEMAS = {
             "personal_notes",            # Personal notes and journals
             "legal_documents",           # Legal and official documents
             "educational_materials"     # Educational and learning materials
-        ],
+        ),
         scanner_config_defaults={
             "extract_text": True,       # Extract text content for search
             "supported_formats": [      # Document types to scan
@@ -91,7 +93,7 @@ COLLECTION_SCHEMAS = {
     "research": CollectionTypeSchema(
         collection_type="research",
         status_glyph="🔬",
-        default_categories=[
+        default_categories=(
             "primary_sources",           # Original research and data
             "literature_review",         # Academic literature and reviews
             "methodology_papers",        # Research methodology documents
@@ -100,7 +102,7 @@ COLLECTION_SCHEMAS = {
             "case_studies",              # Case study documentation
             "experimental_results",     # Experimental data and results
             "meta_analysis"              # Meta-analysis and systematic reviews
-        ],
+        ),
         scanner_config_defaults={
             "extract_citations": True,  # Extract citation metadata
             "track_reading_status": True, # Track read/unread status
@@ -114,7 +116,7 @@ COLLECTION_SCHEMAS = {
     "creative": CollectionTypeSchema(
         collection_type="creative",
         status_glyph="🎨",
-        default_categories=[
+        default_categories=(
             "digital_art",               # Digital artwork and graphics
             "music_production",          # Music creation and production
             "video_projects",            # Video creation and editing
@@ -123,7 +125,7 @@ COLLECTION_SCHEMAS = {
             "photography_shoots",        # Photography project collections
             "mixed_media",               # Multi-media creative projects
             "work_in_progress"           # Ongoing creative work
-        ],
+        ),
         scanner_config_defaults={
             "track_versions": True,      # Track project versions
             "link_assets": True,         # Link related project assets
@@ -138,7 +140,7 @@ COLLECTION_SCHEMAS = {
     "datasets": CollectionTypeSchema(
         collection_type="datasets",
         status_glyph="📊",
-        default_categories=[
+        default_categories=(
             "structured_data",           # CSV, JSON, database exports
             "time_series",               # Time-based data collections
             "text_corpora",              # Text and language datasets
@@ -147,7 +149,7 @@ COLLECTION_SCHEMAS = {
             "scientific_data",           # Scientific measurement data
             "survey_data",               # Survey and questionnaire data
             "experimental_data"          # Experimental results and observations
-        ],
+        ),
         scanner_config_defaults={
             "infer_schema": True,        # Automatically infer data schema
             "sample_size": 100,          # Number of records to sample
@@ -161,7 +163,7 @@ COLLECTION_SCHEMAS = {
     "obsidian": CollectionTypeSchema(
         collection_type="obsidian",
         status_glyph="🧠",
-        default_categories=[
+        default_categories=(
             "knowledge_base",            # Core knowledge, concepts, and foundational information
             "personal_notes",            # Personal thoughts, reflections, and journaling
             "research_notes",            # Research findings, studies, and academic content
@@ -169,7 +171,7 @@ COLLECTION_SCHEMAS = {
             "creative_writing",          # Stories, poems, creative writing, and fiction
             "learning_notes",            # Study notes, tutorials, and learning materials
             "utilities_misc"             # Templates, utilities, and miscellaneous notes
-        ],
+        ),
         scanner_config_defaults={
             "extract_frontmatter": True, # Extract YAML frontmatter
             "extract_tags": True,        # Extract #tags from content
@@ -180,7 +182,73 @@ COLLECTION_SCHEMAS = {
     )
 }
 
+def _freeze(value: Any) -> Any:
+    """Read-only snapshot of a config value: mappings become proxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
+
+_FROZEN_CONTAINERS = (MappingProxyType, tuple)
+
+
+def _thaw(value: Any) -> Any:
+    """Fresh plain dict/list copy of a frozen mapping or tuple; scalars are shared"""
+    if type(value) is MappingProxyType:
+        return {key: _thaw(item) if type(item) in _FROZEN_CONTAINERS else item
+                for key, item in value.items()}
+    return [_thaw(item) if type(item) in _FROZEN_CONTAINERS else item for item in value]
+
+
+# Scanner config defaults frozen per type, so generated configs never alias them
+_FROZEN_DEFAULTS = {
+    collection_type: _freeze(schema.scanner_config_defaults)
+    for collection_type, schema in COLLECTION_SCHEMAS.items()
+}
+
+_TYPE_LIST = tuple(COLLECTION_SCHEMAS)
+
+# Schedule block of every generated collection.yaml
+_SCHEDULE_DEFAULT = {
+    'enabled': False,
+    'interval_days': 7,
+    'operations': ('scan', 'describe', 'render'),
+    'auto_file': False,
+    'confidence_threshold': 0.8
+}
+
+
+def _build_extension_index() -> Tuple[Dict[str, str], FrozenSet[str]]:
+    """
+    Reverse index of supported_formats.
+
+    Returns ({ext: collection_type} for extensions only one type lists,
+    frozenset of extensions several types list). A shared extension (.md is
+    documents, research and obsidian) says nothing about which of them a
+    folder is, so it only ever counts as ambiguous evidence.
+    """
+    claims: Dict[str, set] = {}
+    for collection_type, schema in COLLECTION_SCHEMAS.items():
+        formats = schema.scanner_config_defaults.get('supported_formats')
+        if not formats:
+            continue
+        if isinstance(formats, dict):
+            formats = [ext for group in formats.values() for ext in group]
+        for ext in formats:
+            claims.setdefault(ext, set()).add(collection_type)
+
+    unique = {ext: next(iter(types)) for ext, types in claims.items() if len(types) == 1}
+    shared = frozenset(ext for ext, types in claims.items() if len(types) > 1)
+    return unique, shared
+
+
+# File extension -> the one collection type listing it; extensions listed by several types
+EXTENSION_TYPES, SHARED_EXTENSIONS = _build_extension_index()
+
+
+@lru_cache(maxsize=None)
 def get_collection_schema(collection_type: str) -> CollectionTypeSchema:
     """Get schema definition for a collection type"""
     if collection_type not in COLLECTION_SCHEMAS:
@@ -188,9 +256,9 @@ def get_collection_schema(collection_type: str) -> CollectionTypeSchema:
     return COLLECTION_SCHEMAS[collection_type]
 
 
-def list_collection_types() -> List[str]:
-    """List all available collection types"""
-    return list(COLLECTION_SCHEMAS.keys())
+def list_collection_types() -> Sequence[str]:
+    """List all available collection types (shared tuple; copy before mutating)"""
+    return _TYPE_LIST
 
 
 def generate_collection_config(
@@ -222,18 +290,13 @@ def generate_collection_config(
         'status': schema.status_glyph,
         'name': name,
         'path': path,
-        'categories': custom_categories or schema.default_categories,
+        'categories': list(custom_categories or schema.default_categories),
         
         # OPTIONAL FIELDS
         'exclude_hidden': True,
-        'scanner_config': custom_scanner_config or schema.scanner_config_defaults.copy(),
-        'schedule': {
-            'enabled': False,
-            'interval_days': 7,
-            'operations': ['scan', 'describe', 'render'],
-            'auto_file': False,
-            'confidence_threshold': 0.8
-        }
+        'scanner_config': custom_scanner_config or _thaw(_FROZEN_DEFAULTS[collection_type]),
+        # Own copy of the operations list, so configs never share it with the template
+        'schedule': dict(_SCHEDULE_DEFAULT, operations=list(_SCHEDULE_DEFAULT['operations']))
     }
     
     return config
\ No newline at end of file
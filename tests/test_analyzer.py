@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the collection analyzer
+Tests local (no-LLM) collection type detection and the detection cache
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Import the portable package's modules directly
+src_dir = Path(__file__).parent.parent / "collectivist-portable" / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analyzer import DETECTION_CACHE_NAME, CollectionAnalyzer
+
+
+def make_inspection(file_types, has_git_repos=False, total_dirs=0):
+    """Minimal inspection dict as produced by inspect_directory"""
+    return {
+        'file_types': file_types,
+        'has_git_repos': has_git_repos,
+        'total_dirs': total_dirs,
+    }
+
+
+class TestExtensionScoring(unittest.TestCase):
+    """Test the extension scoring that short-circuits LLM detection"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = CollectionAnalyzer(None, detection_cache_path=Path(self.temp_dir) / "type-detect.json")
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_markdown_docs_folder_is_not_obsidian(self):
+        """Test a plain docs folder of shared extensions is left to the LLM"""
+        for file_types in ({'.md': 7, '.pdf': 1}, {'.md': 20}):
+            self.assertIsNone(self.analyzer._score_collection_type(make_inspection(file_types)))
+
+    def test_unique_extensions_decide_locally(self):
+        """Test extensions listed by a single type settle detection without the LLM"""
+        self.assertEqual(
+            self.analyzer._score_collection_type(make_inspection({'.csv': 8, '.parquet': 2})),
+            'datasets'
+        )
+        # Shared extensions count against the winner
+        self.assertIsNone(self.analyzer._score_collection_type(make_inspection({'.csv': 6, '.md': 4})))
+
+    def test_git_repos_decide_repositories(self):
+        """Test sampled git repositories settle detection as repositories"""
+        self.assertEqual(
+            self.analyzer._score_collection_type(make_inspection({}, has_git_repos=True, total_dirs=8)),
+            'repositories'
+        )
+
+
+
+class StubLLM:
+    """Answers every detection prompt with a fixed type"""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def chat(self, messages, **kwargs):
+        self.calls += 1
+        return self.reply
+
+
+class TestDetectionCache(unittest.TestCase):
+    """Test LLM-detected types are cached inside the analyzed collection"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection = Path(self.temp_dir) / "notes"
+        self.collection.mkdir()
+        for name in ("intro.md", "usage.md", "faq.md"):
+            (self.collection / name).write_text("# Notes\n", encoding="utf-8")
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_lives_in_collection(self):
+        """Test the detection cache is written to the collection's .collection/ and reused"""
+        llm = StubLLM("documents")
+        analyzer = CollectionAnalyzer(llm)
+        inspection = analyzer.inspect_directory(self.collection)
+
+        self.assertEqual(analyzer._detect_collection_type(inspection), "documents")
+        self.assertTrue((self.collection / ".collection" / DETECTION_CACHE_NAME).exists())
+
+        # A fresh analyzer finds the cached answer without asking the LLM again
+        fresh = CollectionAnalyzer(llm)
+        self.assertEqual(fresh._detect_collection_type(fresh.inspect_directory(self.collection)), "documents")
+        self.assertEqual(llm.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
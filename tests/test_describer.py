@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the collection describer
+Tests LLM reply parsing, adaptive concurrency, the description cache and describe_collection
+"""
+
+import contextlib
+import io
+import json
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Import the portable package's modules directly
+src_dir = Path(__file__).parent.parent / "collectivist-portable" / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from describer import (
+    DEFAULT_MAX_WORKERS, AdaptiveConcurrency, CollectionDescriber, DescriptionCache, resolve_max_workers
+)
+from fallback_scanner import FallbackScanner
+from llm import LLMClient, ProviderType
+from plugin_interface import CollectionItem
+
+
+def make_describer(llm_client=None, **kwargs):
+    """Describer over the fallback scanner, without on-disk caches"""
+    return CollectionDescriber(llm_client, FallbackScanner(), use_cache=False, **kwargs)
+
+
+class TestParseResponse(unittest.TestCase):
+    """Test parsing of single-item description replies"""
+
+    def setUp(self):
+        self.describer = make_describer()
+        self.context = self.describer.make_context([])
+
+    def test_reply_cut_at_stop_sequence(self):
+        """Test a reply whose closing brace was eaten by the stop sequence parses"""
+        result = self.describer._parse_response(
+            '{"description": "Config uses {name} placeholders", "category": "misc"', self.context
+        )
+
+        self.assertEqual(result['description'], "Config uses {name} placeholders")
+
+    def test_truncated_reply_is_not_stored(self):
+        """Test a JSON reply cut off mid-string is rejected, not stored as text"""
+        for response in ('{"description": "Config uses {name', '{"description": "A long rambling desc'):
+            self.assertIsNone(self.describer._parse_response(response, self.context))
+
+    def test_stop_sequence_ignores_braces_in_description(self):
+        """Test the stop sequence cannot match a brace inside the description"""
+        stop = self.describer._request_options(self.context)['stop']
+
+        self.assertFalse(any(s in '{"description": "Uses {name} and }"' for s in stop))
+
+    def test_plain_text_reply_is_kept(self):
+        """Test an unconstrained plain-text reply still becomes the description"""
+        result = self.describer._parse_response("A small CLI tool", self.context)
+
+        self.assertEqual(result['description'], "A small CLI tool")
+        self.assertEqual(result['category'], self.context.fallback_category)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    """Test sizing and growth of the in-flight request window"""
+
+    def test_auto_workers_grow_under_low_latency(self):
+        """Test 'auto' with unknown capacity starts at the default and grows past it"""
+        max_workers, max_concurrency = resolve_max_workers('auto', None, {})
+        describer = make_describer(max_workers=max_workers, max_concurrency=max_concurrency)
+        concurrency = describer.concurrency
+        self.assertEqual(concurrency.limit, DEFAULT_MAX_WORKERS)
+
+        for _ in range(200):
+            concurrency.record(0.2)
+
+        self.assertGreater(concurrency.limit, DEFAULT_MAX_WORKERS)
+        self.assertLessEqual(concurrency.limit, AdaptiveConcurrency.max_limit)
+
+    def test_explicit_workers_cap_growth(self):
+        """Test an explicit --max-workers is the ceiling"""
+        self.assertEqual(resolve_max_workers(8, None, {}), (8, 8))
+        concurrency = AdaptiveConcurrency(8, max_limit=8)
+
+        for _ in range(200):
+            concurrency.record(0.2)
+
+        self.assertEqual(concurrency.limit, 8)
+
+    def test_known_capacity_is_the_ceiling(self):
+        """Test llm.concurrency from collection.yaml bounds 'auto'"""
+        self.assertEqual(resolve_max_workers('auto', None, {'llm': {'concurrency': 12}}), (12, 12))
+
+    def test_errors_back_off(self):
+        """Test a failed request halves the window"""
+        concurrency = AdaptiveConcurrency(16)
+        concurrency.record(0.2, ok=False)
+
+        self.assertEqual(concurrency.limit, 8)
+
+
+
+class TestDescriptionCache(unittest.TestCase):
+    """Test descriptions persist in the shared SQLite response store"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_results_persist_across_runs(self):
+        """Test a stored result is found by a later cache on the same directory"""
+        result = {'description': 'A CLI tool', 'category': 'dev_tools'}
+        cache = DescriptionCache(self.temp_dir)
+        key = cache.key_for("prompt", model="m")
+        cache.put(key, result)
+        cache.backend.close()
+
+        self.assertEqual(DescriptionCache(self.temp_dir).get(key), result)
+
+    def test_legacy_store_is_migrated(self):
+        """Test entries written by the old describer-only schema are still served"""
+        conn = sqlite3.connect(self.temp_dir / 'responses.sqlite')
+        conn.execute(
+            "CREATE TABLE responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        conn.execute("INSERT INTO responses VALUES ('k', '{\"description\": \"Old\", \"category\": \"misc\"}', 0)")
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(DescriptionCache(self.temp_dir).get('k'), {'description': 'Old', 'category': 'misc'})
+
+
+
+class FakeLLM(LLMClient):
+    """LLM client answering from a function of the prompt, without a server"""
+
+    def __init__(self, answer):
+        super().__init__(ProviderType.OPENAI, api_key="test")
+        self.answer = answer
+
+    def chat(self, messages, **kwargs):
+        return self.answer(messages[-1].content)
+
+    async def achat(self, messages, **kwargs):
+        return self.chat(messages)
+
+
+class TestDescribeCollection(unittest.TestCase):
+    """Test a describe run over a list of items"""
+
+    def make_item(self, name, description=None):
+        """File item whose content is built from its metadata (the path does not exist)"""
+        return CollectionItem(
+            short_name=name, type='file', size=10, created='2024-01-01T10:00:00',
+            modified='2024-01-02T10:00:00', accessed='2024-01-03T10:00:00',
+            path=f'/nonexistent/{name}', description=description, category=None
+        )
+
+    def test_describes_undescribed_items(self):
+        """Test new descriptions are saved per item and a truncated reply leaves its item undescribed"""
+        category = FallbackScanner().get_categories()[0]
+
+        def answer(prompt):
+            if 'overview' in prompt.lower():
+                return "An overview."
+            if 'cut.txt' in prompt:
+                return '{"description": "Runs out of tok'
+            return json.dumps({"description": "A text file", "category": category})
+
+        items = [self.make_item('a.txt', 'Existing'), self.make_item('b.txt'), self.make_item('cut.txt')]
+        saved = []
+        describer = make_describer(FakeLLM(answer))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            items, overview = describer.describe_collection(items, save_callback=saved.append)
+
+        self.assertEqual([item.description for item in items], ['Existing', 'A text file', None])
+        self.assertEqual([item.short_name for item in saved], ['b.txt'])
+        self.assertEqual(items[1].category, category)
+        self.assertEqual(overview, "An overview.")
+
+
+if __name__ == '__main__':
+    unittest.main()
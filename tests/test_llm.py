@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the LLM client
+Tests streamed response decoding, rate-limit backoff and shared-client retirement
+"""
+
+import io
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+import requests
+
+# Import the portable package's modules directly
+src_dir = Path(__file__).parent.parent / "collectivist-portable" / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from llm import LLMClient, ProviderType, RateLimiter
+
+
+def make_sse_response(body: bytes) -> requests.Response:
+    """Build a streamed response whose Content-Type carries no charset"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/event-stream"
+    response.raw = io.BytesIO(body)
+    # What requests' adapter derives from that header (ISO-8859-1 for text/*)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class TestStreamDecoding(unittest.TestCase):
+    """Test server-sent event parsing"""
+
+    def test_non_ascii_stream_is_decoded_as_utf8(self):
+        """Test SSE text deltas are decoded as UTF-8, not ISO-8859-1"""
+        client = LLMClient(ProviderType.OPENAI, api_key="test")
+        body = (
+            'data: {"choices": [{"delta": {"content": "Café "}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "naïve — 日本"}}]}\n\n'
+            'data: [DONE]\n\n'
+        ).encode("utf-8")
+
+        pieces = list(client._iter_stream(make_sse_response(body)))
+
+        self.assertEqual(''.join(pieces), "Café naïve — 日本")
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test 429 backoff of the rate limiter"""
+
+    def test_burst_of_429s_penalizes_once(self):
+        """Test concurrent 429s from one burst halve the rate only once"""
+        limiter = RateLimiter(rpm=60)
+        for _ in range(10):
+            limiter.penalize()
+
+        self.assertEqual(limiter._penalty_rpm, 30)
+
+    def test_penalty_floor_follows_observed_rate(self):
+        """Test an unconfigured limiter never backs off below a quarter of its recent rate"""
+        limiter = RateLimiter()
+        for _ in range(40):
+            limiter.acquire()
+        limiter.penalize()
+        # Later windows of 429s keep halving, down to the floor
+        for _ in range(5):
+            limiter._last_penalty -= RateLimiter.WINDOW
+            limiter.penalize()
+
+        self.assertEqual(limiter._penalty_rpm, 10)
+
+    def test_retry_after_pauses_admission(self):
+        """Test a Retry-After on a 429 holds back the next request"""
+        limiter = RateLimiter()
+        limiter.penalize(retry_after=30)
+
+        self.assertGreater(limiter._reserve(0), 29)
+
+
+class TestClientRetirement(unittest.TestCase):
+    """Test a replaced shared client waits for its in-flight requests"""
+
+    def test_retire_waits_for_in_flight_requests(self):
+        """Test retire() closes the client only after the last request ends"""
+        client = LLMClient(ProviderType.OPENAI, api_key="test")
+        closed = threading.Event()
+        close = client.close
+
+        def tracking_close():
+            close()
+            closed.set()
+        client.close = tracking_close
+
+        client._begin_request()
+        client.retire()
+        self.assertFalse(closed.is_set())
+
+        client._end_request()
+        self.assertTrue(closed.wait(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pipeline's index storage
+Tests save_index/load_index, the deltas log, the JSON sidecar, moved-item
+description carry-over and the render-hash skip of Stage 4
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+# Import the portable package's modules directly
+src_dir = Path(__file__).parent.parent / "collectivist-portable" / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+import pipeline
+from pipeline import (
+    IndexDeltaWriter, carry_over_descriptions, get_deltas_path, get_index_sidecar_path,
+    invalidate_yaml_cache, load_index, save_index
+)
+from plugin_interface import CollectionItem
+from schema_definitions import generate_collection_config
+
+
+def make_item(name, description=None, category=None, metadata=None, size=100):
+    """Collection item under /collection with fixed timestamps"""
+    return CollectionItem(
+        short_name=name,
+        type='file',
+        size=size,
+        created='2024-01-01T10:00:00',
+        modified='2024-01-02T10:00:00',
+        accessed='2024-01-03T10:00:00',
+        path=f'/collection/{name}',
+        description=description,
+        category=category,
+        metadata=metadata or {}
+    )
+
+
+class IndexTestCase(unittest.TestCase):
+    """Temporary .collection/ directory holding an index"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.index_path = self.temp_dir / 'collection-index.yaml'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        invalidate_yaml_cache()
+
+    def load_from_yaml(self):
+        """load_index with the sidecar out of the way"""
+        get_index_sidecar_path(self.index_path).unlink(missing_ok=True)
+        invalidate_yaml_cache()
+        return load_index(self.index_path)
+
+
+class TestIndexSidecar(IndexTestCase):
+    """Test the JSON sidecar loads exactly what the YAML holds"""
+
+    def test_sidecar_matches_yaml(self):
+        """Test a JSON-native index reloads identically from the sidecar and the YAML"""
+        items = [
+            make_item('a.md', 'Notes', 'personal_notes', {'tags': ['x', 'y'], 'words': 12, 'score': 0.5}),
+            make_item('b.md'),
+        ]
+        save_index(items, self.index_path, "Overview")
+        self.assertTrue(get_index_sidecar_path(self.index_path).exists())
+
+        from_sidecar = load_index(self.index_path)
+
+        self.assertEqual(from_sidecar, self.load_from_yaml())
+        self.assertEqual(from_sidecar, (items, "Overview"))
+
+    def test_non_json_values_skip_sidecar(self):
+        """Test dates and int keys reload unchanged instead of as strings"""
+        metadata = {'frontmatter': {'date': date(2024, 1, 2), 1: 'x'}}
+        save_index([make_item('note.md', metadata=metadata)], self.index_path)
+
+        items, _ = load_index(self.index_path)
+
+        self.assertEqual(items[0].metadata, metadata)
+        self.assertEqual(self.load_from_yaml()[0][0].metadata, metadata)
+
+
+
+class TestIndexDeltas(IndexTestCase):
+    """Test incremental saves through the deltas log"""
+
+    def setUp(self):
+        super().setUp()
+        self.items = [make_item('a.md'), make_item('b.md')]
+        save_index(self.items, self.index_path)
+
+    def write_delta(self, item, description, category):
+        """Record a description the way describe_collection's save_callback does"""
+        item.description, item.category = description, category
+        writer = IndexDeltaWriter(self.index_path)
+        writer(item)
+        writer.flush()
+
+    def test_load_replays_deltas(self):
+        """Test load_index applies logged descriptions and skips a torn last line"""
+        self.write_delta(make_item('a.md'), 'First', 'personal_notes')
+        self.write_delta(make_item('a.md'), 'Second', 'research_notes')
+        with open(get_deltas_path(self.index_path), 'a', encoding='utf-8') as f:
+            f.write('{"path": "/collection/b.md", "descri')
+
+        items, _ = load_index(self.index_path)
+
+        self.assertEqual((items[0].description, items[0].category), ('Second', 'research_notes'))
+        self.assertIsNone(items[1].description)
+
+    def test_save_folds_deltas(self):
+        """Test save_index writes replayed deltas into the index and deletes the log"""
+        self.write_delta(make_item('b.md'), 'Logged', 'personal_notes')
+        items, overview = load_index(self.index_path)
+
+        save_index(items, self.index_path, overview)
+
+        self.assertFalse(get_deltas_path(self.index_path).exists())
+        self.assertEqual(self.load_from_yaml()[0][1].description, 'Logged')
+
+
+class TestCarryOverDescriptions(unittest.TestCase):
+    """Test moved items keep their descriptions"""
+
+    def test_moved_item_keeps_description(self):
+        """Test an item found under a new path takes its old entry's description"""
+        old = make_item('a.md', 'Notes', 'personal_notes', {'words': 12})
+        moved = make_item('a.md', metadata={'words': 12})
+        moved.path = '/collection/archive/a.md'
+        edited = make_item('b.md', metadata={'words': 12}, size=200)
+
+        self.assertEqual(carry_over_descriptions([moved, edited], [old]), 1)
+        self.assertEqual((moved.description, moved.category), ('Notes', 'personal_notes'))
+        self.assertIsNone(edited.description)
+
+
+class TestRenderSkip(unittest.TestCase):
+    """Test Stage 4 re-renders only when its inputs change"""
+
+    def setUp(self):
+        self.collection = Path(tempfile.mkdtemp())
+        for name in ('tool', 'lib'):
+            self.add_repo(name)
+        (self.collection / '.collection').mkdir()
+        config = generate_collection_config('repositories', 'test', str(self.collection))
+        with open(self.collection / '.collection' / 'collection.yaml', 'w', encoding='utf-8') as f:
+            yaml.safe_dump(config, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.collection, ignore_errors=True)
+        invalidate_yaml_cache()
+
+    def add_repo(self, name):
+        """Repository directory whose access time reads will not move (it is an item field)"""
+        repo = self.collection / name
+        repo.mkdir()
+        (repo / 'README.md').write_text(f"# {name}\n", encoding='utf-8')
+        for path in (repo / 'README.md', repo):
+            mtime = path.stat().st_mtime
+            os.utime(path, (mtime + 60, mtime))
+
+    def run_pipeline(self):
+        """Scan and render without the LLM; returns the number of renders"""
+        def render(output_path, **kwargs):
+            output_path.write_text('rendered', encoding='utf-8')
+
+        with patch('readme_generator.generate_collection', side_effect=render) as markdown, \
+                patch('readme_generator.generate_html_collection', side_effect=render) as html, \
+                contextlib.redirect_stdout(io.StringIO()):
+            pipeline.run_full_pipeline(
+                self.collection, skip_analyze=True, skip_describe=True, skip_process_new=True
+            )
+        return markdown.call_count + html.call_count
+
+    def test_unchanged_collection_skips_render(self):
+        """Test a second run over unchanged inputs skips Stage 4's renders"""
+        self.assertEqual(self.run_pipeline(), 2)
+        self.assertEqual(self.run_pipeline(), 0)
+
+    def test_changes_render_again(self):
+        """Test a new item or a missing output re-renders"""
+        self.run_pipeline()
+        self.add_repo('app')
+        self.assertEqual(self.run_pipeline(), 2)
+
+        (self.collection / 'Collection.html').unlink()
+        self.assertEqual(self.run_pipeline(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()